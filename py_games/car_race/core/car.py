@@ -0,0 +1,93 @@
+"""How a car drives, without any display.
+
+A Car is moved one frame at a time by the Controls its driver picks. The
+only chance in it is the random slide, which comes from the random.Random
+it is given, so with a seeded one a drive always goes the same way.
+"""
+
+import dataclasses
+import math
+import random
+
+from core.spline_track import Track
+
+# The car's numbers are per frame, at this many frames a second.
+FPS = 60
+
+# --- Car parameters ---
+MAX_SPEED = 5.0
+ACCELERATION = 0.05
+BRAKING = 0.1
+FRICTION = 0.02
+MAX_STEER = 3.0  # degrees a frame, with the wheel all the way round
+# Above this fraction of MAX_SPEED the tyres start to slide, and steering
+# gets weaker, down to MIN_GRIP at MAX_SPEED.
+SLIDE_SPEED = 0.7
+MIN_GRIP = 0.3
+SLIDE_FACTOR = 0.1  # Increased for more noticeable sliding
+WALL_BOUNCE_FACTOR = -0.3  # Less bounce
+
+
+@dataclasses.dataclass
+class Controls:
+  """What a driver does in one frame."""
+  accelerate: bool = False
+  brake: bool = False
+  steer: float = 0  # from -1 (right) to 1 (left)
+
+
+class Car:
+
+  def __init__(self, x, y, angle):
+    self.x = x
+    self.y = y
+    self.angle = angle  # degrees, anticlockwise from pointing right
+    self.speed = 0
+    self.sliding = False  # Track if the car is currently sliding
+    self.wall_hits = 0
+
+  def grip(self) -> float:
+    """How much of the steering the tyres manage, from MIN_GRIP to 1."""
+    fraction = self.speed / MAX_SPEED
+    if fraction <= SLIDE_SPEED:
+      return 1
+    return 1 - (1 - MIN_GRIP) * (fraction - SLIDE_SPEED) / (1 - SLIDE_SPEED)
+
+  def update(self, controls: Controls, track: Track, rng: random.Random):
+    """Drives the car for one frame."""
+    if controls.accelerate:
+      self.speed += ACCELERATION
+    else:
+      # Only while coasting, or the car could never get near MAX_SPEED.
+      self.speed *= 1 - FRICTION
+    if controls.brake:
+      self.speed -= BRAKING
+    self.speed = max(0, min(self.speed, MAX_SPEED))
+
+    # --- Steering and Sliding ---
+    self.sliding = self.speed > MAX_SPEED * SLIDE_SPEED
+    steer = max(-1, min(controls.steer, 1))
+    self.angle += steer * MAX_STEER * self.grip()
+
+    # Add random slide, scaled by speed
+    self.angle += self.speed * SLIDE_FACTOR * rng.uniform(-1, 1)
+    self.angle %= 360
+
+    radians = math.radians(self.angle)
+    self.x += self.speed * math.cos(radians)
+    self.y -= self.speed * math.sin(radians)
+
+    self.check_wall_collision(track)
+
+  def check_wall_collision(self, track: Track):
+    collision = track.collide(self.x, self.y)
+    if collision:
+      # Back onto the wall, then reflect the heading across the wall's normal.
+      self.x, self.y = collision.x, collision.y
+      reflection_angle = (
+          2 * collision.normal_angle - self.angle + 180
+      )  # +180 to get the actual reflected angle
+      self.angle = reflection_angle % 360
+
+      self.speed *= WALL_BOUNCE_FACTOR
+      self.wall_hits += 1
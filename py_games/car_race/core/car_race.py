@@ -0,0 +1,198 @@
+import functools
+import math
+import random
+from typing import Optional
+from core.car import FPS, Car
+from core.laps import LapCounter
+from core.track import OVAL, OvalTrack
+import pygame
+from driver_strategy import DriverStrategy
+from key_strategy import KeyStrategy
+
+# --- Constants ---
+WIDTH, HEIGHT = 800, 600
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (128, 128, 128)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+TRACK_COLOR = GRAY
+GRASS_COLOR = GREEN
+# One for each car, in order.
+CAR_COLORS = [RED, (0, 0, 255), (255, 255, 0), (255, 0, 255), (0, 255, 255), WHITE, BLACK]
+FONT_SIZE = 24
+
+# --- Car parameters ---
+CAR_SIZE = (15, 30)  # Width, Height
+SPRITE_ANGLES = 360  # headings each car is drawn at, one a degree
+
+
+@functools.lru_cache(maxsize=None)
+def car_rotations(color) -> tuple:
+  """The car drawn at each of SPRITE_ANGLES headings, once, so that
+  driving never has to rotate a surface."""
+  # Drawn pointing right, which is a heading of 0.
+  surface = pygame.Surface(CAR_SIZE[::-1], pygame.SRCALPHA)
+  surface.fill(color)
+  return tuple(pygame.transform.rotate(surface, i * 360 / SPRITE_ANGLES)
+               for i in range(SPRITE_ANGLES))
+
+
+class CarSprite:
+  """Draws a car."""
+
+  def __init__(self, car: Car, color):
+    self.car = car
+    self.rotations = car_rotations(color)
+    self.update()
+
+  def update(self):
+    """Picks the drawing nearest to the car's heading."""
+    self.surface = self.rotations[round(self.car.angle * SPRITE_ANGLES / 360) % SPRITE_ANGLES]
+    self.rect = self.surface.get_rect(center=(int(self.car.x), int(self.car.y)))
+
+  def draw(self, screen):
+    screen.blit(self.surface, self.rect)
+
+
+def draw_track(screen, track):
+  if isinstance(track, OvalTrack):
+    outer_rect = pygame.Rect(0, 0, 2 * track.radius_x, 2 * track.radius_y)
+    outer_rect.center = (track.center_x, track.center_y)
+    pygame.draw.ellipse(screen, TRACK_COLOR, outer_rect)
+
+    inner_rect = pygame.Rect(
+        0, 0, 2 * track.inner_radius_x, 2 * track.inner_radius_y
+    )
+    inner_rect.center = (track.center_x, track.center_y)
+    pygame.draw.ellipse(screen, GRASS_COLOR, inner_rect)
+  else:
+    # A strip of quadrilaterals between the two edges.
+    left, right = track.edges()
+    for i in range(len(left)):
+      pygame.draw.polygon(screen, TRACK_COLOR,
+                          (left[i - 1], left[i], right[i], right[i - 1]))
+  # The start line.
+  pygame.draw.line(screen, WHITE, *start_line(track), 2)
+
+
+def start_line(track) -> tuple[tuple[float, float], tuple[float, float]]:
+  """The ends of the start line, from the car's left to its right."""
+  x, y, angle = track.start
+  # Square to the heading. y is flipped on the screen.
+  dx = -math.sin(math.radians(angle)) * track.width / 2
+  dy = -math.cos(math.radians(angle)) * track.width / 2
+  return (x + dx, y + dy), (x - dx, y - dy)
+
+
+def draw_background(track) -> pygame.Surface:
+  """Draws the grass and the track once, onto their own surface."""
+  background = pygame.Surface((WIDTH, HEIGHT)).convert()
+  background.fill(GRASS_COLOR)
+  draw_track(background, track)
+  return background
+
+
+class LapBoard:
+  """Shows each car's laps and best lap time in the top left corner.
+
+  The text is only rendered again when a car finishes a lap. Cars can
+  drive under it, so a line is also drawn again when a car was wiped off
+  from under it.
+  """
+
+  def __init__(self, counters: list[LapCounter], colors):
+    self.counters = counters
+    self.colors = colors
+    self.font = pygame.font.Font(None, FONT_SIZE)
+    self.laps = None
+    self.texts = []  # (rendered text, rect) for each car
+
+  def draw(self, screen, background, erased: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Draws the lines that changed, or that overlap erased, and returns
+    the rects it drew."""
+    laps = [counter.laps for counter in self.counters]
+    if laps == self.laps:
+      redraw = [(text, rect, rect) for text, rect in self.texts if rect.collidelist(erased) >= 0]
+    else:
+      self.laps = laps
+      old_rects = [rect for _, rect in self.texts]
+      self.texts = []
+      for i, (counter, color) in enumerate(zip(self.counters, self.colors)):
+        text = f"Laps: {counter.laps}"
+        if counter.best_lap:
+          text += f"  Best: {counter.best_lap / FPS:.2f}s"
+        rendered_text = self.font.render(text, True, color)
+        self.texts.append((rendered_text, rendered_text.get_rect(topleft=(10, 10 + i * FONT_SIZE))))
+      redraw = [(text, rect, rect.unionall(old_rects[i:i + 1]))
+                for i, (text, rect) in enumerate(self.texts)]
+
+    for rendered_text, rect, area in redraw:
+      # The text is blended with what is under it, so it goes over the background.
+      screen.blit(background, area, area)
+      screen.blit(rendered_text, rect)
+    return [area for _, _, area in redraw]
+
+
+def start_positions(track, n_cars: int) -> list[tuple[float, float, float]]:
+  """Lines the cars up side by side across the start line."""
+  (left_x, left_y), (right_x, right_y) = start_line(track)
+  angle = track.start[2]
+  return [(left_x + (right_x - left_x) * (i + 0.5) / n_cars,
+           left_y + (right_y - left_y) * (i + 0.5) / n_cars, angle) for i in range(n_cars)]
+
+
+def main(strategies: Optional[list[DriverStrategy]] = None, track=OVAL):
+  """Races a car for each strategy. Without any, the arrow keys drive one car.
+
+  Strategies with a set_keys method are given the keyboard every frame.
+  track is the oval, or a SplineTrack (see core/spline_track.py).
+  """
+  if strategies is None:
+    strategies = [KeyStrategy()]
+  pygame.init()
+  screen = pygame.display.set_mode((WIDTH, HEIGHT))
+  pygame.display.set_caption("Oval Car Racing")
+  clock = pygame.time.Clock()
+
+  rng = random.Random()
+  cars = [Car(*position) for position in start_positions(track, len(strategies))]
+  colors = CAR_COLORS[:len(cars)]
+  sprites = [CarSprite(car, color) for car, color in zip(cars, colors)]
+  counters = [LapCounter() for _ in cars]
+  lap_board = LapBoard(counters, colors)
+
+  # The background is drawn once. After that, each frame only covers up
+  # where the cars were and draws them where they are now.
+  background = draw_background(track)
+  screen.blit(background, (0, 0))
+  pygame.display.flip()
+
+  running = True
+  while running:
+    for event in pygame.event.get():
+      if event.type == pygame.QUIT:
+        running = False
+
+    dirty = [sprite.rect for sprite in sprites]
+    for rect in dirty:
+      screen.blit(background, rect, rect)
+
+    keys = pygame.key.get_pressed()
+    for strategy, car, sprite, counter in zip(strategies, cars, sprites, counters):
+      if hasattr(strategy, "set_keys"):
+        strategy.set_keys(keys)
+      controls = strategy.get_controls(car.x, car.y, car.angle, car.speed, track)
+      car.update(controls, track, rng)
+      counter.update(track.progress(car.x, car.y))
+      sprite.update()
+
+    dirty += lap_board.draw(screen, background, dirty)
+    for sprite in sprites:
+      sprite.draw(screen)
+      dirty.append(sprite.rect)
+
+    pygame.display.update(dirty)
+    clock.tick(FPS)
+
+  pygame.quit()
@@ -0,0 +1,44 @@
+"""Counting laps and timing them.
+
+The track is cut into CHECKPOINTS sections by progress round the lap (see
+OvalTrack.progress). A lap only counts once the car has driven into every
+section in order and then back over the start line, so turning round at
+the line, or cutting back across it, does not.
+"""
+
+from typing import Optional
+
+CHECKPOINTS = 8
+
+
+class LapCounter:
+  """Keeps track of one car's laps, in frames."""
+
+  def __init__(self, checkpoints: int = CHECKPOINTS):
+    self.checkpoints = checkpoints
+    self.next_checkpoint = 1  # cars start in section 0, on the start line
+    self.frames = 0
+    self.lap_start = 0
+    self.lap_times = []
+
+  @property
+  def laps(self) -> int:
+    return len(self.lap_times)
+
+  @property
+  def best_lap(self) -> Optional[int]:
+    return min(self.lap_times, default=None)
+
+  def update(self, progress: float) -> bool:
+    """Counts a frame, with the car at the given progress round the lap.
+    Returns True when the car has just finished a lap."""
+    self.frames += 1
+    section = int(progress * self.checkpoints) % self.checkpoints
+    if section != self.next_checkpoint:
+      return False
+    self.next_checkpoint = (self.next_checkpoint + 1) % self.checkpoints
+    if section != 0:
+      return False
+    self.lap_times.append(self.frames - self.lap_start)
+    self.lap_start = self.frames
+    return True
@@ -0,0 +1,215 @@
+"""Tracks of any shape, loaded from a file.
+
+A track file is JSON with the track's width and a list of control points,
+in window pixels:
+
+    {"width": 50, "points": [[650, 300], [600, 90], ...]}
+
+The middle of the track is a smooth closed curve (a Catmull-Rom spline)
+through the points, and the cars drive round it in the order the points
+are listed, starting at the first one. The curve should not come within a
+track's width of itself, or bend tighter than half the track's width.
+
+When a track loads, the curve is cut into samples SAMPLE_SPACING pixels
+apart along it, each with its direction, and a grid over the window
+remembers the nearest sample to every cell near the track. After that,
+finding where a car is on the track (how far round, and how far from the
+middle) is a grid lookup and a step or two along the samples from there,
+however long or twisty the track is. Collisions, lap progress and robot
+steering all use that.
+"""
+
+import json
+import math
+from typing import Optional, Union
+
+from core.track import Collision, OvalTrack
+
+SAMPLE_SPACING = 2.0  # pixels between samples along the middle of the track
+CELL_SIZE = 8  # pixels per side of a grid cell
+# How far outside the track the grid reaches. Cars are put back on the
+# track every frame, so they are never more than a frame's driving out.
+GRID_MARGIN = 20
+# Catmull-Rom points worked out between each pair of control points,
+# before they are evened out into samples.
+SPLINE_STEPS = 64
+
+
+class SplineTrack:
+  """A closed track through control points."""
+
+  def __init__(self, points: list[tuple[float, float]], width: float):
+    self.points = [tuple(point) for point in points]
+    self.width = width
+    self.xs, self.ys, self.spacing = _even_samples(_catmull_rom(self.points), SAMPLE_SPACING)
+    n = len(self.xs)
+    self.length = n * self.spacing
+    # The direction of the track at each sample, as a unit vector in
+    # screen coordinates, and the normal, a quarter turn anticlockwise
+    # (on the screen) from it.
+    self.tx, self.ty = [], []
+    for i in range(n):
+      dx = self.xs[(i + 1) % n] - self.xs[i - 1]
+      dy = self.ys[(i + 1) % n] - self.ys[i - 1]
+      norm = math.hypot(dx, dy)
+      self.tx.append(dx / norm)
+      self.ty.append(dy / norm)
+    self.nx = self.ty
+    self.ny = [-ty for ty in self.tx]
+    self._build_grid()
+
+  def _build_grid(self):
+    """Finds the nearest sample to the middle of every cell near the track."""
+    reach = self.width / 2 + GRID_MARGIN
+    self.grid_x = int((min(self.xs) - reach) // CELL_SIZE)
+    self.grid_y = int((min(self.ys) - reach) // CELL_SIZE)
+    self.grid_width = int((max(self.xs) + reach) // CELL_SIZE) - self.grid_x + 1
+    self.grid_height = int((max(self.ys) + reach) // CELL_SIZE) - self.grid_y + 1
+    self.grid = [-1] * (self.grid_width * self.grid_height)
+    distances = [reach * reach] * len(self.grid)
+    cells = int(reach // CELL_SIZE) + 1
+    for i, (x, y) in enumerate(zip(self.xs, self.ys)):
+      cell_x = int(x // CELL_SIZE) - self.grid_x
+      cell_y = int(y // CELL_SIZE) - self.grid_y
+      for gy in range(max(0, cell_y - cells), min(self.grid_height, cell_y + cells + 1)):
+        dy = (self.grid_y + gy + 0.5) * CELL_SIZE - y
+        row = gy * self.grid_width
+        for gx in range(max(0, cell_x - cells), min(self.grid_width, cell_x + cells + 1)):
+          dx = (self.grid_x + gx + 0.5) * CELL_SIZE - x
+          distance = dx * dx + dy * dy
+          if distance < distances[row + gx]:
+            distances[row + gx] = distance
+            self.grid[row + gx] = i
+
+  def locate(self, x: float, y: float) -> tuple[int, float, float]:
+    """Finds the nearest sample to (x, y).
+
+    Returns its index, how far (x, y) is past it along the track, and how
+    far (x, y) is from the middle of the track along the normal.
+    """
+    n = len(self.xs)
+    gx = int(x // CELL_SIZE) - self.grid_x
+    gy = int(y // CELL_SIZE) - self.grid_y
+    if 0 <= gx < self.grid_width and 0 <= gy < self.grid_height:
+      guess = self.grid[gy * self.grid_width + gx]
+    else:
+      guess = -1
+    xs, ys = self.xs, self.ys
+    if guess < 0:
+      # Well off the track, which a car should never be. Search everything.
+      guess = min(range(n), key=lambda j: (xs[j] - x)**2 + (ys[j] - y)**2)
+    # The grid is worked out for the middle of the cell, so a sample a
+    # little further along or back may be nearer. Walk to it.
+    i = guess
+    distance = (xs[i] - x)**2 + (ys[i] - y)**2
+    for step in (1, -1):
+      while True:
+        j = (i + step) % n
+        closer = (xs[j] - x)**2 + (ys[j] - y)**2
+        if closer >= distance:
+          break
+        i, distance = j, closer
+    dx = x - self.xs[i]
+    dy = y - self.ys[i]
+    return i, dx * self.tx[i] + dy * self.ty[i], dx * self.nx[i] + dy * self.ny[i]
+
+  @property
+  def start(self) -> tuple[float, float, float]:
+    """Where the cars start, as x, y and heading: at the first control point,
+    facing along the track."""
+    # Headings have y up.
+    return self.xs[0], self.ys[0], math.degrees(math.atan2(-self.ty[0], self.tx[0])) % 360
+
+  def progress(self, x: float, y: float) -> float:
+    """How far round a lap (x, y) is, from 0 at the start line to 1,
+    measured along the middle of the track."""
+    i, along, _ = self.locate(x, y)
+    return (i * self.spacing + along) / self.length % 1
+
+  def centerline_point(self, progress: float) -> tuple[float, float]:
+    """The point in the middle of the track at the given progress round a lap."""
+    n = len(self.xs)
+    position = progress % 1 * n
+    i = int(position) % n
+    j = (i + 1) % n
+    t = position - int(position)
+    return (self.xs[i] + (self.xs[j] - self.xs[i]) * t,
+            self.ys[i] + (self.ys[j] - self.ys[i]) * t)
+
+  def edges(self) -> tuple[list, list]:
+    """The points along each side of the track, for drawing it."""
+    half = self.width / 2
+    sides = []
+    for side in (1, -1):
+      sides.append([(x + nx * half * side, y + ny * half * side)
+                    for x, y, nx, ny in zip(self.xs, self.ys, self.nx, self.ny)])
+    return sides[0], sides[1]
+
+  def collide(self, x: float, y: float) -> Optional[Collision]:
+    """Puts a car that has left the track back on the edge it went over,
+    square to the track. None while the car is on the track."""
+    i, _, offset = self.locate(x, y)
+    half = self.width / 2
+    if abs(offset) <= half:
+      return None
+    side = math.copysign(1, offset)
+    back = offset - side * half
+    nx, ny = self.nx[i], self.ny[i]
+    # The edge pushes back towards the middle. Headings have y up.
+    normal_angle = math.degrees(math.atan2(side * ny, -side * nx)) % 360
+    return Collision(x=x - nx * back, y=y - ny * back, normal_angle=normal_angle)
+
+
+def _catmull_rom(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+  """Points along the closed Catmull-Rom spline through points."""
+  n = len(points)
+  curve = []
+  for k in range(n):
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = (points[(k + d) % n] for d in (-1, 0, 1, 2))
+    for step in range(SPLINE_STEPS):
+      t = step / SPLINE_STEPS
+      t2 = t * t
+      t3 = t2 * t
+      curve.append((
+          0.5 * (2 * x1 + (x2 - x0) * t + (2 * x0 - 5 * x1 + 4 * x2 - x3) * t2
+                 + (3 * x1 - x0 - 3 * x2 + x3) * t3),
+          0.5 * (2 * y1 + (y2 - y0) * t + (2 * y0 - 5 * y1 + 4 * y2 - y3) * t2
+                 + (3 * y1 - y0 - 3 * y2 + y3) * t3),
+      ))
+  return curve
+
+
+def _even_samples(curve: list[tuple[float, float]], spacing: float) -> tuple[list, list, float]:
+  """Points the same distance apart along the closed curve through curve.
+
+  The spacing is stretched a little so that a whole number of samples go
+  round. Returns the samples' xs and ys, and the spacing used.
+  """
+  closed = curve + curve[:1]
+  lengths = [0.0]
+  for (x0, y0), (x1, y1) in zip(closed, closed[1:]):
+    lengths.append(lengths[-1] + math.hypot(x1 - x0, y1 - y0))
+  n = max(3, round(lengths[-1] / spacing))
+  step = lengths[-1] / n
+  xs, ys = [], []
+  segment = 0
+  for i in range(n):
+    distance = i * step
+    while lengths[segment + 1] < distance:
+      segment += 1
+    (x0, y0), (x1, y1) = closed[segment], closed[segment + 1]
+    t = (distance - lengths[segment]) / (lengths[segment + 1] - lengths[segment] or 1)
+    xs.append(x0 + (x1 - x0) * t)
+    ys.append(y0 + (y1 - y0) * t)
+  return xs, ys, step
+
+
+def load_track(path: str) -> SplineTrack:
+  """Reads a track file. See the top of this file for what goes in one."""
+  with open(path) as f:
+    data = json.load(f)
+  return SplineTrack([tuple(point) for point in data["points"]], data["width"])
+
+
+# Anything a car can drive on.
+Track = Union[OvalTrack, SplineTrack]
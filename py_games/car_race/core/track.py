@@ -0,0 +1,100 @@
+"""The oval track's walls, worked out once so that driving on it is cheap.
+
+The walls are two ellipses around the same center. A point (dx, dy) from
+the center is outside an ellipse when dx²/rx² + dy²/ry² > 1, and dividing
+(dx, dy) by the square root of that sum lands exactly on the ellipse, on
+the line through the center. So with 1/rx² and 1/ry² worked out up front,
+checking a car against the walls is a few multiplications, and putting a
+car that went through a wall back on it takes one square root. Only the
+direction the wall pushes the car (square to the wall, along the
+gradient of that sum), which the car needs as an angle, takes any
+trigonometry, and only when the car actually hits the wall.
+
+Angles are in degrees, anticlockwise with y up, like the car's heading.
+Cars go round anticlockwise, starting on the right of the oval.
+"""
+
+import dataclasses
+import math
+from typing import Optional
+
+
+@dataclasses.dataclass
+class Collision:
+  """Where a car that ran into a wall ends up."""
+  x: float  # back on the wall
+  y: float
+  normal_angle: float  # the direction the wall pushes, square to it, in degrees
+
+
+class OvalTrack:
+  """A track between two ellipses with the same center."""
+
+  def __init__(self, center_x: float, center_y: float, radius_x: float, radius_y: float,
+               width: float):
+    self.center_x = center_x
+    self.center_y = center_y
+    self.radius_x = radius_x
+    self.radius_y = radius_y
+    self.inner_radius_x = radius_x - width
+    self.inner_radius_y = radius_y - width
+    self.width = width
+    self._outer_x = 1 / radius_x**2
+    self._outer_y = 1 / radius_y**2
+    self._inner_x = 1 / self.inner_radius_x**2
+    self._inner_y = 1 / self.inner_radius_y**2
+
+  @property
+  def length(self) -> float:
+    """How far round the middle of the track is (Ramanujan's approximation)."""
+    a = self.radius_x - self.width / 2
+    b = self.radius_y - self.width / 2
+    return math.pi * (3 * (a + b) - math.sqrt((3 * a + b) * (a + 3 * b)))
+
+  @property
+  def start(self) -> tuple[float, float, float]:
+    """Where the cars start, as x, y and heading: in the middle of the
+    track on the right, facing up."""
+    return self.center_x + self.radius_x - self.width / 2, self.center_y, 90
+
+  def progress(self, x: float, y: float) -> float:
+    """How far round a lap (x, y) is, from 0 at the start line to 1.
+
+    Measured along the line down the middle of the track, which is an
+    ellipse too, so a given progress is always the same centerline_point.
+    """
+    a = self.radius_x - self.width / 2
+    b = self.radius_y - self.width / 2
+    # y is flipped on the screen.
+    return math.atan2((self.center_y - y) / b, (x - self.center_x) / a) / (2 * math.pi) % 1
+
+  def centerline_point(self, progress: float) -> tuple[float, float]:
+    """The point in the middle of the track at the given progress round a lap."""
+    angle = 2 * math.pi * progress
+    return (self.center_x + (self.radius_x - self.width / 2) * math.cos(angle),
+            self.center_y - (self.radius_y - self.width / 2) * math.sin(angle))
+
+  def collide(self, x: float, y: float) -> Optional[Collision]:
+    """Puts a car that has left the track back on the wall it went through,
+    along a line through the center. None while the car is on the track."""
+    dx = x - self.center_x
+    dy = y - self.center_y
+    dx2 = dx * dx
+    dy2 = dy * dy
+    outer = dx2 * self._outer_x + dy2 * self._outer_y
+    if outer > 1:
+      scale = 1 / math.sqrt(outer)
+      # Square to the wall, pointing in: against dx²/rx² + dy²/ry²'s gradient.
+      normal_angle = math.degrees(math.atan2(dy * self._outer_y, -dx * self._outer_x)) % 360
+    else:
+      inner = dx2 * self._inner_x + dy2 * self._inner_y
+      if inner >= 1:
+        return None
+      scale = 1 / math.sqrt(inner)
+      normal_angle = math.degrees(math.atan2(-dy * self._inner_y, dx * self._inner_x)) % 360
+    return Collision(x=self.center_x + dx * scale, y=self.center_y + dy * scale,
+                     normal_angle=normal_angle)
+
+
+# The track in the game, in the middle of its 800x600 window.
+OVAL = OvalTrack(center_x=400, center_y=300, radius_x=300, radius_y=200, width=50)
@@ -0,0 +1,16 @@
+from core.car import Controls
+from core.spline_track import Track
+
+
+class DriverStrategy:
+  """Drives a car."""
+
+  def get_controls(self, x: float, y: float, angle: float, speed: float,
+                   track: Track) -> Controls:
+    """Returns what to do this frame: accelerate, brake and which way to steer.
+
+    x and y are the middle of the car, in pixels, with y growing downwards.
+    angle is the car's heading in degrees, anticlockwise from pointing
+    right. speed is in pixels a frame.
+    """
+    return Controls()
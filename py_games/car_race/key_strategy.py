@@ -0,0 +1,21 @@
+import pygame
+from core.car import Controls
+from driver_strategy import DriverStrategy
+
+
+class KeyStrategy(DriverStrategy):
+  """Drives with the arrow keys."""
+
+  def __init__(self):
+    self.controls = Controls()
+
+  def set_keys(self, keys):
+    """Sets the key state."""
+    self.controls = Controls(
+        accelerate=keys[pygame.K_UP],
+        brake=keys[pygame.K_DOWN],
+        steer=keys[pygame.K_LEFT] - keys[pygame.K_RIGHT],
+    )
+
+  def get_controls(self, x, y, angle, speed, track):
+    return self.controls
@@ -0,0 +1,58 @@
+"""Times drivers' laps without a window, to compare them.
+
+    python3 lap_times.py --drives 1000 --laps 3 --track tracks/kidney.json
+
+Each driver does the same seeded drives, so they all get the same luck
+with the slide. Prints each driver's best and average lap, how often it
+hits a wall, and how many drives it did not finish.
+"""
+
+import argparse
+import statistics
+import time
+
+from core import simulator
+from core.car import FPS, MAX_SPEED
+from core.spline_track import load_track
+from core.track import OVAL
+from line_robot_strategy import LineRobotStrategy
+
+# Add your own drivers here.
+DRIVERS = {
+    "steady": LineRobotStrategy(0.6 * MAX_SPEED),
+    "quick": LineRobotStrategy(0.8 * MAX_SPEED),
+    "flat out": LineRobotStrategy(MAX_SPEED),
+}
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--drives", type=int, default=1000)
+  parser.add_argument("--laps", type=int, default=3)
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--track", help="a track file; the oval if not given")
+  args = parser.parse_args()
+  track = load_track(args.track) if args.track else OVAL
+
+  for name, strategy in DRIVERS.items():
+    start = time.perf_counter()
+    lap_times = []
+    wall_hits = unfinished = 0
+    for drive in range(args.drives):
+      result = simulator.drive(strategy, laps=args.laps, seed=args.seed + drive,
+                               track=track)
+      lap_times += result.lap_times
+      wall_hits += result.wall_hits
+      unfinished += len(result.lap_times) < args.laps
+    elapsed = time.perf_counter() - start
+    if not lap_times:
+      print(f"{name:>10}: no laps")
+      continue
+    print(f"{name:>10}: best {min(lap_times) / FPS:.2f}s, "
+          f"average {statistics.mean(lap_times) / FPS:.2f}s, "
+          f"{wall_hits / len(lap_times):.2f} wall hits a lap, {unfinished} unfinished "
+          f"({len(lap_times)} laps in {elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,29 @@
+import math
+from core.car import MAX_SPEED, MAX_STEER, Controls
+from driver_strategy import DriverStrategy
+
+# How far ahead down the middle of the track the robot looks, in pixels.
+LOOK_AHEAD = 60
+
+
+class LineRobotStrategy(DriverStrategy):
+  """Follows the middle of the track, holding a steady speed.
+
+  The faster it goes, the more the car slides, so the best speed is a
+  trade-off. Try different ones with lap_times.py.
+  """
+
+  def __init__(self, target_speed: float = 0.7 * MAX_SPEED):
+    self.target_speed = target_speed
+
+  def get_controls(self, x, y, angle, speed, track):
+    target_x, target_y = track.centerline_point(
+        track.progress(x, y) + LOOK_AHEAD / track.length)
+    # y is flipped on the screen.
+    heading = math.degrees(math.atan2(y - target_y, target_x - x))
+    turn = (heading - angle + 180) % 360 - 180
+    return Controls(
+        accelerate=speed < self.target_speed,
+        brake=speed > self.target_speed + 0.5,
+        steer=turn / MAX_STEER,
+    )
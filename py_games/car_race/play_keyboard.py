@@ -0,0 +1,8 @@
+import sys
+from core import car_race
+from core.spline_track import load_track
+
+# Up to go faster, down to brake, left and right to steer. To drive on
+# another track, name its file, e.g. python3 play_keyboard.py tracks/kidney.json
+track = load_track(sys.argv[1]) if len(sys.argv) > 1 else car_race.OVAL
+car_race.main(track=track)
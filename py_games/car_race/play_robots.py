@@ -0,0 +1,16 @@
+import sys
+from core import car_race
+from core.car import MAX_SPEED
+from core.spline_track import load_track
+from key_strategy import KeyStrategy
+from line_robot_strategy import LineRobotStrategy
+
+# You drive the red car with the arrow keys, against two robots: blue
+# takes it steady and yellow goes flat out. To race on another track,
+# name its file, e.g. python3 play_robots.py tracks/kidney.json
+track = load_track(sys.argv[1]) if len(sys.argv) > 1 else car_race.OVAL
+car_race.main([
+    KeyStrategy(),
+    LineRobotStrategy(0.7 * MAX_SPEED),
+    LineRobotStrategy(MAX_SPEED),
+], track)
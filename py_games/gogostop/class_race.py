@@ -0,0 +1,32 @@
+import sys
+import time
+
+import core.engine
+from core.solver import TableStrategy, threshold_table
+from daves_strategy import DavesStrategy
+from students_strategy import StudentsStrategy
+
+# A whole class racing at once. Swap in everybody's strategies here.
+strategies = {"Dave": DavesStrategy(), "Student": StudentsStrategy()}
+for far in range(1, 7):
+  for near in range(1, 5):
+    strategies[f"Go {far} then {near}"] = TableStrategy(threshold_table(far, near))
+
+# Thousands of races without a window first. Needs numpy.
+start = time.perf_counter()
+result = core.engine.simulate_races(list(strategies.values()), n_games=100_000, seed=0)
+elapsed = time.perf_counter() - start
+print(f"{result.games} races of {len(strategies)} players in {elapsed:.1f}s, "
+      f"{result.ties / result.games:.2%} shared")
+# Players with the same strategy always finish together, so count shared wins too.
+ranking = sorted(zip(result.wins, result.shared_wins, strategies), reverse=True)
+for wins, shared_wins, name in ranking:
+  print(f"  {name:<14} wins {wins / result.games:.2%}, "
+        f"shares {shared_wins / result.games:.2%}")
+
+# Then one race to watch. Pass --headless to skip it.
+if "--headless" not in sys.argv:
+  import core.gogostop
+  core.gogostop.play_game(
+      game_speed=4.0, players=core.gogostop.make_players(strategies)
+  )
@@ -0,0 +1,246 @@
+"""Go-Go-Stop rules, without any display.
+
+Race holds the state of one game and plays it turn by turn, calling the
+players' strategies as it goes. simulate_races() plays many games at once
+with numpy, which is fast enough to estimate win rates over millions of
+games. Both work for any number of players.
+
+simulate_races() only goes fast for strategies that always give the same
+move for the same arguments. Random or stateful strategies are played one
+game at a time with Race instead.
+"""
+
+import dataclasses
+import random
+from typing import Optional
+
+import numpy as np
+
+from player_strategy import Movement, PlayerStrategy
+
+# --- Rules ---
+STEPS = 32
+STOP_PROBABILITY = 0.1
+STEPS_CLOSE_TO_FINISH = 12
+STOP_PROBABILITY_NEAR_FINISH = 0.4
+# Games where nobody ever finishes (e.g. two players that always stop) end here.
+MAX_TURNS = 1000
+# Number of games simulate() plays at a time.
+CHUNK_SIZE = 1 << 14
+
+
+def is_close_to_finish(leader_step: int) -> bool:
+  """The light turns red more often once anybody gets close to the finish."""
+  return STEPS - leader_step < STEPS_CLOSE_TO_FINISH
+
+
+def stop_probability(close_to_finish: bool) -> float:
+  if close_to_finish:
+    return STOP_PROBABILITY_NEAR_FINISH
+  return STOP_PROBABILITY
+
+
+class Race:
+  """One game of Go-Go-Stop between any number of players.
+
+  Every player's current and saved step lives in an array, one entry per
+  player, and a turn updates them all at once.
+  """
+
+  def __init__(self, strategies: list[PlayerStrategy], rng: Optional[random.Random] = None):
+    self.strategies = list(strategies)
+    self.rng = rng or random.Random()
+    self.current = np.zeros(len(self.strategies), dtype=np.int64)  # current game positions
+    self.saved = np.zeros(len(self.strategies), dtype=np.int64)  # anchor positions
+    self.turns = 0
+
+  def close_to_finish(self) -> bool:
+    return is_close_to_finish(int(self.current.max()))
+
+  def get_moves(self) -> np.ndarray:
+    """Asks every player's strategy for its move. True means GO."""
+    close_to_finish = self.close_to_finish()
+    return np.array([
+        strategy.get_move(int(distance), close_to_finish) == Movement.GO
+        for strategy, distance in zip(self.strategies, self.current - self.saved)
+    ], dtype=bool)
+
+  def play_turn(self, go: Optional[np.ndarray] = None) -> bool:
+    """Plays one turn and returns whether the light was green."""
+    if go is None:
+      go = self.get_moves()
+    is_go = self.rng.random() >= stop_probability(self.close_to_finish())
+    # Players who stop save their position. Players who go move on a green
+    # light and get sent back to their saved position on a red one.
+    self.saved = np.where(go, self.saved, self.current)
+    self.current = np.where(go, self.current + 1 if is_go else self.saved, self.current)
+    self.turns += 1
+    return is_go
+
+  def winners(self) -> list[int]:
+    """The indexes of the players that have reached the finish."""
+    return np.flatnonzero(self.current == STEPS).tolist()
+
+  def play(self, max_turns: int = MAX_TURNS) -> list[int]:
+    """Plays until somebody finishes and returns the winners' indexes."""
+    while not self.winners() and self.turns < max_turns:
+      self.play_turn()
+    return self.winners()
+
+
+class UntabulatableStrategyError(ValueError):
+  """A strategy gave different moves for the same arguments, so it is random
+  or remembers earlier moves, and no table can stand in for it."""
+
+
+def tabulate(strategy: PlayerStrategy, steps: int = STEPS) -> np.ndarray:
+  """Every answer a strategy can give, as table[distance_from_last_save, close_to_finish].
+
+  True means GO. get_move only sees its two arguments, so for a strategy that
+  always gives the same move for them this table is the whole strategy. Every
+  question is asked twice, and UntabulatableStrategyError is raised if the
+  answers differ.
+  """
+  tables = np.zeros((2, steps + 1, 2), dtype=bool)
+  for table in tables:
+    for distance in range(steps + 1):
+      for close_to_finish in (False, True):
+        move = strategy.get_move(distance, close_to_finish)
+        table[distance, int(close_to_finish)] = move == Movement.GO
+  if not np.array_equal(tables[0], tables[1]):
+    raise UntabulatableStrategyError(
+        f"{type(strategy).__name__}.get_move gave different moves for the same arguments")
+  return tables[0]
+
+
+@dataclasses.dataclass
+class RaceResult:
+  """How a batch of races turned out, one entry per player."""
+  games: int
+  wins: np.ndarray  # races each player won alone
+  shared_wins: np.ndarray  # races each player finished first together with others
+  ties: int  # races where more than one player finished on the same turn
+
+  @property
+  def unfinished(self) -> int:
+    return self.games - int(self.wins.sum()) - self.ties
+
+  @property
+  def win_rates(self) -> np.ndarray:
+    return self.wins / self.games
+
+
+@dataclasses.dataclass
+class SimulationResult:
+  """How a batch of two-player games turned out."""
+  games: int
+  wins_a: int
+  wins_b: int
+  ties: int  # both players finished on the same turn
+
+  @property
+  def unfinished(self) -> int:
+    return self.games - self.wins_a - self.wins_b - self.ties
+
+  @property
+  def win_rate_a(self) -> float:
+    return self.wins_a / self.games
+
+  @property
+  def win_rate_b(self) -> float:
+    return self.wins_b / self.games
+
+
+def simulate(
+    strategy_a: PlayerStrategy,
+    strategy_b: PlayerStrategy,
+    n_games: int,
+    seed: Optional[int] = None,
+    max_turns: int = MAX_TURNS,
+) -> SimulationResult:
+  """Plays n_games of strategy_a against strategy_b. See simulate_races."""
+  result = simulate_races([strategy_a, strategy_b], n_games, seed, max_turns)
+  return SimulationResult(
+      games=n_games,
+      wins_a=int(result.wins[0]),
+      wins_b=int(result.wins[1]),
+      ties=result.ties,
+  )
+
+
+def simulate_races(
+    strategies: list[PlayerStrategy],
+    n_games: int,
+    seed: Optional[int] = None,
+    max_turns: int = MAX_TURNS,
+    chunk_size: int = CHUNK_SIZE,
+) -> RaceResult:
+  """Plays n_games races between all the strategies, many at a time.
+
+  The strategies are tabulated first, and the races' state lives in numpy
+  arrays with one row per player and one column per race, a cache-sized
+  chunk of races at a time. Races that have finished are dropped from the
+  arrays, so each turn only costs as much as the races still running.
+
+  If a strategy can't be tabulated, the races are played one at a time with
+  Race, which asks the strategies for every move. That gives the right
+  answer, much more slowly.
+  """
+  n_players = len(strategies)
+  try:
+    tables = [tabulate(strategy) for strategy in strategies]
+  except UntabulatableStrategyError:
+    return _play_races(strategies, n_games, seed, max_turns)
+  # Flattened, so that looking a move up is one np.take:
+  # go[player, distance, close] is at (player * (STEPS + 1) + distance) * 2 + close.
+  tables = np.stack(tables).ravel()
+  table_offsets = (np.arange(n_players) * (STEPS + 1) * 2)[:, None]
+  # The chance of a red light, indexed by close_to_finish.
+  red_light = np.array([STOP_PROBABILITY, STOP_PROBABILITY_NEAR_FINISH])
+  rng = np.random.default_rng(seed)
+  wins = np.zeros(n_players, dtype=np.int64)
+  shared_wins = np.zeros(n_players, dtype=np.int64)
+  ties = 0
+  # Keep the arrays around the same size however many players there are.
+  chunk_size = max(1, chunk_size * 2 // n_players)
+  for start in range(0, n_games, chunk_size):
+    current = np.zeros((n_players, min(chunk_size, n_games - start)), dtype=np.int64)
+    saved = np.zeros_like(current)
+    for _ in range(max_turns):
+      if not current.shape[1]:
+        break
+      close_to_finish = is_close_to_finish(current.max(axis=0)).astype(np.int64)
+      go = np.take(tables, table_offsets + (current - saved) * 2 + close_to_finish)
+      is_go = rng.random(current.shape[1]) >= np.take(red_light, close_to_finish)
+      saved = np.where(go, saved, current)
+      current = np.where(go, np.where(is_go, current + 1, saved), current)
+
+      finished = current == STEPS
+      n_finished = finished.sum(axis=0)
+      if not n_finished.any():
+        continue
+      tied = n_finished > 1
+      ties += int(tied.sum())
+      wins += finished[:, n_finished == 1].sum(axis=1)
+      shared_wins += finished[:, tied].sum(axis=1)
+      running = n_finished == 0
+      current, saved = current[:, running], saved[:, running]
+
+  return RaceResult(games=n_games, wins=wins, shared_wins=shared_wins, ties=ties)
+
+
+def _play_races(strategies: list[PlayerStrategy], n_games: int, seed: Optional[int],
+                max_turns: int) -> RaceResult:
+  """simulate_races() for strategies that can't be tabulated: one Race at a time."""
+  rng = random.Random(seed)
+  wins = np.zeros(len(strategies), dtype=np.int64)
+  shared_wins = np.zeros(len(strategies), dtype=np.int64)
+  ties = 0
+  for _ in range(n_games):
+    winners = Race(strategies, rng).play(max_turns)
+    if len(winners) == 1:
+      wins[winners] += 1
+    elif winners:
+      ties += 1
+      shared_wins[winners] += 1
+  return RaceResult(games=n_games, wins=wins, shared_wins=shared_wins, ties=ties)
@@ -1,11 +1,17 @@
-"""Go-Go-Stop game."""
+"""Go-Go-Stop game.
+
+Every player's lane and position on the screen are numpy arrays, one entry
+per player, so any number of players are moved and drawn together. Needs
+pygame and numpy.
+"""
 
 import dataclasses
 import math
-import random
 from typing import Optional
+from core.engine import STEPS, Race
 from daves_strategy import DavesStrategy
-from player_strategy import Movement, PlayerStrategy
+import numpy as np
+from player_strategy import PlayerStrategy
 import pygame
 from students_strategy import StudentsStrategy
 
@@ -14,12 +20,6 @@ class Player:
   name: str
   strategy: PlayerStrategy
   color: tuple[int, int, int]
-  y_pos: int  # pixel position
-  x_pos: int = 0  # pixel position
-  saved_step: int = 0  # anchor position
-  current_step: int = 0  # current game position
-  next_step: int = 0.0  # only used internally while moving
-  speed: int = 1  #
 
 
 # Initialize Pygame
@@ -27,7 +27,7 @@ pygame.init()
 FONT = pygame.font.SysFont('arial.ttf', 48)
 
 # --- Constants ---
-WIDTH, HEIGHT = 800, 200
+WIDTH = 800
 BOARD_COLOR = (200, 200, 200)  # Light gray
 _BLACK = (0, 0, 0)
 _PURPLE = (128, 0, 255)
@@ -36,80 +36,103 @@ _GREY = (100, 100, 100)
 _GREEN = (0, 255, 0)
 _RED = (255, 0, 0)
 _WHITE = (255, 255, 255)
-STEPS = 32
 TOKEN_RADIUS = WIDTH // STEPS // 2
 STEP_SIZE = WIDTH // STEPS
 FPS = 30  # Frames per second (controls the speed of movement)
+# Each player gets a lane. Lanes shrink when there are too many to fit.
+_HEADER_HEIGHT = 75  # room for the stop light
+_FOOTER_HEIGHT = 25
+_MAX_LANE_HEIGHT = 50
+_MAX_HEIGHT = 800
 _STOP_LIGHT_RADIUS = 24
+_STOP_LIGHT_Y = 50
 _STOP_POLYGON = (
-    (WIDTH // 2 - _STOP_LIGHT_RADIUS // 2, HEIGHT // 4 - _STOP_LIGHT_RADIUS),
-    (WIDTH // 2 + _STOP_LIGHT_RADIUS // 2, HEIGHT // 4 - _STOP_LIGHT_RADIUS),
-    (WIDTH // 2 + _STOP_LIGHT_RADIUS, HEIGHT // 4 - _STOP_LIGHT_RADIUS // 2),
-    (WIDTH // 2 + _STOP_LIGHT_RADIUS, HEIGHT // 4 + _STOP_LIGHT_RADIUS // 2),
-    (WIDTH // 2 + _STOP_LIGHT_RADIUS // 2, HEIGHT // 4 + _STOP_LIGHT_RADIUS),
-    (WIDTH // 2 - _STOP_LIGHT_RADIUS // 2, HEIGHT // 4 + _STOP_LIGHT_RADIUS),
-    (WIDTH // 2 - _STOP_LIGHT_RADIUS, HEIGHT // 4 + _STOP_LIGHT_RADIUS // 2),
-    (WIDTH // 2 - _STOP_LIGHT_RADIUS, HEIGHT // 4 - _STOP_LIGHT_RADIUS // 2),
+    (WIDTH // 2 - _STOP_LIGHT_RADIUS // 2, _STOP_LIGHT_Y - _STOP_LIGHT_RADIUS),
+    (WIDTH // 2 + _STOP_LIGHT_RADIUS // 2, _STOP_LIGHT_Y - _STOP_LIGHT_RADIUS),
+    (WIDTH // 2 + _STOP_LIGHT_RADIUS, _STOP_LIGHT_Y - _STOP_LIGHT_RADIUS // 2),
+    (WIDTH // 2 + _STOP_LIGHT_RADIUS, _STOP_LIGHT_Y + _STOP_LIGHT_RADIUS // 2),
+    (WIDTH // 2 + _STOP_LIGHT_RADIUS // 2, _STOP_LIGHT_Y + _STOP_LIGHT_RADIUS),
+    (WIDTH // 2 - _STOP_LIGHT_RADIUS // 2, _STOP_LIGHT_Y + _STOP_LIGHT_RADIUS),
+    (WIDTH // 2 - _STOP_LIGHT_RADIUS, _STOP_LIGHT_Y + _STOP_LIGHT_RADIUS // 2),
+    (WIDTH // 2 - _STOP_LIGHT_RADIUS, _STOP_LIGHT_Y - _STOP_LIGHT_RADIUS // 2),
 )
 _CLOSED_POLY = 0
-_STOP_PROBABILITY = 0.1
-_STEPS_CLOSE_TO_FINISH = 12
-_STOP_PROBABILITY_NEAR_FINISH = 0.4
 
 # --- Players ---
 _players = [
-    Player(
-        name="Dave",
-        strategy=DavesStrategy(),
-        y_pos=2 * HEIGHT // 4,
-        color=_PURPLE,
-    ),
-    Player(
-        name="Student",
-        strategy=StudentsStrategy(),
-        y_pos=3 * HEIGHT // 4,
-        color=_CYAN,
-    ),
+    Player(name="Dave", strategy=DavesStrategy(), color=_PURPLE),
+    Player(name="Student", strategy=StudentsStrategy(), color=_CYAN),
 ]
 
-# --- Game Setup ---
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Reg Light Green Light")
-clock = pygame.time.Clock()
+
+def make_players(strategies: dict[str, PlayerStrategy]) -> list[Player]:
+  """Gives each named strategy its own color, for a race of any size."""
+  players = []
+  for i, (name, strategy) in enumerate(strategies.items()):
+    color = pygame.Color(0)
+    color.hsva = (360 * i / len(strategies), 80, 90, 100)
+    players.append(Player(name=name, strategy=strategy, color=tuple(color)[:3]))
+  return players
 
 
-def draw_board(is_go: bool, frame_count: int):
+@dataclasses.dataclass
+class Layout:
+  """Where the lanes go for a given number of players."""
+  height: int
+  lane_height: int
+  lane_y: np.ndarray  # the middle of each player's lane
+  token_radius: int
+
+  @classmethod
+  def for_players(cls, n_players: int) -> 'Layout':
+    lane_height = min(
+        _MAX_LANE_HEIGHT,
+        (_MAX_HEIGHT - _HEADER_HEIGHT - _FOOTER_HEIGHT) // n_players,
+    )
+    return cls(
+        height=_HEADER_HEIGHT + _FOOTER_HEIGHT + lane_height * n_players,
+        lane_height=lane_height,
+        lane_y=_HEADER_HEIGHT + lane_height * np.arange(n_players) + lane_height // 2,
+        token_radius=max(2, min(TOKEN_RADIUS, lane_height // 2 - 1)),
+    )
+
+
+def draw_board(
+    screen,
+    layout: Layout,
+    players: list[Player],
+    race: Race,
+    x_pos: np.ndarray,
+    is_go: bool,
+    frame_count: int,
+):
   """Draws the board and the tokens."""
   screen.fill(BOARD_COLOR)
-  # Draw active (Moving) tokens
-  for player in _players:
+  radius = layout.token_radius
+  for i, player in enumerate(players):
+    # Draw active (Moving) token
     pygame.draw.circle(
-        screen,
-        player.color,
-        (player.x_pos + TOKEN_RADIUS, player.y_pos),
-        TOKEN_RADIUS,
+        screen, player.color, (x_pos[i] + radius, layout.lane_y[i]), radius
     )
-
-  # Draw saved (Anchored) tokens
-  for player in _players:
+    # Draw saved (Anchored) token
     pygame.draw.circle(
         screen,
         player.color,
-        (player.saved_step * STEP_SIZE + TOKEN_RADIUS, player.y_pos),
-        TOKEN_RADIUS,
-        width=4,
+        (race.saved[i] * STEP_SIZE + radius, layout.lane_y[i]),
+        radius,
+        width=max(1, radius // 3),
     )
 
   # Draw step markers (optional, for visualization)
   for i in range(STEPS + 1):
     x = i * STEP_SIZE
-    pygame.draw.line(screen, _GREY, (x, 0), (x, HEIGHT), 1)
+    pygame.draw.line(screen, _GREY, (x, 0), (x, layout.height), 1)
 
   # Draw the stop / go indicator.
   # TODO(campana):  Add a spinning indicator.
   theta = 2 * math.pi * frame_count / FPS - math.pi / 2
   stop_light_x = WIDTH // 2
-  stop_light_y = HEIGHT // 4
+  stop_light_y = _STOP_LIGHT_Y
   if is_go:
     pygame.draw.circle(
         screen, _GREEN, (stop_light_x, stop_light_y), _STOP_LIGHT_RADIUS
@@ -130,27 +153,30 @@ def draw_board(is_go: bool, frame_count: int):
   )
 
 
-def animate_players(is_go: bool, game_speed: float = 1.0):
-  """Animate the players."""
-  # Next, animate the movement.
+def animate_players(
+    screen,
+    clock,
+    layout: Layout,
+    players: list[Player],
+    race: Race,
+    x_pos: np.ndarray,
+    speed: np.ndarray,
+    is_go: bool,
+    game_speed: float = 1.0,
+):
+  """Animate every player's token from x_pos to its new step, all at once."""
+  next_pos = race.current * STEP_SIZE
   frame_count = 0
   while frame_count <= FPS:
-    for player in _players:
-      # Divide by FPS for smooth movement
-      player.x_pos += STEP_SIZE * player.speed / FPS
-      # Stop exactly at the end of the move.
-      next_pos = player.next_step * STEP_SIZE
-      if player.speed > 0:
-        if player.x_pos >= next_pos:
-          player.x_pos = next_pos
-          player.current_step = player.next_step
-      else:
-        if player.x_pos <= next_pos:
-          player.x_pos = next_pos
-          player.current_step = player.next_step
+    # Divide by FPS for smooth movement
+    x_pos += STEP_SIZE * speed / FPS
+    # Stop exactly at the end of the move.
+    x_pos[:] = np.where(
+        speed > 0, np.minimum(x_pos, next_pos), np.maximum(x_pos, next_pos)
+    )
 
     # --- Drawing ---
-    draw_board(is_go, frame_count)
+    draw_board(screen, layout, players, race, x_pos, is_go, frame_count)
     pygame.display.flip()  # Update the display
 
     # --- Frame Rate Control ---
@@ -158,71 +184,64 @@ def animate_players(is_go: bool, game_speed: float = 1.0):
     frame_count += 1
 
 
-def move_players(is_go: bool, game_speed: float = 1.0) -> bool:
-  """Move the players base on their current step"""
+def move_players(
+    screen,
+    clock,
+    layout: Layout,
+    players: list[Player],
+    race: Race,
+    x_pos: np.ndarray,
+    game_speed: float = 1.0,
+) -> bool:
+  """Plays one turn and animates the result. Returns True if the window closed."""
 
   for event in pygame.event.get():
     if event.type == pygame.QUIT:
       return True
 
-  # First set next_step as appropriate and then move the players.
-  for player in _players:
-    if player.speed == 0:
-      player.saved_step = player.current_step
-      player.next_step = player.saved_step
-      continue
-    if not is_go:
-      # oops, you got caught.
-      player.next_step = player.saved_step
-      player.speed = -(player.current_step - player.saved_step) * 2
-    else:
-      player.next_step = player.current_step + player.speed
-
-  animate_players(is_go, game_speed)
+  previous_step = race.current
+  is_go = race.play_turn()
+  # Forward one step a second; back to the saved step twice as fast.
+  moved = race.current - previous_step
+  speed = np.where(moved > 0, moved, moved * 2)
+
+  animate_players(
+      screen, clock, layout, players, race, x_pos, speed, is_go, game_speed
+  )
 
   return False
 
 
-def get_winner() -> Optional[Player]:
-  """Returns the name of the player that won (if there is one)."""
-  for player in _players:
-    if player.x_pos == STEPS * STEP_SIZE:
-      return player.name
+def get_winner(players: list[Player], race: Race) -> Optional[Player]:
+  """Returns the player that won (if there is one)."""
+  winners = race.winners()
+  if winners:
+    return players[winners[0]]
   return None
 
 
-def play_game(game_speed: float = 1.0):
-  """Plays the game. Main loop."""
-  winner = get_winner()
-  count = 0
+def play_game(game_speed: float = 1.0, players: Optional[list[Player]] = None):
+  """Plays the game. Main loop.
+
+  players defaults to Dave against the student. Any number of players can
+  race; see make_players.
+  """
+  if players is None:
+    players = _players
+  layout = Layout.for_players(len(players))
+  screen = pygame.display.set_mode((WIDTH, layout.height))
+  pygame.display.set_caption("Reg Light Green Light")
+  clock = pygame.time.Clock()
+
+  race = Race([player.strategy for player in players])
+  x_pos = np.zeros(len(players))  # pixel positions
+  winner = get_winner(players, race)
   while not winner:
-    distance_from_finish = STEPS - max(
-        player.current_step for player in _players
-    )
-    close_to_finish = distance_from_finish < _STEPS_CLOSE_TO_FINISH
-    for player in _players:
-      distance_from_last_save = player.current_step - player.saved_step
-      move = player.strategy.get_move(distance_from_last_save, close_to_finish)
-      if move == Movement.GO:
-        player.speed = 1
-      else:
-        player.speed = 0
-
-    if close_to_finish:
-      stop_probability = _STOP_PROBABILITY_NEAR_FINISH
-    else:
-      stop_probability = _STOP_PROBABILITY
-    is_go = False if random.random() < stop_probability else True
-    if move_players(is_go, game_speed):
+    if move_players(screen, clock, layout, players, race, x_pos, game_speed):
       return
-    count += 1
-    winner = get_winner()
+    winner = get_winner(players, race)
 
-  if winner == 'Dave':
-    color = _PURPLE
-  else:
-    color = _CYAN
-  rendered_text = FONT.render(winner + ' wins!!!', True, color)
+  rendered_text = FONT.render(winner.name + ' wins!!!', True, winner.color)
   screen.blit(rendered_text, (10, 10))
   pygame.display.flip()
   pygame.time.delay(2000)
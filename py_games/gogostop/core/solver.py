@@ -0,0 +1,301 @@
+"""Exact Go-Go-Stop odds, by treating the game as a Markov chain.
+
+A two-player game is fully described by each player's current and saved
+step. From every such state the players' moves are fixed by their strategies,
+and the light decides between two next states. win_probability() finds every
+state reachable from the start and runs value iteration over them, which
+gives the exact chance of each result without playing a single game.
+
+solve() uses the same evaluation to find the exact optimal strategy against
+a given opponent, by branch and bound over the strategy's table, and
+remembers the answer for each set of rules and opponent in SOLUTIONS_PATH.
+Needs numpy.
+"""
+
+import dataclasses
+import itertools
+import json
+import os
+from typing import Optional
+
+import numpy as np
+
+from core import engine
+from player_strategy import Movement, PlayerStrategy
+
+# A tie (both players finishing on the same turn) counts as half a win.
+TIE_VALUE = 0.5
+# Value iteration stops once no state's value changes by more than this.
+TOLERANCE = 1e-13
+# The search only follows branches that could beat the best score so far by
+# more than this, well above value iteration's rounding. Tables closer than
+# this to the best count as equally good.
+BOUND_MARGIN = 1e-9
+SOLUTIONS_PATH = "solved_strategies.json"
+
+
+@dataclasses.dataclass(frozen=True)
+class Rules:
+  """The numbers that define a game. The defaults are the ones in engine.py."""
+  steps: int = engine.STEPS
+  stop_probability: float = engine.STOP_PROBABILITY
+  steps_close_to_finish: int = engine.STEPS_CLOSE_TO_FINISH
+  stop_probability_near_finish: float = engine.STOP_PROBABILITY_NEAR_FINISH
+
+  def close_to_finish(self, leader_step: int) -> bool:
+    return self.steps - leader_step < self.steps_close_to_finish
+
+  def red_light_probability(self, close_to_finish: bool) -> float:
+    if close_to_finish:
+      return self.stop_probability_near_finish
+    return self.stop_probability
+
+
+@dataclasses.dataclass
+class Odds:
+  """Exact chances of each result for player A."""
+  win: float
+  tie: float
+  loss: float
+
+  @property
+  def unfinished(self) -> float:
+    """Chance that nobody ever finishes (both players stop forever)."""
+    return max(0.0, 1.0 - self.win - self.tie - self.loss)
+
+  @property
+  def score(self) -> float:
+    return self.win + TIE_VALUE * self.tie
+
+
+class TableStrategy(PlayerStrategy):
+  """Plays from a table: table[distance_from_last_save][close_to_finish] is True for GO."""
+
+  def __init__(self, table):
+    self.table = [tuple(bool(go) for go in row) for row in table]
+
+  def get_move(self, distance_from_last_save: int, close_to_finish: bool) -> Movement:
+    if self.table[distance_from_last_save][int(close_to_finish)]:
+      return Movement.GO
+    return Movement.STOP
+
+
+def _table(strategy: PlayerStrategy, rules: Rules) -> tuple:
+  return tuple(map(tuple, engine.tabulate(strategy, rules.steps).tolist()))
+
+
+def _move(current: int, saved: int, go: bool, is_go: bool) -> tuple[int, int]:
+  """Where a player ends up after one turn, as (current_step, saved_step)."""
+  if not go:
+    return current, current
+  if is_go:
+    return current + 1, saved
+  # oops, you got caught.
+  return saved, saved
+
+
+def _build_chain(rules: Rules, choices_a, table_b):
+  """Finds every state reachable from the start and where each one leads.
+
+  choices_a(distance, close_to_finish) gives the moves player A may make
+  (one for a fixed strategy, both when looking for the best move).
+
+  Returns arrays with one row per state and one column per choice of A's:
+  the red light probability, the next state on a red light, the next state
+  on a green light, and the result of the green light if it ends the game
+  (-1 while the game goes on; else 0 for A winning, 1 for a tie, 2 for B).
+  """
+  start = (0, 0, 0, 0)
+  index = {start: 0}
+  states = [start]
+  n_choices = len(choices_a(0, False))
+  red_probability, red_next, green_next, green_result = [], [], [], []
+  for current_a, saved_a, current_b, saved_b in states:
+    close_to_finish = rules.close_to_finish(max(current_a, current_b))
+    go_b = table_b[current_b - saved_b][close_to_finish]
+    red_probability.append(rules.red_light_probability(close_to_finish))
+    reds, greens, results = [], [], []
+    for go_a in choices_a(current_a - saved_a, close_to_finish):
+      for is_go, next_states in ((False, reds), (True, greens)):
+        state = _move(current_a, saved_a, go_a, is_go) + _move(current_b, saved_b, go_b, is_go)
+        a_finished = state[0] == rules.steps
+        b_finished = state[2] == rules.steps
+        if a_finished or b_finished:
+          results.append(1 if a_finished and b_finished else 0 if a_finished else 2)
+          next_states.append(0)
+          continue
+        if is_go:
+          results.append(-1)
+        if state not in index:
+          index[state] = len(states)
+          states.append(state)
+        next_states.append(index[state])
+    red_next.append(reds)
+    green_next.append(greens)
+    green_result.append(results)
+  assert all(len(row) == n_choices for row in green_result)
+  return (np.array(red_probability)[:, None], np.array(red_next),
+          np.array(green_next), np.array(green_result))
+
+
+def _iterate(chain, objective):
+  """Value iteration. Returns the value of every state, one column per objective.
+
+  objective[result] is what each way of ending the game is worth. With more
+  than one choice for player A, A picks whichever choice scores best on the
+  first objective.
+  """
+  red_probability, red_next, green_next, green_result = chain
+  objective = np.asarray(objective, dtype=float)
+  end_value = np.where((green_result >= 0)[..., None], objective[green_result], 0.0)
+  ends = (green_result >= 0)[..., None]
+  value = np.zeros((len(red_probability), objective.shape[1]))
+  while True:
+    choices = (red_probability[..., None] * value[red_next]
+               + (1 - red_probability[..., None])
+               * np.where(ends, end_value, value[green_next]))
+    best = np.argmax(choices[..., 0], axis=1)
+    updated = choices[np.arange(len(best)), best]
+    if np.abs(updated - value).max() < TOLERANCE:
+      return updated
+    value = updated
+
+
+def win_probability(strategy_a: PlayerStrategy, strategy_b: PlayerStrategy,
+                    rules: Rules = Rules()) -> Odds:
+  """The exact odds of strategy_a against strategy_b, from the start."""
+  return _odds(_table(strategy_a, rules), _table(strategy_b, rules), rules)
+
+
+def _odds(table_a, table_b, rules: Rules) -> Odds:
+  chain = _build_chain(rules, lambda distance, close: (table_a[distance][close],), table_b)
+  win, tie, loss = _iterate(chain, np.eye(3))[0]
+  return Odds(win=float(win), tie=float(tie), loss=float(loss))
+
+
+def full_information_bound(opponent: PlayerStrategy, rules: Rules = Rules()) -> float:
+  """The best score possible against opponent by a player who sees everything.
+
+  This player picks each move knowing both players' current and saved steps,
+  which get_move is not told, so no PlayerStrategy can score higher.
+  """
+  chain = _build_chain(rules, lambda distance, close: (False, True), _table(opponent, rules))
+  return float(_iterate(chain, [[1.0], [TIE_VALUE], [0.0]])[0, 0])
+
+
+def threshold_table(go_while_under: int, go_while_under_near_finish: int,
+                    rules: Rules = Rules()) -> tuple:
+  """A table that goes until it has risked the given number of steps, then saves."""
+  return tuple((distance < go_while_under, distance < go_while_under_near_finish)
+               for distance in range(rules.steps + 1))
+
+
+def _bound(prefix, opponent_table, rules: Rules) -> float:
+  """The most any table starting with the rows in prefix can score.
+
+  After the prefix, A picks every move seeing the whole board, as in
+  full_information_bound(), which no table can do better than.
+  """
+  def choices(distance, close_to_finish):
+    if distance < len(prefix):
+      go = prefix[distance][close_to_finish]
+      return go, go
+    return False, True
+  chain = _build_chain(rules, choices, opponent_table)
+  return float(_iterate(chain, [[1.0], [TIE_VALUE], [0.0]])[0, 0])
+
+
+def _local_search(opponent_table, rules: Rules):
+  """Best threshold table, then improved one entry at a time until no change helps.
+
+  Quick, and usually close to the best, but it can get stuck short of it.
+  """
+  score = lambda table: _odds(table, opponent_table, rules).score
+  max_threshold = rules.steps // 2
+  best = max((threshold_table(far, near, rules)
+              for far, near in itertools.product(range(1, max_threshold + 1), repeat=2)),
+             key=score)
+  best_score = score(best)
+  improved = True
+  while improved:
+    improved = False
+    for distance, close in itertools.product(range(max_threshold + 2), (0, 1)):
+      rows = [list(row) for row in best]
+      rows[distance][close] = not rows[distance][close]
+      table = tuple(map(tuple, rows))
+      table_score = score(table)
+      if table_score > best_score + TOLERANCE:
+        best, best_score, improved = table, table_score, True
+  return best
+
+
+def _search(opponent_table, rules: Rules):
+  """The table that scores best against opponent_table, by branch and bound.
+
+  Tables are built a row (a distance_from_last_save) at a time, from 0. A
+  player only gets further from its save by going, so once a row stops in
+  both modes the rows after it are never used: the table is complete and
+  is scored exactly. A row that goes in either mode is only followed if
+  _bound() says a table starting that way could beat the best so far. The
+  better that starts, the more branches are cut, so it starts from
+  _local_search().
+  """
+  score = lambda table: _odds(table, opponent_table, rules).score
+  complete = lambda prefix: prefix + ((False, False),) * (rules.steps + 1 - len(prefix))
+  best = _local_search(opponent_table, rules)
+  best_score = score(best)
+
+  def branch(prefix):
+    nonlocal best, best_score
+    # Whatever the last row says, the player has finished by then.
+    if len(prefix) == rules.steps:
+      rows = [prefix + ((False, False),)]
+    else:
+      rows = [prefix + (row,) for row in ((False, False), (True, True), (True, False),
+                                          (False, True))]
+    table = complete(rows[0])
+    table_score = score(table)
+    if table_score > best_score + BOUND_MARGIN:
+      best, best_score = table, table_score
+    # Most promising first, so the best score rises early and prunes more.
+    bounds = sorted(((_bound(row, opponent_table, rules), row) for row in rows[1:]),
+                    reverse=True)
+    for bound, row in bounds:
+      if bound > best_score + BOUND_MARGIN:
+        branch(row)
+
+  branch(())
+  return best
+
+
+def _solution_key(opponent_table, rules: Rules) -> str:
+  moves = "".join("G" if go else "S" for row in opponent_table for go in row)
+  # "exact" tells these answers apart from those of the local search the
+  # solver used to do, which could be beaten.
+  return f"exact {dataclasses.astuple(rules)} {moves}"
+
+
+_solutions = None
+
+
+def solve(opponent: PlayerStrategy, rules: Rules = Rules(),
+          path: Optional[str] = SOLUTIONS_PATH) -> TableStrategy:
+  """The best strategy against opponent, as a TableStrategy.
+
+  The search evaluates candidates exactly, so it takes a little while the
+  first time; after that the answer is read back from path.
+  """
+  global _solutions
+  if _solutions is None:
+    _solutions = {}
+    if path and os.path.exists(path):
+      with open(path) as f:
+        _solutions = json.load(f)
+  opponent_table = _table(opponent, rules)
+  key = _solution_key(opponent_table, rules)
+  if key not in _solutions:
+    _solutions[key] = _search(opponent_table, rules)
+    if path:
+      with open(path, "w") as f:
+        json.dump(_solutions, f)
+  return TableStrategy(_solutions[key])
@@ -0,0 +1,12 @@
+import time
+
+import core.engine
+from daves_strategy import DavesStrategy
+from students_strategy import StudentsStrategy
+
+# Plays a million games without opening a window. Needs numpy.
+start = time.perf_counter()
+result = core.engine.simulate(DavesStrategy(), StudentsStrategy(), n_games=1_000_000, seed=0)
+elapsed = time.perf_counter() - start
+print(f"Dave wins {result.win_rate_a:.2%}, Student wins {result.win_rate_b:.2%}, "
+      f"ties {result.ties / result.games:.2%} ({result.games} games in {elapsed:.1f}s)")
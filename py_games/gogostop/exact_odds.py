@@ -0,0 +1,17 @@
+import core.solver
+from daves_strategy import DavesStrategy
+from students_strategy import StudentsStrategy
+
+# Exact odds from the Markov chain solver: no games are played. Needs numpy.
+odds = core.solver.win_probability(StudentsStrategy(), DavesStrategy())
+print(f"Student vs Dave: win {odds.win:.4%}, tie {odds.tie:.4%}, lose {odds.loss:.4%}")
+
+best = core.solver.solve(DavesStrategy())
+odds = core.solver.win_probability(best, DavesStrategy())
+print(f"Best strategy vs Dave: win {odds.win:.4%}, tie {odds.tie:.4%}, lose {odds.loss:.4%}")
+for close_to_finish in (False, True):
+  moves = " ".join("GO" if row[close_to_finish] else "STOP" for row in best.table[:13])
+  print(f"  close_to_finish={close_to_finish}, distance 0 to 12: {moves}")
+
+bound = core.solver.full_information_bound(DavesStrategy())
+print(f"Nobody can score more than {bound:.4%} against Dave, even seeing the whole board")
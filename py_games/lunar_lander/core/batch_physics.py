@@ -0,0 +1,182 @@
+"""Lunar lander physics for many landers at once, using NumPy arrays.
+
+This follows core/physics.py step for step (same GRAVITY, THRUST_POWER and
+SAFE_LANDING_SPEED), but every field is an array with one entry per lander.
+A policy is called with the velocity, altitude and fuel arrays and returns a
+boolean array saying which landers fire their thrusters this frame.
+"""
+
+import dataclasses
+
+import numpy as np
+
+from core.physics import (GRAVITY, INITIAL_FUEL, LANDER_HEIGHT, MAX_STEPS,
+                          SAFE_LANDING_SPEED, SCREEN_HEIGHT, START_Y, THRUST_POWER)
+
+# Number of landers sweep() flies at a time.
+CHUNK_SIZE = 1 << 14
+
+
+@dataclasses.dataclass
+class LanderBatch:
+    """The state of N landers. Every field is an array of length N."""
+    y: np.ndarray
+    velocity_y: np.ndarray
+    fuel: np.ndarray
+    landed: np.ndarray
+    crashed: np.ndarray
+
+    @classmethod
+    def create(cls, start_y=START_Y, initial_fuel=INITIAL_FUEL, velocity_y=0.0):
+        """Builds a batch. Arguments may be scalars or arrays and are broadcast."""
+        y, fuel, velocity_y = np.broadcast_arrays(
+            np.asarray(start_y, dtype=float),
+            np.asarray(initial_fuel, dtype=np.int64),
+            np.asarray(velocity_y, dtype=float))
+        y = y.ravel().copy()
+        return cls(y=y,
+                   velocity_y=velocity_y.ravel().copy(),
+                   fuel=fuel.ravel().copy(),
+                   landed=np.zeros(y.shape, dtype=bool),
+                   crashed=np.zeros(y.shape, dtype=bool))
+
+    def __len__(self):
+        return len(self.y)
+
+    @property
+    def altitude(self) -> np.ndarray:
+        return SCREEN_HEIGHT - self.y - LANDER_HEIGHT
+
+    @property
+    def active(self) -> np.ndarray:
+        return ~(self.landed | self.crashed)
+
+
+def step(batch: LanderBatch, thrusting: np.ndarray):
+    """Advances every lander that is still flying by one frame."""
+    # In-place ufuncs with where= are much cheaper than fancy indexing here.
+    active = batch.active
+    firing = active & thrusting & (batch.fuel > 0)
+    np.subtract(batch.velocity_y, THRUST_POWER, out=batch.velocity_y, where=firing)
+    np.subtract(batch.fuel, 1, out=batch.fuel, where=firing)
+
+    np.add(batch.velocity_y, GRAVITY, out=batch.velocity_y, where=active)
+    np.add(batch.y, batch.velocity_y, out=batch.y, where=active)
+
+    # --- Collision Detection ---
+    touched = active & (batch.y + LANDER_HEIGHT >= SCREEN_HEIGHT)
+    batch.y[touched] = SCREEN_HEIGHT - LANDER_HEIGHT
+    safe = np.abs(batch.velocity_y) <= SAFE_LANDING_SPEED
+    batch.landed |= touched & safe
+    batch.crashed |= touched & ~safe
+
+
+def simulate(policy, batch: LanderBatch, max_steps=MAX_STEPS) -> LanderBatch:
+    """Flies every lander in the batch until all have landed or crashed."""
+    for _ in range(max_steps):
+        if not batch.active.any():
+            break
+        step(batch, policy(batch.velocity_y, batch.altitude, batch.fuel))
+    return batch
+
+
+# --- Policies ---
+
+class ThresholdPolicy:
+    """Thrust whenever falling faster than a threshold, like BasicRobotStrategy.
+
+    velocity_threshold may be a scalar or one value per lander.
+    """
+
+    def __init__(self, velocity_threshold=0.75):
+        self.velocity_threshold = np.asarray(velocity_threshold, dtype=float)
+
+    def __call__(self, velocity, altitude, fuel):
+        return velocity > self.velocity_threshold
+
+
+class SuicideBurnPolicy:
+    """The SuperRobotStrategy burn, with a tunable burn point.
+
+    A lander starts its burn when its stopping distance times burn_scale
+    reaches its altitude and keeps thrusting from then on. burn_scale=1 is
+    exactly SuperRobotStrategy; bigger values start the burn earlier. It may be
+    a scalar or one value per lander. The policy remembers which landers have
+    started burning, so use a new one for every batch.
+    """
+
+    def __init__(self, burn_scale=1.0):
+        self.burn_scale = np.asarray(burn_scale, dtype=float)
+        self.thrust = None
+
+    def __call__(self, velocity, altitude, fuel):
+        if self.thrust is None:
+            self.thrust = np.zeros(velocity.shape, dtype=bool)
+        d = velocity * velocity / (THRUST_POWER - GRAVITY) / 2.0
+        self.thrust |= d * self.burn_scale >= altitude
+        return self.thrust
+
+
+class LookupTablePolicy:
+    """Looks the thrust decision up in a boolean table.
+
+    table[i, j] is the decision for altitudes in bin i and velocities in bin j.
+    Bins are given by their upper edges: bin i holds values up to and including
+    edges[i]. Values past the last edge use the last bin.
+    """
+
+    def __init__(self, table, altitude_edges, velocity_edges):
+        self.table = np.asarray(table, dtype=bool)
+        self.altitude_edges = np.asarray(altitude_edges, dtype=float)
+        self.velocity_edges = np.asarray(velocity_edges, dtype=float)
+
+    def __call__(self, velocity, altitude, fuel):
+        i = np.minimum(np.searchsorted(self.altitude_edges, altitude),
+                       len(self.altitude_edges) - 1)
+        j = np.minimum(np.searchsorted(self.velocity_edges, velocity),
+                       len(self.velocity_edges) - 1)
+        return self.table[i, j]
+
+
+# --- Sweeps ---
+
+@dataclasses.dataclass
+class SweepResult:
+    """Outcome of one policy over a grid of starting conditions."""
+    landed: np.ndarray  # bool, shape of the grid
+    fuel_used: np.ndarray  # int, shape of the grid
+
+    @property
+    def landing_rate(self) -> float:
+        return float(self.landed.mean())
+
+    @property
+    def mean_fuel_used(self) -> float:
+        """Average fuel used by the landers that landed safely."""
+        if not self.landed.any():
+            return float("nan")
+        return float(self.fuel_used[self.landed].mean())
+
+
+def sweep(policy_factory, start_ys, initial_velocities, initial_fuel=INITIAL_FUEL,
+          chunk_size=CHUNK_SIZE) -> SweepResult:
+    """Flies a policy from every combination of starting height and velocity.
+
+    The grid is flown in chunks that fit in the CPU cache, and a chunk stops as
+    soon as all of its landers are down. policy_factory is called once per
+    chunk, so any settings it passes to the policy should be scalars. The
+    results have shape (len(start_ys), len(initial_velocities)).
+    """
+    y_grid, velocity_grid = np.meshgrid(start_ys, initial_velocities, indexing="ij")
+    y_grid, velocity_grid = y_grid.ravel(), velocity_grid.ravel()
+    landed = np.empty(y_grid.shape, dtype=bool)
+    fuel_left = np.empty(y_grid.shape, dtype=np.int64)
+    for start in range(0, len(y_grid), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        batch = simulate(policy_factory(),
+                         LanderBatch.create(y_grid[chunk], initial_fuel, velocity_grid[chunk]))
+        landed[chunk] = batch.landed
+        fuel_left[chunk] = batch.fuel
+    shape = (len(start_ys), len(initial_velocities))
+    return SweepResult(landed=landed.reshape(shape),
+                       fuel_used=(initial_fuel - fuel_left).reshape(shape))
@@ -0,0 +1,143 @@
+"""Flight data recorder for the lunar lander.
+
+Every frame of a flight is packed into a fixed-size binary record: the state
+the strategy saw, what it decided and how long it took to decide. A recorded
+flight can be converted to CSV, played back in the game window faster than
+real time, or fed back into a (possibly modified) physics step to see where
+the physics and the recording part ways.
+"""
+
+import csv
+import dataclasses
+import struct
+
+from core import physics
+
+MAGIC = b"LLFR"
+VERSION = 1
+# magic, version, start_y, initial_fuel
+_HEADER = struct.Struct("<4sHdi")
+# frame, altitude, velocity, fuel, thrust, strategy latency in seconds
+_RECORD = struct.Struct("<Iddi?f")
+BUFFER_FRAMES = 1024
+
+
+@dataclasses.dataclass
+class Frame:
+    """What the strategy was told and what it answered, for one frame."""
+    frame: int
+    altitude: float
+    velocity: float
+    fuel: int
+    thrust: bool
+    latency: float  # seconds spent in get_thrust
+
+
+@dataclasses.dataclass
+class Flight:
+    """A whole recorded flight."""
+    start_y: float
+    initial_fuel: int
+    frames: list
+
+
+class FlightRecorder:
+    """Records one flight to a file.
+
+    Frames are packed into a preallocated buffer, which is written out and
+    reused each time it fills up, so recording costs no allocation per
+    frame. It does not wrap around and drop old frames: replaying a flight
+    starts from its first frame, so every frame is kept. Call close() when
+    the flight is over.
+    """
+
+    def __init__(self, path, start_y=physics.START_Y, initial_fuel=physics.INITIAL_FUEL,
+                 buffer_frames=BUFFER_FRAMES):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(_HEADER.pack(MAGIC, VERSION, start_y, initial_fuel))
+        self.buffer = bytearray(_RECORD.size * buffer_frames)
+        self.offset = 0
+        self.frame = 0
+
+    def record(self, altitude, velocity, fuel, thrust, latency):
+        _RECORD.pack_into(self.buffer, self.offset, self.frame,
+                          altitude, velocity, fuel, thrust, latency)
+        self.frame += 1
+        self.offset += _RECORD.size
+        if self.offset == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered frames to the file."""
+        self.file.write(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def read_flight(path) -> Flight:
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, start_y, initial_fuel = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} flight recording")
+    frames = [Frame(*record) for record in _RECORD.iter_unpack(data[_HEADER.size:])]
+    return Flight(start_y, initial_fuel, frames)
+
+
+def write_csv(flight: Flight, path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([field.name for field in dataclasses.fields(Frame)])
+        for frame in flight.frames:
+            writer.writerow(dataclasses.astuple(frame))
+
+
+class ReplayStrategy:
+    """Repeats the thrust decisions of a recorded flight, one per frame."""
+
+    def __init__(self, flight: Flight):
+        self.thrusts = [frame.thrust for frame in flight.frames]
+        self.frame = 0
+
+    def reset(self):
+        """Goes back to the start of the flight, for when the game restarts."""
+        self.frame = 0
+
+    def get_thrust(self, velocity: float, altitude: float, fuel: int) -> bool:
+        if self.frame >= len(self.thrusts):
+            return False
+        thrust = self.thrusts[self.frame]
+        self.frame += 1
+        return thrust
+
+
+def replay(flight: Flight, step=physics.step) -> list:
+    """Feeds the recorded thrust decisions through a physics step function.
+
+    Returns the state before every recorded frame, plus the final state. Pass
+    a modified step function to see how the same inputs fly under new physics.
+    """
+    state = physics.LanderState(y=flight.start_y, fuel=flight.initial_fuel)
+    states = []
+    for frame in flight.frames:
+        states.append(dataclasses.replace(state))
+        step(state, frame.thrust)
+    states.append(state)
+    return states
+
+
+def find_divergence(flight: Flight, step=physics.step):
+    """Returns the first frame whose replayed state differs from the recording.
+
+    Returns None if the replay matches the recording all the way through.
+    """
+    for frame, state in zip(flight.frames, replay(flight, step)):
+        if (state.altitude, state.velocity_y, state.fuel) != (
+                frame.altitude, frame.velocity, frame.fuel):
+            return frame
+    return None
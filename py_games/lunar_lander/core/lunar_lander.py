@@ -1,26 +1,24 @@
 import pygame
+import os
 import sys
 import random
-import math
+import time
 from enum import Enum
+from core import flight_recorder
+from core import physics
+# The physics constants used to live here, and strategies still import
+# GRAVITY, THRUST_POWER and SAFE_LANDING_SPEED from this module.
+from core.physics import (GRAVITY, INITIAL_FUEL, LANDER_HEIGHT, SAFE_LANDING_SPEED,
+                          SCREEN_HEIGHT, THRUST_POWER)
 
 # --- Constants ---
 SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-GRAVITY = 0.08  # Adjusted for smoother gameplay
-THRUST_POWER = 0.10 # Adjusted for smoother gameplay
-INITIAL_FUEL = 225
 LANDING_PAD_WIDTH = 100
-LANDER_HEIGHT = 60
 LANDER_WIDTH = 50
 ROCKET_WITH_FLAME_PATH = "assets/rocket_with_flame.png"
 ROCKET_WITH_NO_FLAME_PATH = "assets/rocket_with_no_flame.png"
 ROCKET_CRASHED_PATH = "assets/rocket_crashed.png"
 
-SAFE_LANDING_SPEED = 1
-
-
-# Maximum vertical speed for a safe landing
 FPS = 60
 THRUST_SOUND_PATH = "assets/thruster.wav"
 OUT_OF_FUEL_SOUND_PATH = "assets/out_of_fuel.wav"
@@ -51,23 +49,10 @@ class LanderSound(Enum):
     CRASH = 3
     VICTORY = 4
 
-class Lander:
-    """Represents the lunar lander."""
+class LanderAssets:
+    """The lander's images and sounds, loaded from disk once per game."""
 
-    def __init__(self, screen, x, y, initial_fuel=INITIAL_FUEL):
-        """Initializes the lander."""
-        self.screen = screen
-        self.x = x
-        self.y = y
-        self.velocity_y = 0
-        self.fuel = initial_fuel
-        self.crashed = False
-        self.landed = False
-        self.width = LANDER_WIDTH
-        self.height = LANDER_HEIGHT
-        self.flame_on = False
-        self.sound = LanderSound.NONE
-        self.last_sound = LanderSound.NONE
+    def __init__(self):
         self.soundboard = {}
         self.soundboard[LanderSound.THRUSTER] = pygame.mixer.Sound(THRUST_SOUND_PATH)
         self.soundboard[LanderSound.OUT_OF_FUEL] = pygame.mixer.Sound(OUT_OF_FUEL_SOUND_PATH)
@@ -80,43 +65,101 @@ class Lander:
         self.rocket_images[RocketImage.CRASHED] = pygame.image.load(ROCKET_CRASHED_PATH)
 
         for key, value in self.rocket_images.items():
-            self.rocket_images[key] = pygame.transform.scale(value, (self.width, self.height))
+            self.rocket_images[key] = pygame.transform.scale(value, (LANDER_WIDTH, LANDER_HEIGHT))
+
+
+class CachedText:
+    """A line of text that is only rendered again when its contents change."""
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.text = None
+        self.surface = None
+
+    def render(self, text):
+        """Returns the rendered surface for the text."""
+        if text != self.text:
+            self.text = text
+            self.surface = self.font.render(text, True, self.color)
+        return self.surface
+
+
+class Lander:
+    """Represents the lunar lander."""
+
+    def __init__(self, screen, x, y, initial_fuel=INITIAL_FUEL, assets=None, state=None):
+        """Initializes the lander.
+
+        state is the physical state to fly, for a lander with more physics
+        than a physics.LanderState. If given, y and initial_fuel are ignored.
+        """
+        self.screen = screen
+        self.x = x
+        if state is None:
+            state = physics.LanderState(y=y, fuel=initial_fuel)
+        self.state = state
+        self.width = LANDER_WIDTH
+        self.height = LANDER_HEIGHT
+        self.sound = LanderSound.NONE
+        self.last_sound = LanderSound.NONE
+        if assets is None:
+            assets = LanderAssets()
+        self.soundboard = assets.soundboard
+        self.rocket_images = assets.rocket_images
 
         self.draw(screen)  # Draw the lander shape onto the surface
 
 
-    def update(self, thrusting):
+    # The physical state lives in a physics.LanderState so that it can also be
+    # simulated without pygame. These properties keep the old attribute names.
+    @property
+    def y(self):
+        return self.state.y
+
+    @property
+    def velocity_y(self):
+        return self.state.velocity_y
+
+    @property
+    def fuel(self):
+        return self.state.fuel
+
+    @property
+    def crashed(self):
+        return self.state.crashed
+
+    @property
+    def landed(self):
+        return self.state.landed
+
+    @property
+    def flame_on(self):
+        return self.state.flame_on
+
+    def update(self, *controls):
         """Updates the lander's position and state."""
-        if not self.crashed and not self.landed:
-            if thrusting and self.fuel > 0:
-                self.velocity_y -= THRUST_POWER
-                self.fuel -= 1  # Consume less fuel per frame
-                self.flame_on = True
-                self.sound = LanderSound.THRUSTER
-            else:
-                self.flame_on = False
-                if self.fuel <= 0:
-                    self.sound = LanderSound.OUT_OF_FUEL
-                else:
-                    self.sound = LanderSound.NONE
-
-            self.velocity_y += GRAVITY
-            self.y += self.velocity_y
-
-            # --- Collision Detection ---
-            if self.y + self.height >= SCREEN_HEIGHT:  # Ground collision
-                # Check for landing or crash
-                if self.y + self.height > SCREEN_HEIGHT: #make sure the lander stops *at* the ground
-                    self.y = SCREEN_HEIGHT - self.height
-                    #self.velocity_y = 0 #ensure that the lander does not go through the floor
-                if abs(self.velocity_y) <= SAFE_LANDING_SPEED:
-                    self.landed = True
-                    self.sound = LanderSound.VICTORY
-                else:
-                    self.crashed = True
-
-                    self.sound = LanderSound.CRASH
-                #self.velocity_y = 0 #Stop on collision, landed or crashed
+        if self.state.done:
+            return
+        self.step(*controls)
+        self.choose_sound()
+
+    def step(self, thrusting):
+        """Moves the lander one frame under the controls."""
+        physics.step(self.state, thrusting)
+
+    def choose_sound(self):
+        """Picks the sound for the state the lander has just reached."""
+        if self.landed:
+            self.sound = LanderSound.VICTORY
+        elif self.crashed:
+            self.sound = LanderSound.CRASH
+        elif self.flame_on:
+            self.sound = LanderSound.THRUSTER
+        elif self.fuel <= 0:
+            self.sound = LanderSound.OUT_OF_FUEL
+        else:
+            self.sound = LanderSound.NONE
 
     def draw(self, screen):
         """Draws the lander on the screen."""
@@ -154,17 +197,41 @@ class LandingPad:
 
 class Game:
     """Manages the game state and logic."""
-    def __init__(self, strategy, event_receivers = [], initial_fuel=INITIAL_FUEL):
-        """Initializes the game."""
+    CAPTION = "Lunar Lander"
+    MESSAGE_Y = SCREEN_HEIGHT // 2  # where the end of game messages go
+
+    def __init__(self, strategy, event_receivers = [], initial_fuel=INITIAL_FUEL,
+                 record_dir=None, speed=1.0, start_y=physics.START_Y):
+        """Initializes the game.
+
+        If record_dir is given, every flight is saved there by the flight
+        recorder, and its path added to recordings. speed > 1 runs the game
+        faster than real time. start_y is how high the lander starts.
+        """
         self.initial_fuel = initial_fuel
+        self.start_y = start_y
         self.event_receivers = event_receivers
         self.strategy = strategy
+        self.record_dir = record_dir
+        self.speed = speed
+        self.recorder = None
+        self.recordings = []
+        self.flight_count = 0
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.mixer.init
-        pygame.display.set_caption("Lunar Lander")
+        pygame.display.set_caption(self.CAPTION)
         self.clock = pygame.time.Clock()
+
+        # Load everything once here, rather than on every reset or frame.
+        self.assets = LanderAssets()
+        font = pygame.font.Font(None, 30)
+        big_font = pygame.font.Font(None, 50)
+        self.game_over_text = big_font.render("Game Over! You Crashed!", True, RED)
+        self.landing_text = big_font.render("You Landed Safely!", True, GREEN)
+        self.reset_text = font.render("Press 'R' to restart", True, WHITE)
         self.reset()
+        self.status_texts = [CachedText(font, WHITE) for _ in self.status()]
 
     def reset(self):
         """Resets the game state."""
@@ -175,17 +242,42 @@ class Game:
         self.landing_pad = LandingPad(self.landing_pad_x, SCREEN_HEIGHT - 10, LANDING_PAD_WIDTH)
 
         #Lander
-        self.lander = Lander(self.
-                             screen, SCREEN_WIDTH // 2, 50, self.initial_fuel)
+        self.lander = Lander(self.screen, SCREEN_WIDTH // 2, self.start_y, self.initial_fuel,
+                             self.assets)
         self.lander.landing_pad_x = self.landing_pad_x #Give the lander object access to the landing pad
         self.playing = True
+        # Strategies that keep track of the flight, like a replay, start again too.
+        if hasattr(self.strategy, "reset"):
+            self.strategy.reset()
+
+        #Flight recorder
+        self.stop_recording()
+        if self.record_dir is not None:
+            os.makedirs(self.record_dir, exist_ok=True)
+            self.flight_count += 1
+            path = os.path.join(self.record_dir, time.strftime("flight_%Y%m%d_%H%M%S")
+                                + f"_{self.flight_count}.bin")
+            self.recorder = flight_recorder.FlightRecorder(path, self.start_y, self.initial_fuel)
+
+    def stop_recording(self):
+        """Finishes writing the current flight, if one is being recorded.
+
+        Returns the path it was saved to, or None.
+        """
+        if self.recorder is None:
+            return None
+        self.recorder.close()
+        path = self.recorder.path
+        self.recordings.append(path)
+        self.recorder = None
+        return path
 
     def run(self):
         """Main game loop."""
         while True:
-            thrusting = False #Assume not thrusting unless key is pressed
             for event in pygame.event.get():
               if event.type == pygame.QUIT:
+                self.stop_recording()
                 pygame.quit()
                 sys.exit()
 
@@ -197,43 +289,55 @@ class Game:
                 event_receiver.set_keys(keys)
 
             if self.playing:
-                altitude = (SCREEN_HEIGHT) - self.lander.y - LANDER_HEIGHT
-                if self.strategy.get_thrust(self.lander.velocity_y, altitude, self.lander.fuel):
-                    thrusting = True
-                self.lander.update(thrusting)
+                self.fly()
 
             if self.lander.crashed or self.lander.landed:
                 self.playing = False
+                self.stop_recording()
 
             self.draw()
             self.lander.play_sound()
-            self.clock.tick(FPS)
-
-    def draw(self):
-        """Draws all game elements."""
+            self.clock.tick(FPS * self.speed)
+
+    def fly(self):
+        """Asks the strategy what to do and moves the lander one frame."""
+        thrusting = False #Assume not thrusting unless key is pressed
+        altitude = self.lander.state.altitude
+        start = time.perf_counter()
+        if self.strategy.get_thrust(self.lander.velocity_y, altitude, self.lander.fuel):
+            thrusting = True
+        latency = time.perf_counter() - start
+        if self.recorder is not None:
+            self.recorder.record(altitude, self.lander.velocity_y, self.lander.fuel,
+                                 thrusting, latency)
+        self.lander.update(thrusting)
+
+    def status(self):
+        """The lines of text in the top left corner."""
+        return [f"Fuel: {self.lander.fuel:.0f}", f"Speed: {self.lander.velocity_y:.2f}"]
+
+    def draw_scene(self):
+        """Draws everything but the text."""
         self.screen.fill(BLACK)
         self.lander.draw(self.screen)
         self.landing_pad.draw(self.screen)
 
+    def draw(self):
+        """Draws all game elements."""
+        self.draw_scene()
+
         # --- UI Elements ---
-        # Fuel Display
-        fuel_text = pygame.font.Font(None, 30).render(f"Fuel: {self.lander.fuel:.0f}", True, WHITE)
-        self.screen.blit(fuel_text, (10, 10))
-        # Vertical velocity
-        velocity_text = pygame.font.Font(None, 30).render(f"Speed: {self.lander.velocity_y:.2f}", True, WHITE)
-        self.screen.blit(velocity_text, (10, 40))
+        for i, (text, line) in enumerate(zip(self.status_texts, self.status())):
+            self.screen.blit(text.render(line), (10, 10 + 30 * i))
 
         # Game Over Message
         if self.lander.crashed:
-            game_over_text = pygame.font.Font(None, 50).render("Game Over! You Crashed!", True, RED)
-            self.screen.blit(game_over_text, (SCREEN_WIDTH // 4 -50, SCREEN_HEIGHT // 2))
+            self.screen.blit(self.game_over_text, (SCREEN_WIDTH // 4 -50, self.MESSAGE_Y))
         elif self.lander.landed:
-            landing_text = pygame.font.Font(None, 50).render("You Landed Safely!", True, GREEN)
-            self.screen.blit(landing_text, (SCREEN_WIDTH // 4 , SCREEN_HEIGHT // 2))
+            self.screen.blit(self.landing_text, (SCREEN_WIDTH // 4 , self.MESSAGE_Y))
 
         if not self.playing:
-            reset_text = pygame.font.Font(None, 30).render("Press 'R' to restart", True, WHITE)
-            self.screen.blit(reset_text, (SCREEN_WIDTH // 3, SCREEN_HEIGHT // 2 + 50))
+            self.screen.blit(self.reset_text, (SCREEN_WIDTH // 3, self.MESSAGE_Y + 50))
 
         pygame.display.flip()
 
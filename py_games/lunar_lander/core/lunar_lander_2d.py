@@ -0,0 +1,84 @@
+"""The 2D lunar lander game: steer sideways onto a pad among random hills."""
+
+import pygame
+import random
+from core import physics_2d
+from core.lunar_lander import BLACK, GRAY, YELLOW, Game, Lander, LandingPad
+from core.physics_2d import INITIAL_FUEL, LANDING_PAD_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH, Side
+
+SIDE_FLAME_LENGTH = 12
+
+
+class Lander2D(Lander):
+    """The lander, flying over terrain with side thrusters."""
+
+    def __init__(self, screen, state, terrain, assets):
+        """Initializes the lander."""
+        self.terrain = terrain
+        super().__init__(screen, state.x, state.y, assets=assets, state=state)
+
+    @property
+    def velocity_x(self):
+        return self.state.velocity_x
+
+    def step(self, thrusting, side=Side.NONE):
+        """Moves the lander one frame under the controls."""
+        physics_2d.step(self.state, self.terrain, thrusting, side)
+        self.x = self.state.x
+
+    def draw(self, screen):
+        """Draws the lander, and a small flame for a firing side thruster."""
+        super().draw(screen)
+        if self.state.side == Side.NONE or self.state.done:
+            return
+        # Pushing right means the jet comes out of the left side.
+        if self.state.side == Side.RIGHT:
+            edge, direction = self.x, -1
+        else:
+            edge, direction = self.x + self.width, 1
+        middle = self.y + self.height // 2
+        pygame.draw.polygon(screen, YELLOW, [
+            (edge, middle - 4),
+            (edge, middle + 4),
+            (edge + direction * SIDE_FLAME_LENGTH, middle),
+        ])
+
+
+class Game2D(Game):
+    """Manages the 2D game state and logic."""
+    CAPTION = "Lunar Lander 2D"
+    MESSAGE_Y = SCREEN_HEIGHT // 3  # above the hills
+
+    def __init__(self, strategy, event_receivers=[], seed=None):
+        """Initializes the game. A seed makes the terrain and starts repeatable."""
+        self.rng = random.Random(seed)
+        super().__init__(strategy, event_receivers, INITIAL_FUEL)
+
+    def reset(self):
+        """Makes new terrain and starts a new descent."""
+        self.terrain = physics_2d.Terrain.generate(self.rng)
+        self.lander = Lander2D(self.screen, physics_2d.random_start(self.rng), self.terrain,
+                               self.assets)
+        self.playing = True
+
+        # The terrain never changes during a descent, so draw it once.
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background.fill(BLACK)
+        outline = list(enumerate(self.terrain.heights))
+        pygame.draw.polygon(self.background, GRAY,
+                            outline + [(SCREEN_WIDTH - 1, SCREEN_HEIGHT), (0, SCREEN_HEIGHT)])
+        LandingPad(self.terrain.pad_x, self.terrain.pad_y, LANDING_PAD_WIDTH).draw(self.background)
+
+    def fly(self):
+        """Asks the strategy what to do and moves the lander one frame."""
+        thrusting, side = physics_2d.get_controls(self.strategy, self.lander.state, self.terrain)
+        self.lander.update(thrusting, side)
+
+    def status(self):
+        """The lines of text in the top left corner."""
+        return super().status() + [f"Sideways speed: {self.lander.velocity_x:.2f}"]
+
+    def draw_scene(self):
+        """Draws everything but the text."""
+        self.screen.blit(self.background, (0, 0))
+        self.lander.draw(self.screen)
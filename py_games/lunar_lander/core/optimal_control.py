@@ -0,0 +1,145 @@
+"""Minimum-fuel landing policy for the lunar lander, found by dynamic programming.
+
+The solver works on a grid of (altitude, velocity) states. For every state it
+finds the least fuel needed to touch down safely, and whether the first move
+of that cheapest landing is to thrust. Fuel does not need to be part of the
+grid: the cheapest landing is the same whatever is in the tank, and the tank
+only decides whether that landing is possible at all.
+
+The result is saved as a packed bit array (one bit per state), so a strategy
+can load it and answer get_thrust with a single table lookup. A Solution is
+also a policy for core/batch_physics.py. Needs numpy.
+"""
+
+import dataclasses
+import os
+
+import numpy as np
+
+from core.physics import GRAVITY, SAFE_LANDING_SPEED, THRUST_POWER
+
+# --- Grid ---
+ALTITUDE_STEP = 0.5
+MAX_ALTITUDE = 600
+VELOCITY_STEP = 0.02  # THRUST_POWER - GRAVITY, so velocities stay on the grid
+MIN_VELOCITY = -3.0
+MAX_VELOCITY = 10.0
+# Aim a little under SAFE_LANDING_SPEED to absorb the rounding to the grid.
+LANDING_SPEED_MARGIN = 0.1
+
+# Fuel cost of states that cannot land safely.
+UNREACHABLE = np.iinfo(np.int32).max // 2
+
+TABLE_PATH = "assets/optimal_thrust_table.npz"
+
+
+@dataclasses.dataclass
+class Solution:
+    """The solved policy over the (altitude, velocity) grid."""
+    thrust: np.ndarray  # bool, thrust[altitude_index, velocity_index]
+    fuel_needed: np.ndarray  # int, UNREACHABLE where no safe landing exists
+    altitude_step: float = ALTITUDE_STEP
+    min_velocity: float = MIN_VELOCITY
+    velocity_step: float = VELOCITY_STEP
+
+    def index(self, velocity: float, altitude: float) -> tuple[int, int]:
+        """Returns the grid cell nearest to a state, clamped to the grid."""
+        n_altitudes, n_velocities = self.thrust.shape
+        i = min(max(round(altitude / self.altitude_step), 0), n_altitudes - 1)
+        j = min(max(round((velocity - self.min_velocity) / self.velocity_step), 0),
+                n_velocities - 1)
+        return i, j
+
+    def get_thrust(self, velocity: float, altitude: float) -> bool:
+        return bool(self.thrust[self.index(velocity, altitude)])
+
+    def __call__(self, velocity, altitude, fuel):
+        """Batch policy for core/batch_physics.py."""
+        n_altitudes, n_velocities = self.thrust.shape
+        i = np.clip(np.rint(altitude / self.altitude_step), 0, n_altitudes - 1).astype(np.int64)
+        j = np.clip(np.rint((velocity - self.min_velocity) / self.velocity_step),
+                    0, n_velocities - 1).astype(np.int64)
+        return self.thrust[i, j]
+
+
+def solve(altitude_step=ALTITUDE_STEP, max_altitude=MAX_ALTITUDE,
+          velocity_step=VELOCITY_STEP, min_velocity=MIN_VELOCITY,
+          max_velocity=MAX_VELOCITY,
+          landing_speed=SAFE_LANDING_SPEED - LANDING_SPEED_MARGIN) -> Solution:
+    """Runs value iteration until the fuel needed from every state is settled."""
+    altitudes = np.arange(0, max_altitude + altitude_step / 2, altitude_step)
+    velocities = np.arange(min_velocity, max_velocity + velocity_step / 2, velocity_step)
+    shape = (len(altitudes), len(velocities))
+
+    # For each action, where every state goes next. Each frame uses
+    # physics.step: thrust, add gravity, then move.
+    moves = []
+    for thrusting in (False, True):
+        next_velocity = velocities + GRAVITY - (THRUST_POWER if thrusting else 0)
+        next_altitude = altitudes[:, None] - next_velocity[None, :]
+        next_velocity = np.broadcast_to(next_velocity, shape)
+        touchdown = next_altitude <= 0
+        i = np.rint(next_altitude / altitude_step).astype(np.int64)
+        j = np.rint((next_velocity - min_velocity) / velocity_step).astype(np.int64)
+        in_grid = (i < len(altitudes)) & (j >= 0) & (j < len(velocities))
+        flying = ~touchdown & in_grid
+        next_index = np.where(flying, i * len(velocities) + j, 0).ravel()
+        # Touching down costs nothing more if slow enough and is fatal if not.
+        # Flying off the grid counts as fatal too.
+        end_cost = np.where(touchdown & (np.abs(next_velocity) <= landing_speed),
+                            0, UNREACHABLE).ravel()
+        moves.append((flying.ravel(), next_index, end_cost, int(thrusting)))
+
+    fuel_needed = np.full(len(altitudes) * len(velocities), UNREACHABLE, dtype=np.int64)
+    while True:
+        costs = [np.where(flying, np.minimum(fuel_needed[next_index] + fuel, UNREACHABLE),
+                          end_cost + fuel)
+                 for flying, next_index, end_cost, fuel in moves]
+        updated = np.minimum(costs[0], costs[1])
+        if np.array_equal(updated, fuel_needed):
+            break
+        fuel_needed = updated
+
+    # Coast on ties: of two equally cheap landings, burn as late as possible.
+    thrust = costs[1] < costs[0]
+    # Where no safe landing exists, slow down as much as we can.
+    thrust |= fuel_needed >= UNREACHABLE
+    return Solution(thrust=thrust.reshape(shape),
+                    fuel_needed=np.minimum(fuel_needed, UNREACHABLE).reshape(shape),
+                    altitude_step=altitude_step,
+                    min_velocity=min_velocity,
+                    velocity_step=velocity_step)
+
+
+def save(solution: Solution, path=TABLE_PATH):
+    np.savez_compressed(
+        path,
+        shape=solution.thrust.shape,
+        thrust=np.packbits(solution.thrust),
+        fuel_needed=np.minimum(solution.fuel_needed, np.iinfo(np.uint16).max).astype(np.uint16),
+        grid=(solution.altitude_step, solution.min_velocity, solution.velocity_step),
+        physics=(GRAVITY, THRUST_POWER, SAFE_LANDING_SPEED))
+
+
+def load(path=TABLE_PATH) -> Solution:
+    """Loads a saved solution, solving and saving it first if needed.
+
+    The table is solved again if it was made with different physics constants.
+    """
+    if os.path.exists(path):
+        with np.load(path) as data:
+            if tuple(data["physics"]) == (GRAVITY, THRUST_POWER, SAFE_LANDING_SPEED):
+                shape = tuple(data["shape"])
+                fuel_needed = data["fuel_needed"].astype(np.int64)
+                fuel_needed[fuel_needed == np.iinfo(np.uint16).max] = UNREACHABLE
+                altitude_step, min_velocity, velocity_step = data["grid"]
+                return Solution(
+                    thrust=np.unpackbits(data["thrust"], count=shape[0] * shape[1])
+                    .astype(bool).reshape(shape),
+                    fuel_needed=fuel_needed,
+                    altitude_step=float(altitude_step),
+                    min_velocity=float(min_velocity),
+                    velocity_step=float(velocity_step))
+    solution = solve()
+    save(solution, path)
+    return solution
@@ -0,0 +1,121 @@
+"""Headless lunar lander physics.
+
+Nothing in here touches pygame, so a whole descent can be simulated in a few
+microseconds. The game in core/lunar_lander.py uses the same step() function
+once per frame.
+"""
+
+import dataclasses
+import random
+
+# --- Constants ---
+SCREEN_HEIGHT = 600
+LANDER_HEIGHT = 60
+GRAVITY = 0.08  # Adjusted for smoother gameplay
+THRUST_POWER = 0.10 # Adjusted for smoother gameplay
+INITIAL_FUEL = 225
+START_Y = 50
+# Maximum vertical speed for a safe landing
+SAFE_LANDING_SPEED = 1
+# Give up on descents that never reach the ground (e.g. hovering forever).
+MAX_STEPS = 10000
+
+
+@dataclasses.dataclass
+class LanderState:
+    """The physical state of the lander. y grows downwards, like the screen."""
+    y: float = START_Y
+    velocity_y: float = 0
+    fuel: int = INITIAL_FUEL
+    landed: bool = False
+    crashed: bool = False
+    flame_on: bool = False
+
+    @property
+    def altitude(self) -> float:
+        """Distance from the bottom of the lander to the ground."""
+        return SCREEN_HEIGHT - self.y - LANDER_HEIGHT
+
+    @property
+    def done(self) -> bool:
+        return self.landed or self.crashed
+
+
+def step(state: LanderState, thrusting: bool):
+    """Advances the lander by one frame."""
+    if state.done:
+        return
+    if thrusting and state.fuel > 0:
+        state.velocity_y -= THRUST_POWER
+        state.fuel -= 1
+        state.flame_on = True
+    else:
+        state.flame_on = False
+
+    state.velocity_y += GRAVITY
+    state.y += state.velocity_y
+
+    # --- Collision Detection ---
+    if state.y + LANDER_HEIGHT >= SCREEN_HEIGHT:  # Ground collision
+        # Make sure the lander stops *at* the ground
+        state.y = SCREEN_HEIGHT - LANDER_HEIGHT
+        if abs(state.velocity_y) <= SAFE_LANDING_SPEED:
+            state.landed = True
+        else:
+            state.crashed = True
+
+
+def simulate(strategy, initial_fuel=INITIAL_FUEL, start_y=START_Y,
+             max_steps=MAX_STEPS) -> LanderState:
+    """Flies a whole descent with the given strategy and returns the final state.
+
+    strategy is anything with get_thrust(velocity, altitude, fuel), the same
+    interface the game uses.
+    """
+    state = LanderState(y=start_y, fuel=initial_fuel)
+    for _ in range(max_steps):
+        thrusting = strategy.get_thrust(state.velocity_y, state.altitude, state.fuel)
+        step(state, thrusting)
+        if state.done:
+            break
+    return state
+
+
+@dataclasses.dataclass
+class Evaluation:
+    """Summary of a batch of descents."""
+    runs: int = 0
+    landed: int = 0
+    crashed: int = 0
+    fuel_used: int = 0
+
+    @property
+    def timed_out(self) -> int:
+        return self.runs - self.landed - self.crashed
+
+    @property
+    def landing_rate(self) -> float:
+        return self.landed / self.runs if self.runs else 0.0
+
+    @property
+    def mean_fuel_used(self) -> float:
+        return self.fuel_used / self.runs if self.runs else 0.0
+
+
+def evaluate(strategy_factory, runs=10000, seed=None,
+             start_y_range=(0, 400), fuel_range=(50, INITIAL_FUEL)) -> Evaluation:
+    """Scores a strategy over many randomized starts.
+
+    strategy_factory is called once per descent (a strategy class works), so
+    strategies that remember things between frames start fresh every time.
+    """
+    rng = random.Random(seed)
+    result = Evaluation()
+    for _ in range(runs):
+        initial_fuel = rng.randint(*fuel_range)
+        state = simulate(strategy_factory(), initial_fuel, rng.uniform(*start_y_range))
+        result.runs += 1
+        result.landed += state.landed
+        result.crashed += state.crashed
+        result.fuel_used += initial_fuel - state.fuel
+    return result
@@ -0,0 +1,210 @@
+"""Headless physics for the 2D lunar lander.
+
+The 2D lander also drifts sideways and has two small side thrusters. The
+ground is random terrain with one flat landing pad, and the lander only
+survives if it touches down on the pad, slowly, in both directions.
+
+Terrain collision does not test pixels. Each Terrain precomputes, for every
+column the lander's left edge can be in, the highest ground under the whole
+lander, so finding the ground under the lander is one list lookup.
+"""
+
+import collections
+import dataclasses
+import random
+from enum import Enum
+
+from core.physics import (GRAVITY, LANDER_HEIGHT, MAX_STEPS, SAFE_LANDING_SPEED,
+                          SCREEN_HEIGHT, START_Y, THRUST_POWER, Evaluation)
+
+# --- Constants ---
+SCREEN_WIDTH = 800
+LANDER_WIDTH = 50
+LANDING_PAD_WIDTH = 100
+INITIAL_FUEL = 500
+SIDE_THRUST_POWER = 0.05
+# Maximum horizontal speed for a safe landing
+SAFE_HORIZONTAL_SPEED = 0.5
+MAX_START_SPEED_X = 1.0
+# Terrain is a random walk between control points this far apart.
+TERRAIN_STEP = 40
+MIN_GROUND_Y = SCREEN_HEIGHT - 250
+MAX_GROUND_Y = SCREEN_HEIGHT - 20
+
+
+class Side(Enum):
+    """Which way the side thrusters push the lander."""
+    NONE = 0
+    LEFT = -1
+    RIGHT = 1
+
+
+# The change in velocity_x from each side thruster, looked up rather than
+# worked out from Side.value, which is slow to read.
+_SIDE_PUSH = {side: side.value * SIDE_THRUST_POWER for side in Side}
+
+
+class Terrain:
+    """The ground, as the screen y of its surface in every pixel column."""
+
+    def __init__(self, heights, pad_x):
+        self.heights = heights
+        self.pad_x = pad_x
+        # ground_under[x] is the highest ground (smallest y) under a lander
+        # whose left edge is in column x: a sliding-window minimum.
+        self.ground_under = []
+        window = collections.deque()
+        for right in range(len(heights)):
+            while window and heights[window[-1]] >= heights[right]:
+                window.pop()
+            window.append(right)
+            left = right - LANDER_WIDTH + 1
+            if left >= 0:
+                if window[0] < left:
+                    window.popleft()
+                self.ground_under.append(heights[window[0]])
+
+    @classmethod
+    def generate(cls, rng=random):
+        """Makes random hills with a flat landing pad somewhere on them."""
+        n_points = SCREEN_WIDTH // TERRAIN_STEP + 1
+        points = [rng.randint(MIN_GROUND_Y + 50, MAX_GROUND_Y)]
+        for _ in range(n_points - 1):
+            points.append(min(max(points[-1] + rng.randint(-60, 60), MIN_GROUND_Y), MAX_GROUND_Y))
+        heights = []
+        for x in range(SCREEN_WIDTH):
+            i, t = divmod(x, TERRAIN_STEP)
+            heights.append(round(points[i] + (points[i + 1] - points[i]) * t / TERRAIN_STEP))
+
+        pad_x = rng.randint(0, SCREEN_WIDTH - LANDING_PAD_WIDTH)
+        # Dig the pad in at the lowest ground under it.
+        pad_y = max(heights[pad_x:pad_x + LANDING_PAD_WIDTH])
+        heights[pad_x:pad_x + LANDING_PAD_WIDTH] = [pad_y] * LANDING_PAD_WIDTH
+        return cls(heights, pad_x)
+
+    @property
+    def pad_y(self) -> int:
+        return self.heights[self.pad_x]
+
+    def ground_y(self, x: float) -> int:
+        """The highest ground under a lander whose left edge is at x."""
+        return self.ground_under[int(x)]
+
+    def on_pad(self, x: float) -> bool:
+        return self.pad_x <= x and x + LANDER_WIDTH <= self.pad_x + LANDING_PAD_WIDTH
+
+    def pad_offset(self, x: float) -> float:
+        """How far the pad's center is to the right of the lander's center."""
+        return (self.pad_x + LANDING_PAD_WIDTH / 2) - (x + LANDER_WIDTH / 2)
+
+
+@dataclasses.dataclass
+class LanderState2D:
+    """The physical state of the 2D lander. y grows downwards, like the screen."""
+    x: float
+    y: float = START_Y
+    velocity_x: float = 0
+    velocity_y: float = 0
+    fuel: int = INITIAL_FUEL
+    landed: bool = False
+    crashed: bool = False
+    flame_on: bool = False
+    side: Side = Side.NONE
+
+    def altitude(self, terrain: Terrain) -> float:
+        """Distance from the bottom of the lander to the ground under it."""
+        return terrain.ground_y(self.x) - self.y - LANDER_HEIGHT
+
+    @property
+    def done(self) -> bool:
+        return self.landed or self.crashed
+
+
+def step(state: LanderState2D, terrain: Terrain, thrusting: bool, side: Side = Side.NONE):
+    """Advances the lander by one frame. Every thruster that fires uses 1 fuel."""
+    if state.landed or state.crashed:
+        return
+    state.flame_on = thrusting and state.fuel > 0
+    if state.flame_on:
+        state.velocity_y -= THRUST_POWER
+        state.fuel -= 1
+    state.side = side if state.fuel > 0 else Side.NONE
+    if state.side is not Side.NONE:
+        state.velocity_x += _SIDE_PUSH[state.side]
+        state.fuel -= 1
+
+    state.velocity_y += GRAVITY
+    state.x += state.velocity_x
+    state.y += state.velocity_y
+
+    # The edges of the screen are walls.
+    if state.x < 0:
+        state.x = 0
+        state.velocity_x = 0
+    elif state.x > SCREEN_WIDTH - LANDER_WIDTH:
+        state.x = SCREEN_WIDTH - LANDER_WIDTH
+        state.velocity_x = 0
+
+    # --- Collision Detection ---
+    ground_y = terrain.ground_under[int(state.x)]
+    if state.y + LANDER_HEIGHT >= ground_y:
+        state.y = ground_y - LANDER_HEIGHT
+        if (terrain.on_pad(state.x)
+                and abs(state.velocity_y) <= SAFE_LANDING_SPEED
+                and abs(state.velocity_x) <= SAFE_HORIZONTAL_SPEED):
+            state.landed = True
+        else:
+            state.crashed = True
+
+
+def get_controls(strategy, state: LanderState2D, terrain: Terrain):
+    """Asks a strategy for its (thrust, side) controls for this frame."""
+    return strategy.get_controls(state.velocity_x, state.velocity_y, state.altitude(terrain),
+                                 terrain.pad_offset(state.x), state.fuel)
+
+
+def simulate(strategy, terrain: Terrain, state: LanderState2D,
+             max_steps=MAX_STEPS) -> LanderState2D:
+    """Flies a whole descent and returns the final state.
+
+    strategy is anything with
+    get_controls(velocity_x, velocity_y, altitude, pad_offset, fuel), which
+    returns (thrust, side).
+    """
+    # get_controls() with the terrain lookups inlined, as evaluate() spends
+    # nearly all its time in this loop.
+    get_controls = strategy.get_controls
+    ground_under = terrain.ground_under
+    pad_center = terrain.pad_x + LANDING_PAD_WIDTH / 2
+    for _ in range(max_steps):
+        x = state.x
+        thrusting, side = get_controls(state.velocity_x, state.velocity_y,
+                                       ground_under[int(x)] - state.y - LANDER_HEIGHT,
+                                       pad_center - (x + LANDER_WIDTH / 2), state.fuel)
+        step(state, terrain, thrusting, side)
+        if state.landed or state.crashed:
+            break
+    return state
+
+
+def random_start(rng=random) -> LanderState2D:
+    return LanderState2D(x=rng.uniform(0, SCREEN_WIDTH - LANDER_WIDTH),
+                         velocity_x=rng.uniform(-MAX_START_SPEED_X, MAX_START_SPEED_X))
+
+
+def evaluate(strategy_factory, runs=1000, seed=None, n_terrains=50) -> Evaluation:
+    """Scores a strategy over many random starts on a set of random terrains.
+
+    The terrains are generated up front and shared between the runs, so
+    building their collision index does not slow the descents down.
+    """
+    rng = random.Random(seed)
+    terrains = [Terrain.generate(rng) for _ in range(n_terrains)]
+    result = Evaluation()
+    for run in range(runs):
+        state = simulate(strategy_factory(), terrains[run % n_terrains], random_start(rng))
+        result.runs += 1
+        result.landed += state.landed
+        result.crashed += state.crashed
+        result.fuel_used += INITIAL_FUEL - state.fuel
+    return result
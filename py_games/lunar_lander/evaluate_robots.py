@@ -0,0 +1,22 @@
+import core.physics
+import core.physics_2d
+import basic_robot_strategy
+import soln.optimal_robot_strategy
+import soln.robot_2d_strategy
+import soln.super_robot_strategy
+
+
+def report(name, result):
+  print(f"{name}: landed {result.landing_rate:.1%}, "
+        f"crashed {result.crashed}, timed out {result.timed_out}, "
+        f"average fuel used {result.mean_fuel_used:.1f}")
+
+
+# Flies thousands of random descents without opening a window.
+for strategy_class in (basic_robot_strategy.BasicRobotStrategy,
+                       soln.super_robot_strategy.SuperRobotStrategy,
+                       soln.optimal_robot_strategy.OptimalRobotStrategy):
+  report(strategy_class.__name__, core.physics.evaluate(strategy_class, runs=10000, seed=0))
+
+report("Robot2DStrategy (2D)",
+       core.physics_2d.evaluate(soln.robot_2d_strategy.Robot2DStrategy, runs=2000, seed=0))
@@ -1,4 +1,5 @@
 import pygame
+from core.physics_2d import Side
 
 class KeyStrategy():
   """Controls the game based on keyboard input.
@@ -6,6 +7,7 @@ class KeyStrategy():
 
   def __init__(self):
     self.space_pressed = False
+    self.side = Side.NONE
         
   def set_keys(self, keys):
     """Sets the key state."""
@@ -13,6 +15,13 @@ class KeyStrategy():
       self.space_pressed = True
     else:
       self.space_pressed = False
+    # The left arrow pushes the lander left, the right arrow pushes it right.
+    if keys[pygame.K_LEFT]:
+      self.side = Side.LEFT
+    elif keys[pygame.K_RIGHT]:
+      self.side = Side.RIGHT
+    else:
+      self.side = Side.NONE
 
   def get_thrust(self, velocity: float, altitude: float, fuel: int) -> bool:
     """Returns the thrust value based on the key state."""
@@ -20,3 +29,8 @@ class KeyStrategy():
       return True
     else:
       return False
+
+  def get_controls(self, velocity_x: float, velocity_y: float, altitude: float,
+                   pad_offset: float, fuel: int) -> tuple[bool, Side]:
+    """Returns the thrust and side thruster for the 2D game."""
+    return self.space_pressed, self.side
@@ -0,0 +1,6 @@
+import core.lunar_lander_2d
+import key_strategy
+
+strategy = key_strategy.KeyStrategy()
+game = core.lunar_lander_2d.Game2D(strategy, [strategy])
+game.run()
@@ -0,0 +1,6 @@
+import core.lunar_lander_2d
+import soln.robot_2d_strategy
+
+strategy = soln.robot_2d_strategy.Robot2DStrategy()
+game = core.lunar_lander_2d.Game2D(strategy, [])
+game.run()
@@ -0,0 +1,6 @@
+import core.lunar_lander
+import soln.optimal_robot_strategy
+
+strategy = soln.optimal_robot_strategy.OptimalRobotStrategy()
+game = core.lunar_lander.Game(strategy, [])
+game.run()
@@ -0,0 +1,33 @@
+import argparse
+
+import core.flight_recorder
+
+# Plays back a flight saved with Game(..., record_dir="flights").
+parser = argparse.ArgumentParser(description="Replay a recorded lunar lander flight.")
+parser.add_argument("path", help="the recorded .bin file")
+parser.add_argument("--speed", type=float, default=4.0, help="playback speed (1 is real time)")
+parser.add_argument("--csv", help="also save the flight as a CSV file")
+parser.add_argument("--headless", action="store_true", help="print the summary without a window")
+args = parser.parse_args()
+
+flight = core.flight_recorder.read_flight(args.path)
+final = core.flight_recorder.replay(flight)[-1]
+latencies = [frame.latency for frame in flight.frames]
+print(f"{len(flight.frames)} frames, {'landed' if final.landed else 'crashed' if final.crashed else 'still flying'} "
+      f"at speed {final.velocity_y:.2f} with {final.fuel} fuel left")
+if latencies:
+  print(f"strategy time per frame: average {sum(latencies) / len(latencies) * 1e6:.0f} us, "
+        f"worst {max(latencies) * 1e6:.0f} us")
+divergence = core.flight_recorder.find_divergence(flight)
+if divergence is not None:
+  print(f"the current physics no longer matches the recording from frame {divergence.frame}")
+
+if args.csv:
+  core.flight_recorder.write_csv(flight, args.csv)
+
+if not args.headless:
+  import core.lunar_lander
+  strategy = core.flight_recorder.ReplayStrategy(flight)
+  game = core.lunar_lander.Game(strategy, [], flight.initial_fuel, speed=args.speed,
+                               start_y=flight.start_y)
+  game.run()
@@ -0,0 +1,21 @@
+from core import optimal_control
+
+# Loading the table takes a moment, so share it between strategies.
+_solution = None
+
+
+class OptimalRobotStrategy:
+  """Minimum-fuel strategy, looked up in a table solved ahead of time.
+
+  The first run solves the table and saves it in assets/, which takes a few
+  seconds. Needs numpy.
+  """
+
+  def __init__(self):
+    global _solution
+    if _solution is None:
+      _solution = optimal_control.load()
+    self.solution = _solution
+
+  def get_thrust(self, velocity: float, altitude: float, fuel: int) -> bool:
+    return self.solution.get_thrust(velocity, altitude)
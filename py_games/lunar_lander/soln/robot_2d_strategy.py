@@ -0,0 +1,37 @@
+import math
+
+from core.physics import GRAVITY, THRUST_POWER
+from core.physics_2d import LANDER_WIDTH, LANDING_PAD_WIDTH, Side
+
+# How close to the ground we fly while still looking for the pad.
+CRUISE_ALTITUDE = 120
+
+
+class Robot2DStrategy:
+  """Flies over the pad, then brakes just hard enough to touch down softly."""
+
+  def get_controls(self, velocity_x: float, velocity_y: float, altitude: float,
+                   pad_offset: float, fuel: int) -> tuple[bool, Side]:
+    # Sideways: aim for a speed that shrinks as we get close to the pad.
+    target_velocity_x = max(-3.0, min(3.0, pad_offset / 40))
+    if velocity_x < target_velocity_x - 0.05:
+      side = Side.RIGHT
+    elif velocity_x > target_velocity_x + 0.05:
+      side = Side.LEFT
+    else:
+      side = Side.NONE
+
+    # Down: the fastest speed we can still stop from before the ground, less
+    # a margin. Until we are over the pad, stay above the hills.
+    over_pad = abs(pad_offset) < (LANDING_PAD_WIDTH - LANDER_WIDTH) / 2
+    if over_pad and abs(velocity_x) < 0.4:
+      room = altitude
+    else:
+      room = altitude - CRUISE_ALTITUDE
+    if room < 0:
+      # Too low to clear the hills: climb.
+      target_velocity_y = -1.0
+    else:
+      target_velocity_y = 0.8 * math.sqrt(2 * (THRUST_POWER - GRAVITY) * room) + 0.5
+    thrust = velocity_y > target_velocity_y
+    return thrust, side
@@ -2,8 +2,8 @@ class SuperRobotStrategy:
   """Controls the game based on keyboard input."""
 
 
-from core.lunar_lander import GRAVITY
-from core.lunar_lander import THRUST_POWER
+from core.physics import GRAVITY
+from core.physics import THRUST_POWER
 
 
 class SuperRobotStrategy:
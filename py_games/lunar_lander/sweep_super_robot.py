@@ -0,0 +1,70 @@
+import argparse
+import functools
+import time
+
+import numpy as np
+
+import core.batch_physics
+
+# Searches for the super robot's fuel-optimal burn point over a grid of
+# starting heights and downward velocities. Needs numpy.
+#
+# Starting the burn too late crashes, and since the robot never lets go of
+# the thrusters once it starts, starting too early climbs away and runs out
+# of fuel. So the search looks for the scales that land the most, and of
+# those, picks the one that uses the least fuel. It tries a coarse range of
+# scales on a small grid, zooms in around the best, and checks the winner
+# against burn scale 1 (the SuperRobotStrategy) on the full grid.
+parser = argparse.ArgumentParser(description="Find the super robot's best burn point.")
+parser.add_argument("--grid", type=int, default=1000,
+                    help="starting heights and velocities in the final check")
+parser.add_argument("--search-grid", type=int, default=250,
+                    help="starting heights and velocities while searching")
+parser.add_argument("--low", type=float, default=0.9, help="smallest burn scale to try")
+parser.add_argument("--high", type=float, default=1.1, help="biggest burn scale to try")
+parser.add_argument("--steps", type=int, default=41, help="burn scales tried per round")
+parser.add_argument("--rounds", type=int, default=3, help="times to zoom in")
+parser.add_argument("--tolerance", type=float, default=0.005,
+                    help="landing rate a scale may give up to the best and still count as landing "
+                         "the most")
+args = parser.parse_args()
+
+
+def grid(n):
+  return np.linspace(0, 500, n), np.linspace(0, 3, n)
+
+
+def fly(burn_scale, n):
+  policy_factory = functools.partial(core.batch_physics.SuicideBurnPolicy, burn_scale)
+  return core.batch_physics.sweep(policy_factory, *grid(n))
+
+
+def best(results):
+  """The scale using the least fuel among those landing nearly the most."""
+  most = max(result.landing_rate for result in results.values())
+  safe = [scale for scale, result in results.items()
+          if result.landing_rate >= most - args.tolerance]
+  return min(safe, key=lambda scale: results[scale].mean_fuel_used)
+
+
+def report(burn_scale, result):
+  print(f"burn scale {burn_scale:.4f}: landed {result.landing_rate:.1%}, "
+        f"average fuel used when landed {result.mean_fuel_used:.1f}")
+
+
+start = time.perf_counter()
+low, high = args.low, args.high
+results = {}
+for round_ in range(args.rounds):
+  for burn_scale in np.linspace(low, high, args.steps):
+    results[float(burn_scale)] = fly(burn_scale, args.search_grid)
+  best_scale = best(results)
+  print(f"round {round_ + 1}: ", end="")
+  report(best_scale, results[best_scale])
+  step = (high - low) / (args.steps - 1)
+  low, high = best_scale - step, best_scale + step
+print(f"searched {len(results)} burn scales in {time.perf_counter() - start:.1f}s")
+
+print(f"on the full {args.grid} x {args.grid} grid:")
+for burn_scale in (1.0, best_scale):
+  report(burn_scale, fly(burn_scale, args.grid))
@@ -0,0 +1,58 @@
+"""Plays many pong matches without a window, to compare paddle strategies.
+
+    python3 benchmark.py --matches 100 --player1 follow --player2 idle
+
+Every match is seeded, so each serve's angle is random but the same every
+time the benchmark runs. Reports the results and how fast the engine went.
+Matches between strategies that pick targets skip from one paddle hit to
+the next, so they take far less time than their frames would at 60 Hz.
+--ball-speed sets the ball's horizontal speed in pixels a frame.
+"""
+
+import argparse
+import time
+
+from core.physics import BALL_SPEED_X, MAX_FRAMES, Match
+from follow_robot_strategy import FollowRobotStrategy
+from predictive_robot_strategy import PredictiveRobotStrategy
+from paddle_strategy import PaddleStrategy
+
+# Add your own strategies here.
+STRATEGIES = {
+    "idle": PaddleStrategy,
+    "follow": FollowRobotStrategy,
+    "predict": PredictiveRobotStrategy,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--player1", choices=STRATEGIES, default="follow")
+    parser.add_argument("--player2", choices=STRATEGIES, default="follow")
+    parser.add_argument("--matches", type=int, default=100)
+    parser.add_argument("--max-frames", type=int, default=MAX_FRAMES // 10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ball-speed", type=float, default=BALL_SPEED_X)
+    args = parser.parse_args()
+    strategy1 = STRATEGIES[args.player1]()
+    strategy2 = STRATEGIES[args.player2]()
+
+    wins = {1: 0, 2: 0, None: 0}
+    frames = paddle_hits = 0
+    start = time.perf_counter()
+    for match in range(args.matches):
+        result = Match(strategy1, strategy2, seed=args.seed + match,
+                       ball_speed=args.ball_speed).play(args.max_frames)
+        wins[result.winner] += 1
+        frames += result.frames
+        paddle_hits += result.paddle_hits
+    elapsed = time.perf_counter() - start
+    print(f"{args.player1} won {wins[1]}, {args.player2} won {wins[2]}, "
+          f"{wins[None]} stopped after {args.max_frames} frames")
+    print(f"{paddle_hits / args.matches:.1f} paddle hits per match")
+    print(f"{args.matches} matches, {frames} frames in {elapsed:.2f}s: "
+          f"{elapsed / args.matches * 1000:.1f} ms/match, {frames / elapsed:,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""Pong without any display or sound.
+
+The ball and paddles are plain numbers, so a Match between two paddle
+strategies plays exactly the same way every time and runs as fast as the
+computer can go. The game in core/pong.py uses the same physics and just
+draws it.
+
+The paddles move once a frame, but the ball moves continuously: each
+frame, BallState.advance works out exactly when the ball reaches a paddle
+and bounces it there. So the ball cannot slip through a paddle however
+fast it goes. When both strategies pick targets (see get_target in
+paddle_strategy.py) nothing needs deciding between paddle hits, and
+Match.play jumps straight from one hit to the next.
+"""
+
+import dataclasses
+import math
+import random
+from enum import Enum
+from typing import Optional
+
+# --- Constants ---
+WIDTH, HEIGHT = 800, 600
+PADDLE_WIDTH, PADDLE_HEIGHT = 10, 100
+PADDLE_MARGIN = 50  # from the edge of the screen to the paddle
+BALL_SIZE = 15
+PADDLE_SPEED = 7
+BALL_SPEED_X = 5
+BALL_SPEED_Y = 5  # Initial vertical speed
+WINNING_SCORE = 5
+WALL_THICKNESS = 20
+MAX_REFLECT_ANGLE = 75  # Maximum reflection angle in degrees
+# Two paddles that never miss would play forever.
+MAX_FRAMES = 100000
+# The ball's top edge bounces between these.
+TOP = WALL_THICKNESS
+BOTTOM = HEIGHT - WALL_THICKNESS - BALL_SIZE
+# And the paddle's top edge stays between these.
+PADDLE_TOP = WALL_THICKNESS
+PADDLE_BOTTOM = HEIGHT - WALL_THICKNESS - PADDLE_HEIGHT
+
+
+def fold(y: float) -> tuple[float, bool]:
+    """Folds a path that ignores the walls back in between them.
+
+    A ball bouncing between two walls moves like one going straight on
+    through a stack of mirror images of the field. fold() turns a y in
+    that stack into the real y, and says whether the image is flipped,
+    i.e. whether the ball is really going the other way.
+    """
+    span = BOTTOM - TOP
+    offset = (y - TOP) % (2 * span)
+    if offset <= span:
+        return TOP + offset, False
+    return TOP + 2 * span - offset, True
+
+
+def wall_bounces(y: float, distance: float) -> int:
+    """How many times a ball at y bounces off the walls while moving distance up or down."""
+    span = BOTTOM - TOP
+    # The number of mirror images of the field the ball passes into.
+    return abs(math.floor((y + distance - TOP) / span) - math.floor((y - TOP) / span))
+
+
+class Hit(Enum):
+    """What the ball bounced off during a frame."""
+    NONE = 0
+    WALL = 1
+    PADDLE = 2
+
+
+@dataclasses.dataclass
+class PaddleState:
+    x: float
+    y: float  # top edge
+
+    def move(self, direction: int):
+        """Moves the paddle up (-1) or down (1), constrained by the walls."""
+        self.y += direction * PADDLE_SPEED
+        self.y = max(PADDLE_TOP, min(self.y, PADDLE_BOTTOM))
+
+    def move_towards(self, target: float):
+        """Moves the paddle up to PADDLE_SPEED towards target, constrained by the walls."""
+        self.y += max(-PADDLE_SPEED, min(target - self.y, PADDLE_SPEED))
+        self.y = max(PADDLE_TOP, min(self.y, PADDLE_BOTTOM))
+
+    def after(self, frames: int, target: float) -> float:
+        """Where the paddle will be after moving towards target for the given number of frames."""
+        target = max(PADDLE_TOP, min(target, PADDLE_BOTTOM))
+        distance = min(PADDLE_SPEED * frames, abs(target - self.y))
+        return self.y + math.copysign(distance, target - self.y)
+
+
+@dataclasses.dataclass
+class BallState:
+    x: float  # left edge
+    y: float  # top edge
+    speed_x: float = BALL_SPEED_X
+    speed_y: float = BALL_SPEED_Y
+
+    def at(self, time: float) -> "BallState":
+        """Where the ball will be after flying for time frames, bouncing off the walls."""
+        y, flipped = fold(self.y + self.speed_y * time)
+        return BallState(x=self.x + self.speed_x * time, y=y, speed_x=self.speed_x,
+                         speed_y=-self.speed_y if flipped else self.speed_y)
+
+    def time_to_reach(self, paddle_x: float) -> Optional[float]:
+        """How many frames until the ball touches the face of the paddle at paddle_x.
+
+        None if it is heading away, or is already at or past the face.
+        """
+        if self.speed_x < 0:
+            # The ball's left edge meets the paddle's right edge.
+            distance = self.x - (paddle_x + PADDLE_WIDTH)
+        elif self.speed_x > 0:
+            distance = paddle_x - (self.x + BALL_SIZE)
+        else:
+            return None
+        if distance <= 0:
+            return None
+        return distance / abs(self.speed_x)
+
+    def level_with(self, paddle: PaddleState) -> bool:
+        """Whether the ball and paddle overlap vertically."""
+        return self.y < paddle.y + PADDLE_HEIGHT and paddle.y < self.y + BALL_SIZE
+
+    def bounce_off_paddle(self, paddle: PaddleState):
+        """Sends the ball back at an angle that depends on where it hit the paddle."""
+        # Calculate relative collision point (-1 at the bottom, 1 at the top)
+        relative_intersect_y = ((paddle.y + PADDLE_HEIGHT / 2) - (self.y + BALL_SIZE / 2)) / (PADDLE_HEIGHT / 2)
+        # Clamp the relative intersect Y to be between -1 and 1
+        relative_intersect_y = max(-1, min(1, relative_intersect_y))
+
+        # Calculate reflection angle (in radians)
+        bounce_angle = relative_intersect_y * math.radians(MAX_REFLECT_ANGLE)
+        # Reverse x-direction and aim by the angle. The ball keeps its
+        # horizontal speed, so steep bounces are faster.
+        self.speed_x *= -1
+        self.speed_y = -abs(self.speed_x) * math.tan(bounce_angle)
+
+    def fly(self, time: float) -> int:
+        """Moves the ball for time frames without meeting a paddle. Returns the wall bounces."""
+        bounces = wall_bounces(self.y, self.speed_y * time)
+        moved = self.at(time)
+        self.x, self.y, self.speed_y = moved.x, moved.y, moved.speed_y
+        return bounces
+
+    def advance(self, paddle1: PaddleState, paddle2: PaddleState, time: float = 1) -> Hit:
+        """Moves the ball on by time frames, bouncing off the walls and paddles.
+
+        The ball is checked against a paddle at the moment it reaches the
+        paddle's face. If the paddle is not there, the ball has gone past.
+        """
+        hit = Hit.NONE
+        while True:
+            paddle = paddle1 if self.speed_x < 0 else paddle2
+            contact = self.time_to_reach(paddle.x)
+            if contact is None or contact > time:
+                break
+            if self.fly(contact) and hit == Hit.NONE:
+                hit = Hit.WALL
+            time -= contact
+            if not self.level_with(paddle):
+                break
+            self.bounce_off_paddle(paddle)
+            hit = Hit.PADDLE
+        if self.fly(time) and hit == Hit.NONE:
+            hit = Hit.WALL
+        return hit
+
+    def time_to_score(self) -> float:
+        """How many frames until the ball reaches the edge of the screen it is heading for."""
+        if self.speed_x < 0:
+            return self.x / -self.speed_x
+        return (WIDTH - BALL_SIZE - self.x) / self.speed_x
+
+    @classmethod
+    def serve(cls, direction: int, speed_y: float = BALL_SPEED_Y,
+              speed_x: float = BALL_SPEED_X) -> "BallState":
+        """A ball in the middle, heading left (-1) or right (1)."""
+        return cls(x=(WIDTH - BALL_SIZE) / 2, y=(HEIGHT - BALL_SIZE) / 2,
+                   speed_x=speed_x * direction, speed_y=speed_y)
+
+
+def get_move(strategy, paddle: PaddleState, ball: BallState) -> int:
+    """Asks a paddle strategy which way to move: -1 up, 0 stay, 1 down."""
+    return strategy.get_move(paddle.x, paddle.y, ball.x, ball.y, ball.speed_x, ball.speed_y)
+
+
+def get_target(strategy, paddle: PaddleState, ball: BallState) -> Optional[float]:
+    """Asks a paddle strategy where to move its paddle to, if it says."""
+    get_target = getattr(strategy, "get_target", None)
+    if get_target is None:
+        return None
+    return get_target(paddle.x, paddle.y, ball.x, ball.y, ball.speed_x, ball.speed_y)
+
+
+@dataclasses.dataclass
+class MatchResult:
+    score1: int
+    score2: int
+    frames: int
+    paddle_hits: int
+
+    @property
+    def winner(self) -> Optional[int]:
+        """1 or 2, or None if the match was stopped before anybody won."""
+        if self.score1 >= WINNING_SCORE:
+            return 1
+        if self.score2 >= WINNING_SCORE:
+            return 2
+        return None
+
+
+class Match:
+    """A first to WINNING_SCORE match between two paddle strategies.
+
+    Without a seed every serve goes down at the same angle, like the
+    original game. With one, each serve's angle is random (but repeatable).
+    ball_speed is the ball's horizontal speed in pixels a frame.
+    """
+
+    def __init__(self, strategy1, strategy2, seed=None, ball_speed: float = BALL_SPEED_X):
+        self.strategy1 = strategy1
+        self.strategy2 = strategy2
+        self.rng = random.Random(seed) if seed is not None else None
+        self.ball_speed = ball_speed
+        self.paddle1 = PaddleState(PADDLE_MARGIN, HEIGHT // 2 - PADDLE_HEIGHT // 2)
+        self.paddle2 = PaddleState(WIDTH - PADDLE_MARGIN - PADDLE_WIDTH,
+                                   HEIGHT // 2 - PADDLE_HEIGHT // 2)
+        self.score1 = 0
+        self.score2 = 0
+        self.frames = 0
+        self.paddle_hits = 0
+        self.serve_direction = 1
+        self.ball = self.serve()
+        self.update_targets()
+
+    def serve(self) -> BallState:
+        speed_y = BALL_SPEED_Y
+        if self.rng:
+            speed_y = self.rng.uniform(-BALL_SPEED_Y, BALL_SPEED_Y)
+        scale = self.ball_speed / BALL_SPEED_X
+        return BallState.serve(self.serve_direction, speed_y * scale, self.ball_speed)
+
+    def update_targets(self):
+        """Asks the strategies where to go, now that the ball has a new path."""
+        self.target1 = get_target(self.strategy1, self.paddle1, self.ball)
+        self.target2 = get_target(self.strategy2, self.paddle2, self.ball)
+
+    @property
+    def over(self) -> bool:
+        return self.score1 >= WINNING_SCORE or self.score2 >= WINNING_SCORE
+
+    def move_paddles(self, move1: Optional[int], move2: Optional[int]):
+        for paddle, move, target, strategy in (
+                (self.paddle1, move1, self.target1, self.strategy1),
+                (self.paddle2, move2, self.target2, self.strategy2)):
+            if move is None and target is not None:
+                paddle.move_towards(target)
+            else:
+                if move is None:
+                    move = get_move(strategy, paddle, self.ball)
+                paddle.move(move)
+
+    def step(self, move1: Optional[int] = None, move2: Optional[int] = None) -> Hit:
+        """Plays one frame. Moves default to asking the strategies.
+
+        Returns what the ball hit. A point is scored when the ball reaches
+        either edge of the screen, and the next serve goes the other way.
+        """
+        self.move_paddles(move1, move2)
+        hit = self.ball.advance(self.paddle1, self.paddle2)
+        self.frames += 1
+        if hit == Hit.PADDLE:
+            self.paddle_hits += 1
+
+        if self.ball.x <= 0 or self.ball.x + BALL_SIZE >= WIDTH:
+            if self.ball.x <= 0:
+                self.score2 += 1
+            else:
+                self.score1 += 1
+            self.serve_direction *= -1
+            self.ball = self.serve()
+            self.update_targets()
+        elif hit == Hit.PADDLE:
+            self.update_targets()
+        return hit
+
+    def skip(self, max_frames: int):
+        """Plays up to and including the next frame in which the ball reaches a paddle or scores.
+
+        Only for when both strategies have targets. The frames before that
+        one are skipped in one go, since nothing can happen in them.
+        """
+        paddle = self.paddle1 if self.ball.speed_x < 0 else self.paddle2
+        time = self.ball.time_to_reach(paddle.x)
+        if time is None:
+            time = self.ball.time_to_score()
+        frames = min(max(1, math.ceil(time)), max_frames - self.frames)
+        self.paddle1.y = self.paddle1.after(frames - 1, self.target1)
+        self.paddle2.y = self.paddle2.after(frames - 1, self.target2)
+        self.ball.fly(frames - 1)
+        self.frames += frames - 1
+        self.step()
+
+    def play(self, max_frames: int = MAX_FRAMES) -> MatchResult:
+        """Plays until somebody wins, or max_frames have gone by.
+
+        Skips from one paddle hit to the next while both strategies have
+        targets, and goes frame by frame otherwise.
+        """
+        while not self.over and self.frames < max_frames:
+            if self.target1 is None or self.target2 is None:
+                self.step()
+            else:
+                self.skip(max_frames)
+        return self.result()
+
+    def result(self) -> MatchResult:
+        return MatchResult(self.score1, self.score2, self.frames, self.paddle_hits)
@@ -0,0 +1,136 @@
+import pygame
+import sys
+from core.physics import (BALL_SIZE, HEIGHT, PADDLE_HEIGHT, PADDLE_WIDTH, WALL_THICKNESS, WIDTH,
+                          WINNING_SCORE, Hit, Match)
+from key_strategy import KeyStrategy
+
+# Initialize Pygame
+pygame.init()
+
+# --- Constants ---
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+FONT_SIZE = 36
+FPS = 60
+PING_SOUND_PATH = "ping.ogg"
+PONG_SOUND_PATH = "pong.ogg"
+
+
+# --- Classes ---
+class Scoreboard:
+    """Displays the game score."""
+
+    def __init__(self):
+        self.font = pygame.font.Font(None, FONT_SIZE)
+
+    def draw(self, screen, match):
+        """Draws the scoreboard."""
+        score_text = f"{match.score1} - {match.score2}"
+        text_surface = self.font.render(score_text, True, WHITE)
+        text_rect = text_surface.get_rect(center=(WIDTH // 2, 30))
+        screen.blit(text_surface, text_rect)
+
+    def display_winner(self, screen, match):
+        """Displays the winner."""
+        if match.score1 >= WINNING_SCORE:
+            winner_text = "Player 1 Wins!"
+        elif match.score2 >= WINNING_SCORE:
+            winner_text = "Player 2 Wins!"
+        else:
+            return
+
+        font = pygame.font.Font(None, FONT_SIZE * 2)
+        text_surface = font.render(winner_text, True, WHITE)
+        text_rect = text_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        screen.blit(text_surface, text_rect)
+
+
+class Wall:
+    """Represents a wall (top or bottom)."""
+
+    def __init__(self, y, height):
+        """Initializes a wall."""
+        self.rect = pygame.Rect(0, y, WIDTH, height)
+
+    def draw(self, screen):
+        """Draws the wall."""
+        pygame.draw.rect(screen, WHITE, self.rect)
+
+
+class PongGame:
+    """Main class for the Pong game."""
+
+    def __init__(self, strategy1=None, strategy2=None):
+        """Initializes game components. Without strategies, the keyboard plays:
+        W and S for player 1, the up and down arrows for player 2."""
+        self.strategy1 = strategy1 or KeyStrategy(pygame.K_w, pygame.K_s)
+        self.strategy2 = strategy2 or KeyStrategy(pygame.K_UP, pygame.K_DOWN)
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Pong")
+        self.clock = pygame.time.Clock()
+        # Loaded once for the whole game, not for every ball.
+        self.sounds = {
+            Hit.WALL: pygame.mixer.Sound(PING_SOUND_PATH),
+            Hit.PADDLE: pygame.mixer.Sound(PONG_SOUND_PATH),
+        }
+        self.scoreboard = Scoreboard()
+        self.top_wall = Wall(0, WALL_THICKNESS)
+        self.bottom_wall = Wall(HEIGHT - WALL_THICKNESS, WALL_THICKNESS)
+        self.reset_game()
+
+    def reset_game(self):
+        """Resets the game state."""
+        self.match = Match(self.strategy1, self.strategy2)
+        self.game_over = False
+
+    def handle_input(self):
+        """Passes the keys to any strategy that uses them."""
+        keys = pygame.key.get_pressed()
+        for strategy in (self.strategy1, self.strategy2):
+            if hasattr(strategy, "set_keys"):
+                strategy.set_keys(keys)
+
+    def update(self):
+        """Updates game state."""
+        if not self.game_over:
+            hit = self.match.step()
+            if hit in self.sounds:
+                self.sounds[hit].play()
+            if self.match.over:
+                self.game_over = True
+
+    def draw(self):
+        """Draws game elements."""
+        self.screen.fill(BLACK)
+        for paddle in (self.match.paddle1, self.match.paddle2):
+            pygame.draw.rect(self.screen, WHITE, (paddle.x, paddle.y, PADDLE_WIDTH, PADDLE_HEIGHT))
+        ball = self.match.ball
+        pygame.draw.ellipse(self.screen, WHITE, (ball.x, ball.y, BALL_SIZE, BALL_SIZE))
+        self.scoreboard.draw(self.screen, self.match)
+        self.top_wall.draw(self.screen)
+        self.bottom_wall.draw(self.screen)
+        if self.game_over:
+            self.scoreboard.display_winner(self.screen, self.match)
+        pygame.display.flip()
+
+    def run(self):
+        """Main game loop."""
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_r and self.game_over:
+                        self.reset_game()
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+
+            if not self.game_over:
+                self.handle_input()
+            self.update()
+            self.draw()
+            self.clock.tick(FPS)
+
+        pygame.quit()
+        sys.exit()
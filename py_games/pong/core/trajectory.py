@@ -0,0 +1,68 @@
+"""Where the ball is going, worked out without playing any frames.
+
+Between paddle hits the ball flies in a straight line, folded back
+between the walls (see physics.fold). So where it will be any number of
+frames from now, and when it will reach a paddle, take a few sums however
+many times it bounces on the way. A Trajectory stays right until the ball
+hits a paddle, so a robot only needs a new one after each hit.
+"""
+
+import dataclasses
+import math
+from typing import Optional
+
+from core.physics import BallState, wall_bounces
+
+
+@dataclasses.dataclass(frozen=True)
+class Crossing:
+    """The moment the ball reaches a paddle's face."""
+    time: float  # in frames from now
+    ball: BallState  # where the ball is then
+    bounces: int  # off the walls on the way
+
+    @property
+    def frame(self) -> int:
+        """The frame, counting the next one as 1, in which the ball gets there."""
+        return math.ceil(self.time)
+
+
+class Trajectory:
+    """The path of a ball until it next hits a paddle."""
+
+    def __init__(self, ball: BallState):
+        self.ball = BallState(ball.x, ball.y, ball.speed_x, ball.speed_y)
+        self._crossings = {}
+
+    def at(self, frames: float) -> BallState:
+        """Where the ball will be after the given number of frames."""
+        return self.ball.at(frames)
+
+    def bounces(self, frames: float) -> int:
+        """How many times the ball will bounce off the walls in the given number of frames."""
+        return wall_bounces(self.ball.y, self.ball.speed_y * frames)
+
+    def follows(self, ball: BallState, tolerance: float = 1e-6) -> bool:
+        """Whether the ball is still on this trajectory, i.e. has not hit a paddle since."""
+        if ball.speed_x != self.ball.speed_x:
+            return False
+        expected = self.at((ball.x - self.ball.x) / self.ball.speed_x)
+        return (abs(expected.y - ball.y) < tolerance
+                and abs(expected.speed_y - ball.speed_y) < tolerance)
+
+    def crossing(self, paddle_x: float) -> Optional[Crossing]:
+        """When and where the ball reaches the face of the paddle at paddle_x.
+
+        That is when the game checks whether the paddle is in the way. None
+        if the ball is heading away from the paddle, or has already reached
+        it.
+        """
+        if paddle_x not in self._crossings:
+            self._crossings[paddle_x] = self._crossing(paddle_x)
+        return self._crossings[paddle_x]
+
+    def _crossing(self, paddle_x: float) -> Optional[Crossing]:
+        time = self.ball.time_to_reach(paddle_x)
+        if time is None:
+            return None
+        return Crossing(time=time, ball=self.at(time), bounces=self.bounces(time))
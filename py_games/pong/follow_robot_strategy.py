@@ -0,0 +1,12 @@
+from core.physics import BALL_SIZE, PADDLE_HEIGHT, PADDLE_SPEED
+from paddle_strategy import PaddleStrategy
+
+
+class FollowRobotStrategy(PaddleStrategy):
+    """Keeps the middle of the paddle level with the ball."""
+
+    def get_move(self, paddle_x, paddle_y, ball_x, ball_y, ball_speed_x, ball_speed_y):
+        offset = (ball_y + BALL_SIZE / 2) - (paddle_y + PADDLE_HEIGHT / 2)
+        if abs(offset) < PADDLE_SPEED:
+            return 0
+        return 1 if offset > 0 else -1
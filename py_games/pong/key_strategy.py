@@ -0,0 +1,21 @@
+from paddle_strategy import PaddleStrategy
+
+
+class KeyStrategy(PaddleStrategy):
+    """Moves the paddle with two keys."""
+
+    def __init__(self, up_key, down_key):
+        self.up_key = up_key
+        self.down_key = down_key
+        self.direction = 0
+
+    def set_keys(self, keys):
+        """Sets the key state."""
+        self.direction = 0
+        if keys[self.up_key]:
+            self.direction -= 1
+        if keys[self.down_key]:
+            self.direction += 1
+
+    def get_move(self, paddle_x, paddle_y, ball_x, ball_y, ball_speed_x, ball_speed_y):
+        return self.direction
@@ -0,0 +1,25 @@
+from typing import Optional
+
+
+class PaddleStrategy:
+    """A pong player."""
+
+    def get_move(self, paddle_x: float, paddle_y: float, ball_x: float, ball_y: float,
+                 ball_speed_x: float, ball_speed_y: float) -> int:
+        """Returns -1 to move the paddle up, 1 to move it down, or 0 to stay.
+
+        Positions are the top left corners of the paddle and ball, in pixels.
+        y grows downwards. Speeds are in pixels per frame.
+        """
+        return 0
+
+    def get_target(self, paddle_x: float, paddle_y: float, ball_x: float, ball_y: float,
+                   ball_speed_x: float, ball_speed_y: float) -> Optional[float]:
+        """Returns where to move the paddle's top edge to, or None to use get_move.
+
+        Only asked when the ball is served or hits a paddle. The paddle then
+        moves towards the target at full speed, and waits there. Strategies
+        with targets can be played without asking every frame, which lets
+        core/physics.py skip from one paddle hit to the next.
+        """
+        return None
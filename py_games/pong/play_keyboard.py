@@ -0,0 +1,5 @@
+from core.pong import PongGame
+
+# Player 1 uses W and S, player 2 the up and down arrows.
+game = PongGame()
+game.run()
@@ -0,0 +1,6 @@
+from core.pong import PongGame
+from follow_robot_strategy import FollowRobotStrategy
+
+# Play the robot with the up and down arrows.
+game = PongGame(FollowRobotStrategy())
+game.run()
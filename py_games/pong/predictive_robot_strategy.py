@@ -0,0 +1,29 @@
+from core.physics import BALL_SIZE, HEIGHT, PADDLE_HEIGHT, PADDLE_SPEED, BallState
+from core.trajectory import Trajectory
+from paddle_strategy import PaddleStrategy
+
+
+class PredictiveRobotStrategy(PaddleStrategy):
+    """Works out where the ball will reach the paddle, and waits for it there.
+
+    While the ball is heading away, the paddle goes back to the middle.
+    """
+
+    def __init__(self):
+        self.trajectory = None
+
+    def get_target(self, paddle_x, paddle_y, ball_x, ball_y, ball_speed_x, ball_speed_y):
+        ball = BallState(ball_x, ball_y, ball_speed_x, ball_speed_y)
+        # The trajectory only changes when the ball hits a paddle.
+        if self.trajectory is None or not self.trajectory.follows(ball):
+            self.trajectory = Trajectory(ball)
+        crossing = self.trajectory.crossing(paddle_x)
+        if crossing:
+            return crossing.ball.y + BALL_SIZE / 2 - PADDLE_HEIGHT / 2
+        return HEIGHT / 2 - PADDLE_HEIGHT / 2
+
+    def get_move(self, paddle_x, paddle_y, ball_x, ball_y, ball_speed_x, ball_speed_y):
+        offset = self.get_target(paddle_x, paddle_y, ball_x, ball_y, ball_speed_x, ball_speed_y) - paddle_y
+        if abs(offset) < PADDLE_SPEED:
+            return 0
+        return 1 if offset > 0 else -1
@@ -0,0 +1,20 @@
+from typing import Tuple
+from core import space
+from core.grid import Direction, Grid
+from snake_strategy import SnakeStrategy
+
+
+class CautiousRobotStrategy(SnakeStrategy):
+  """Keeps going straight, unless turning leads to more room."""
+
+  def get_move(
+      self,
+      grid: Grid,
+      position: Tuple[int, int],
+      last_direction: Direction,
+  ) -> Direction:
+    moves = space.free_moves(grid, position)
+    if not moves:
+      return last_direction
+    return max(moves, key=lambda direction: (
+        space.region_size(grid, position, direction), direction == last_direction))
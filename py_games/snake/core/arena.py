@@ -0,0 +1,161 @@
+"""Snake games without any display or clock, for any number of snakes.
+
+Time is counted in ticks. Every tick each snake that is still alive moves
+one square, in order, and every TICKS_PER_GROWTH ticks they all grow by one.
+A snake that runs into a wall or a snake dies, and its body stays where it
+is. The game ends when at most one snake is left.
+"""
+
+import dataclasses
+import math
+import random
+from collections import deque
+from typing import List, Optional, Tuple
+
+from core.grid import GRID_HEIGHT, GRID_WIDTH, Direction, Grid
+from snake_strategy import SnakeStrategy
+
+# The game runs at 10 ticks a second, and snakes grow once a second.
+TICKS_PER_GROWTH = 10
+MAX_TICKS = 20000
+
+
+class Snake:
+  """Represents a snake."""
+
+  def __init__(
+      self,
+      strategy: SnakeStrategy,
+      start_position: Tuple[int, int],
+      direction: Direction,
+      grid: Grid,
+  ):
+    self.strategy = strategy
+    self.direction = direction
+    self.head = start_position
+    # self.segments[0] = self.head, self.segments[-1] = tail
+    self.segments = deque([self.head])
+    self.grid = grid  # shared by all the snakes
+    self.grid.add(self.head)
+    self.alive = True
+    self.last_tail = None  # the square the tail left on the last move, if it moved
+
+  def check_collision(self) -> bool:
+    """Checks for collisions between snakes and boundaries.
+
+    Must be called before the head is added to the grid.
+    """
+    return self.grid.is_occupied(*self.head)
+
+  def move(self, grow: bool) -> bool:
+    """Moves the snake. Returns true if there is a collision."""
+    direction = self.strategy.get_move(self.grid, self.head, self.direction)
+    self.direction = direction
+    self.head = (
+        self.head[0] + direction.value[0],
+        self.head[1] + direction.value[1],
+    )
+
+    # The tail moves out of the way first, so the head may follow it.
+    self.last_tail = None if grow else self.segments.pop()
+    if self.last_tail is not None:
+      self.grid.remove(self.last_tail)
+    collision = self.check_collision()
+    self.segments.appendleft(self.head)
+    self.grid.add(self.head)
+    if collision:
+      self.alive = False
+    return collision
+
+
+def start_positions(n_snakes: int, width: int, height: int,
+                    rng: Optional[random.Random] = None) -> List[Tuple[Tuple[int, int], Direction]]:
+  """Spreads the snakes around an oval, each facing the middle.
+
+  Without rng, the first snake starts on the left. With it, the oval is
+  turned by a random amount, so seeded games start differently.
+  """
+  turn = rng.uniform(0, 2 * math.pi) if rng else 0.0
+  starts = []
+  taken = set()
+  for i in range(n_snakes):
+    angle = math.pi + turn + 2 * math.pi * i / n_snakes
+    dx, dy = round(math.cos(angle), 9), round(math.sin(angle), 9)
+    x = min(width - 1, max(0, math.floor(width / 2 + dx * 3 * width / 8)))
+    y = min(height - 1, max(0, math.floor(height / 2 + dy * 3 * height / 8)))
+    while (x, y) in taken:  # only on tiny grids
+      x = (x + 1) % width
+    taken.add((x, y))
+    if abs(dx) * width >= abs(dy) * height:
+      direction = Direction.RIGHT if dx < 0 else Direction.LEFT
+    else:
+      direction = Direction.DOWN if dy < 0 else Direction.UP
+    starts.append(((x, y), direction))
+  return starts
+
+
+@dataclasses.dataclass
+class ArenaResult:
+  """How a game went."""
+  ticks: int
+  death_ticks: List[Optional[int]]  # when each snake died, None for survivors
+
+  def placings(self) -> List[int]:
+    """Each snake's finishing place: 0 for the winner. Snakes that died together share a place."""
+    last = self.ticks + 1
+    lasted = [last if tick is None else tick for tick in self.death_ticks]
+    return [sum(other > mine for other in lasted) for mine in lasted]
+
+  @property
+  def winner(self) -> Optional[int]:
+    """The index of the only snake that lasted longest, or None for a draw."""
+    placings = self.placings()
+    winners = [i for i, place in enumerate(placings) if place == 0]
+    return winners[0] if len(winners) == 1 else None
+
+
+class Arena:
+  """One game between any number of snakes."""
+
+  def __init__(
+      self,
+      strategies: List[SnakeStrategy],
+      width: int = GRID_WIDTH,
+      height: int = GRID_HEIGHT,
+      seed: Optional[int] = None,
+  ):
+    self.grid = Grid(width, height)
+    rng = random.Random(seed) if seed is not None else None
+    self.snakes = [
+        Snake(strategy, position, direction, self.grid)
+        for strategy, (position, direction)
+        in zip(strategies, start_positions(len(strategies), width, height, rng))
+    ]
+    self.tick = 0
+    self.death_ticks = [None] * len(self.snakes)
+
+  @property
+  def over(self) -> bool:
+    alive = sum(snake.alive for snake in self.snakes)
+    return alive == 0 or (alive == 1 and len(self.snakes) > 1)
+
+  def step(self) -> List[Snake]:
+    """Moves every living snake once. Returns the snakes that died."""
+    self.tick += 1
+    grow = self.tick % TICKS_PER_GROWTH == 0
+    self.grid.start_tick()
+    died = []
+    for i, snake in enumerate(self.snakes):
+      if snake.alive and snake.move(grow):
+        self.death_ticks[i] = self.tick
+        died.append(snake)
+    return died
+
+  def play(self, max_ticks: int = MAX_TICKS) -> ArenaResult:
+    """Plays until the game is over, or max_ticks have gone by."""
+    while not self.over and self.tick < max_ticks:
+      self.step()
+    return self.result()
+
+  def result(self) -> ArenaResult:
+    return ArenaResult(ticks=self.tick, death_ticks=list(self.death_ticks))
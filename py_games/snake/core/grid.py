@@ -0,0 +1,56 @@
+"""The snake arena, without any display.
+
+Grid keeps a count of snake segments in every square, so asking whether a
+square is taken is one lookup however long the snakes get. Snakes update it
+as they move: one square for the new head, one for the tail they leave.
+Squares are numbered row by row, so (x, y) is index y * width + x.
+"""
+
+from enum import Enum
+from typing import Tuple
+
+GRID_WIDTH = 30
+GRID_HEIGHT = 20
+
+
+class Direction(Enum):
+  UP = (0, -1)
+  DOWN = (0, 1)
+  LEFT = (-1, 0)
+  RIGHT = (1, 0)
+
+
+class Grid:
+  """Which squares of the arena the snakes are in."""
+
+  def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+    self.width = width
+    self.height = height
+    # Number of snake segments in each square, row by row.
+    self.cells = bytearray(width * height)
+    # Anything worked out from the whole grid during this tick, for sharing
+    # between the snakes. See core/space.py.
+    self.cache = {}
+
+  def start_tick(self):
+    """Called once a tick before any snake moves, to forget the last tick's cache."""
+    self.cache.clear()
+
+  def in_bounds(self, x: int, y: int) -> bool:
+    return 0 <= x < self.width and 0 <= y < self.height
+
+  def is_occupied(self, x: int, y: int) -> bool:
+    """True if a snake is in the square, or it is outside the arena."""
+    if not (0 <= x < self.width and 0 <= y < self.height):
+      return True
+    return self.cells[y * self.width + x] != 0
+
+  def add(self, position: Tuple[int, int]):
+    x, y = position
+    if self.in_bounds(x, y):
+      self.cells[y * self.width + x] += 1
+
+  def remove(self, position: Tuple[int, int]):
+    x, y = position
+    if self.in_bounds(x, y):
+      self.cells[y * self.width + x] -= 1
@@ -0,0 +1,181 @@
+from enum import Enum
+import time
+from typing import Optional, Tuple
+from core.arena import Arena, Snake
+from core.grid import GRID_HEIGHT, GRID_WIDTH, Direction, Grid
+import pygame
+from snake_strategy import SnakeStrategy
+
+# Initialize Pygame
+pygame.init()
+
+# --- Constants ---
+GRID_SIZE = 20
+WIDTH, HEIGHT = GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE
+FPS = 10  # Controls the speed of the game
+
+
+class Color(Enum):
+  GREEN = (0, 255, 0)
+  BLUE = (0, 0, 255)
+  RED = (255, 0, 0)
+  BLACK = (0, 0, 0)
+  WHITE = (255, 255, 255)
+  GRAY = (128, 128, 128)
+  YELLOW = (255, 255, 0)
+
+SNAKE_COLOR1 = Color.RED
+SNAKE_COLOR2 = Color.BLUE
+BACKGROUND_COLOR = Color.BLACK
+
+# --- Functions ---
+
+
+class ArrowKeyStrategy(SnakeStrategy):
+  """A strategy where the arrow keys control the direction."""
+
+  def get_move(
+      self,
+      grid: Grid,
+      position: Tuple[int, int],
+      last_direction: Direction,
+  ) -> Direction:
+    # Snake 2 controls (Arrow keys)
+    keys = pygame.key.get_pressed()
+    if keys[pygame.K_UP]:
+      return Direction.UP
+    elif keys[pygame.K_DOWN]:
+      return Direction.DOWN
+    elif keys[pygame.K_LEFT]:
+      return Direction.LEFT
+    elif keys[pygame.K_RIGHT]:
+      return Direction.RIGHT
+    else:
+      return last_direction
+
+
+class WASDStrategy(SnakeStrategy):
+  """A strategy where the arrow keys control the direction."""
+
+  def get_move(
+      self,
+      grid: Grid,
+      position: Tuple[int, int],
+      last_direction: Direction,
+  ) -> Direction:
+    # Snake 2 controls (Arrow keys)
+    keys = pygame.key.get_pressed()
+    if keys[pygame.K_w]:
+      return Direction.UP
+    elif keys[pygame.K_s]:
+      return Direction.DOWN
+    elif keys[pygame.K_a]:
+      return Direction.LEFT
+    elif keys[pygame.K_d]:
+      return Direction.RIGHT
+    else:
+      return last_direction
+
+
+class Game:
+
+  def __init__(
+      self,
+      strategy1: Optional[SnakeStrategy] = None,
+      strategy2: Optional[SnakeStrategy] = None,
+  ):
+    """Red plays strategy1 and blue strategy2. Without them, the keyboard plays."""
+    self.strategy1 = strategy1 or WASDStrategy()
+    self.strategy2 = strategy2 or ArrowKeyStrategy()
+    self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Snake Game")
+    self.background = self.draw_grid()
+
+  def draw_grid(self) -> pygame.Surface:
+    """Draws the background and grid lines once, onto their own surface."""
+    background = pygame.Surface((WIDTH, HEIGHT))
+    background.fill(BACKGROUND_COLOR.value)
+    for x in range(0, WIDTH, GRID_SIZE):
+      pygame.draw.line(background, (50, 50, 50), (x, 0), (x, HEIGHT))
+    for y in range(0, HEIGHT, GRID_SIZE):
+      pygame.draw.line(background, (50, 50, 50), (0, y), (WIDTH, y))
+    return background
+
+  @staticmethod
+  def square(position: Tuple[int, int]) -> pygame.Rect:
+    return pygame.Rect(position[0] * GRID_SIZE, position[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+
+  def draw_snake(self, snake: Snake, color: Color):
+    """Draws a whole snake on the screen."""
+    for segment in snake.segments:
+      self.screen.fill(color.value, self.square(segment))
+
+  def draw_moves(self, snakes, colors) -> list:
+    """Draws just what changed when the snakes moved: each tail they left
+    is covered with the background and each new head is painted.
+
+    Returns the squares that changed.
+    """
+    dirty = []
+    for snake in snakes:
+      if snake.last_tail is not None:
+        rect = self.square(snake.last_tail)
+        self.screen.blit(self.background, rect, rect)
+        dirty.append(rect)
+    for snake, color in zip(snakes, colors):
+      rect = self.square(snake.head).clip(self.screen.get_rect())
+      self.screen.fill(color.value, rect)
+      dirty.append(rect)
+    return dirty
+
+  def display_winner(self, winner: Optional[int]):
+    """Displays the winner on the screen."""
+    font = pygame.font.Font(None, 50)
+    if winner == 0:
+      text = font.render("Red Wins!", True, SNAKE_COLOR1.value)
+    elif winner == 1:
+      text = font.render("Blue Wins!", True, SNAKE_COLOR2.value)
+    else:  # draw
+      text = font.render("Draw!", True, (255, 255, 255))
+
+    text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+    self.screen.blit(text, text_rect)
+    pygame.display.flip()
+    time.sleep(3)  # Show the message for 3 seconds
+
+  def play(self):
+    """Main game function."""
+    game_over = False
+    clock = pygame.time.Clock()
+
+    # Initialize snakes
+    arena = Arena([self.strategy1, self.strategy2], GRID_WIDTH, GRID_HEIGHT)
+    colors = {snake: color for snake, color in zip(arena.snakes, (SNAKE_COLOR1, SNAKE_COLOR2))}
+
+    # --- Drawing ---
+    self.screen.blit(self.background, (0, 0))
+    for snake, color in colors.items():
+      self.draw_snake(snake, color)
+    pygame.display.flip()
+
+    while not game_over:
+      for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+          game_over = True
+
+      # --- Snake Movement ---
+      moving = [snake for snake in arena.snakes if snake.alive]
+      arena.step()
+
+      # --- Drawing ---
+      # Only the heads and tails move, so only those squares are redrawn.
+      dirty = self.draw_moves(moving, [colors[snake] for snake in moving])
+      pygame.display.update(dirty)
+
+      if arena.over:
+        self.display_winner(arena.result().winner)
+        game_over = True
+
+      clock.tick(FPS)
+
+    pygame.quit()
@@ -0,0 +1,165 @@
+"""Finding the open space on the grid, for robot snakes.
+
+Everything here is a breadth-first search over the free squares. Two
+searches do not depend on which snake is asking:
+
+  - which free squares connect to each other (regions), and
+  - how far each free square is from the nearest snake or wall (clearance).
+
+They are done once per tick and kept in grid.cache, so both snakes, and
+every move they consider, share them. They are worked out before either
+snake moves, so by the second snake's turn they are a move out of date,
+which is close enough for choosing a direction. The only search done for
+each decision is one from the snake's own head.
+"""
+
+import dataclasses
+import functools
+from typing import Iterable, Optional, Tuple
+
+from core.grid import Direction, Grid
+
+
+@functools.lru_cache(maxsize=None)
+def neighbours(width: int, height: int) -> tuple:
+  """neighbours(width, height)[i] lists the squares next to square i."""
+  result = []
+  for y in range(height):
+    for x in range(width):
+      i = y * width + x
+      result.append(tuple(
+          j for j, inside in ((i - width, y > 0), (i + width, y < height - 1),
+                              (i - 1, x > 0), (i + 1, x < width - 1)) if inside))
+  return tuple(result)
+
+
+@dataclasses.dataclass
+class SpaceFields:
+  """The searches shared by every snake for one tick."""
+  region: list  # which region each free square is in, -1 if taken
+  region_size: list  # number of squares in each region
+  region_clearance: list  # the largest clearance in each region
+  clearance: list  # steps from each square to the nearest taken square or wall, 0 if taken
+
+
+def _regions(cells, nbrs):
+  region = [-1] * len(cells)
+  sizes = []
+  for start in range(len(cells)):
+    if cells[start] or region[start] >= 0:
+      continue
+    label = len(sizes)
+    region[start] = label
+    queue = [start]
+    for i in queue:
+      for j in nbrs[i]:
+        if region[j] < 0 and not cells[j]:
+          region[j] = label
+          queue.append(j)
+    sizes.append(len(queue))
+  return region, sizes
+
+
+@functools.lru_cache(maxsize=None)
+def edge(width: int, height: int) -> tuple:
+  """The squares next to the walls."""
+  return tuple(i for i, nbrs in enumerate(neighbours(width, height)) if len(nbrs) < 4)
+
+
+def _clearance(cells, nbrs, edge_squares):
+  # Breadth first from every taken square at once. Squares on the edge are
+  # next to the wall, so none of them is more than 1 away.
+  clearance = [0 if cell else -1 for cell in cells]
+  frontier = []
+  for i, cell in enumerate(cells):
+    if cell:
+      for j in nbrs[i]:
+        if clearance[j] < 0:
+          clearance[j] = 1
+          frontier.append(j)
+  for i in edge_squares:
+    if clearance[i] < 0:
+      clearance[i] = 1
+      frontier.append(i)
+  distance = 1
+  while frontier:
+    distance += 1
+    next_frontier = []
+    for i in frontier:
+      for j in nbrs[i]:
+        if clearance[j] < 0:
+          clearance[j] = distance
+          next_frontier.append(j)
+    frontier = next_frontier
+  return clearance
+
+
+def fields(grid: Grid) -> SpaceFields:
+  """The shared searches for this tick, worked out the first time they are asked for."""
+  space = grid.cache.get("space")
+  if space is None:
+    nbrs = neighbours(grid.width, grid.height)
+    region, sizes = _regions(grid.cells, nbrs)
+    clearance = _clearance(grid.cells, nbrs, edge(grid.width, grid.height))
+    best = [0] * len(sizes)
+    for i, label in enumerate(region):
+      if label >= 0 and clearance[i] > best[label]:
+        best[label] = clearance[i]
+    space = SpaceFields(region=region, region_size=sizes, region_clearance=best,
+                        clearance=clearance)
+    grid.cache["space"] = space
+  return space
+
+
+def free_moves(grid: Grid, position: Tuple[int, int]) -> list:
+  """The directions that do not run straight into something."""
+  x, y = position
+  return [direction for direction in Direction
+          if not grid.is_occupied(x + direction.value[0], y + direction.value[1])]
+
+
+def region_size(grid: Grid, position: Tuple[int, int], direction: Direction) -> int:
+  """How many squares can be reached after moving one step in direction."""
+  space = fields(grid)
+  x, y = position[0] + direction.value[0], position[1] + direction.value[1]
+  label = space.region[y * grid.width + x]
+  return space.region_size[label] if label >= 0 else 0
+
+
+def towards_space(grid: Grid, position: Tuple[int, int],
+                  directions: Iterable[Direction]) -> Optional[Direction]:
+  """The first step towards the nearest of the most open squares reachable.
+
+  A breadth-first search from the head that only starts out in the given
+  directions. It stops as soon as it finds a square as open as any in the
+  regions it can reach, since later squares are further away.
+  """
+  space = fields(grid)
+  width = grid.width
+  cells = grid.cells
+  nbrs = neighbours(width, grid.height)
+  first_step = {}
+  queue = []
+  for direction in directions:
+    x, y = position[0] + direction.value[0], position[1] + direction.value[1]
+    i = y * width + x
+    if grid.is_occupied(x, y) or i in first_step:
+      continue
+    first_step[i] = direction
+    queue.append(i)
+  # The region labels are from the start of the tick, so a square may not have one.
+  most_open = max((space.region_clearance[space.region[i]] for i in queue
+                   if space.region[i] >= 0), default=0)
+  best = None
+  best_clearance = -1
+  for i in queue:
+    clearance = space.clearance[i]
+    if clearance > best_clearance:
+      best, best_clearance = i, clearance
+      if clearance >= most_open:
+        break
+    for j in nbrs[i]:
+      if j not in first_step and not cells[j]:
+        first_step[j] = first_step[i]
+        queue.append(j)
+  return first_step.get(best)
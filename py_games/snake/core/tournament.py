@@ -0,0 +1,86 @@
+"""Ranking snake strategies by Elo rating over many seeded games.
+
+Each game puts a few strategies from the roster in an Arena, chosen and
+placed by the game's seed, so a tournament can be replayed exactly. The
+games are played by a process pool, and the ratings are updated in game
+order afterwards, so the number of processes does not change the result.
+
+In a game with more than two snakes, every pair of snakes counts as a
+match that the snake which lasted longer won.
+"""
+
+import dataclasses
+import itertools
+import multiprocessing
+import os
+import random
+from typing import Callable, Dict, List, Optional
+
+from core.arena import MAX_TICKS, Arena
+from core.grid import GRID_HEIGHT, GRID_WIDTH
+
+INITIAL_RATING = 1500
+K_FACTOR = 16
+
+
+@dataclasses.dataclass
+class TournamentResult:
+  ratings: Dict[str, float]
+  games: Dict[str, int]  # games each strategy played
+  wins: Dict[str, int]  # games each strategy won outright
+
+  def standings(self) -> List[str]:
+    """Strategy names, best rated first."""
+    return sorted(self.ratings, key=self.ratings.get, reverse=True)
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+  return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def update_ratings(ratings: Dict[str, float], names: List[str], placings: List[int],
+                   k_factor: float = K_FACTOR):
+  """Updates ratings for one game, given each snake's place (0 is first)."""
+  changes = [0.0] * len(names)
+  k = k_factor / (len(names) - 1)  # so a game is worth the same however many play
+  for i, j in itertools.combinations(range(len(names)), 2):
+    score = 1.0 if placings[i] < placings[j] else 0.5 if placings[i] == placings[j] else 0.0
+    change = k * (score - expected_score(ratings[names[i]], ratings[names[j]]))
+    changes[i] += change
+    changes[j] -= change
+  for name, change in zip(names, changes):
+    ratings[name] += change
+
+
+def _play(job):
+  """Plays one game and returns the placings. Runs in a worker."""
+  factories, seed, width, height, max_ticks = job
+  arena = Arena([factory() for factory in factories], width, height, seed)
+  return arena.play(max_ticks).placings()
+
+
+def run(roster: Dict[str, Callable], n_games: int, snakes_per_game: int = 2, seed: int = 0,
+        width: int = GRID_WIDTH, height: int = GRID_HEIGHT, max_ticks: int = MAX_TICKS,
+        processes: Optional[int] = None, report=None) -> TournamentResult:
+  """Plays n_games between strategies from roster (name: function that makes one).
+
+  report, if given, is called with (games played, result so far) every so often.
+  """
+  rng = random.Random(seed)
+  entrants = [rng.sample(sorted(roster), snakes_per_game) for _ in range(n_games)]
+  jobs = [(tuple(roster[name] for name in names), rng.randrange(2 ** 32), width, height,
+           max_ticks) for names in entrants]
+
+  result = TournamentResult(ratings={name: float(INITIAL_RATING) for name in roster},
+                            games=dict.fromkeys(roster, 0), wins=dict.fromkeys(roster, 0))
+  with multiprocessing.Pool(processes or os.cpu_count()) as pool:
+    chunksize = max(1, n_games // (8 * (processes or os.cpu_count())))
+    for game, (names, placings) in enumerate(
+        zip(entrants, pool.imap(_play, jobs, chunksize)), start=1):
+      update_ratings(result.ratings, names, placings)
+      for name, place in zip(names, placings):
+        result.games[name] += 1
+        result.wins[name] += place == 0 and placings.count(0) == 1
+      if report and game % 100 == 0:
+        report(game, result)
+  return result
@@ -0,0 +1,4 @@
+from core.snake import Game
+
+# Red uses W, A, S and D. Blue uses the arrow keys.
+Game().play()
@@ -0,0 +1,6 @@
+from cautious_robot_strategy import CautiousRobotStrategy
+from core.snake import Game
+from space_robot_strategy import SpaceRobotStrategy
+
+# Red is the cautious robot, blue heads for open space.
+Game(CautiousRobotStrategy(), SpaceRobotStrategy()).play()
@@ -0,0 +1,18 @@
+from typing import Tuple
+from core.grid import Direction, Grid
+
+
+class SnakeStrategy:
+
+  def get_move(
+      self,
+      grid: Grid,
+      position: Tuple[int, int],
+      last_direction: Direction,
+  ) -> Direction:
+    """Returns the direction to move in.
+
+    grid.is_occupied(x, y) says whether a square is taken by any snake (or
+    is outside the arena). The grid must not be changed.
+    """
+    return last_direction
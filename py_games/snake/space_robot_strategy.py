@@ -0,0 +1,29 @@
+from typing import Tuple
+from core import space
+from core.grid import Direction, Grid
+from snake_strategy import SnakeStrategy
+
+
+class SpaceRobotStrategy(SnakeStrategy):
+  """Heads for open space.
+
+  Of the moves that lead to the most room, it takes the first step towards
+  the nearest square that is as far from walls and snakes as possible.
+  """
+
+  def get_move(
+      self,
+      grid: Grid,
+      position: Tuple[int, int],
+      last_direction: Direction,
+  ) -> Direction:
+    moves = space.free_moves(grid, position)
+    if not moves:
+      return last_direction
+    # Try going straight first, so ties keep the snake on its course.
+    moves.sort(key=lambda direction: direction != last_direction)
+    sizes = [space.region_size(grid, position, direction) for direction in moves]
+    roomy = [direction for direction, size in zip(moves, sizes) if size == max(sizes)]
+    if len(roomy) == 1:
+      return roomy[0]
+    return space.towards_space(grid, position, roomy) or roomy[0]
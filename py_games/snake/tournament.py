@@ -0,0 +1,52 @@
+"""Ranks the snake strategies by playing thousands of games without a window.
+
+    python3 tournament.py --games 2000 --snakes-per-game 3
+
+Uses every core. Add your own strategies to ROSTER.
+"""
+
+import argparse
+import time
+
+from cautious_robot_strategy import CautiousRobotStrategy
+from core import tournament
+from snake_strategy import SnakeStrategy
+from space_robot_strategy import SpaceRobotStrategy
+
+ROSTER = {
+    "Straight": SnakeStrategy,  # never turns
+    "Cautious": CautiousRobotStrategy,
+    "Space": SpaceRobotStrategy,
+}
+
+
+def print_standings(result):
+  for name in result.standings():
+    print(f"  {name:<10} {result.ratings[name]:7.1f}  "
+          f"won {result.wins[name]} of {result.games[name]}")
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--games", type=int, default=1000)
+  parser.add_argument("--snakes-per-game", type=int, default=2)
+  parser.add_argument("--width", type=int, default=tournament.GRID_WIDTH)
+  parser.add_argument("--height", type=int, default=tournament.GRID_HEIGHT)
+  parser.add_argument("--processes", type=int, help="worker processes (default: one per core)")
+  parser.add_argument("--seed", type=int, default=0)
+  args = parser.parse_args()
+
+  def report(games, result):
+    print(f"After {games} games:")
+    print_standings(result)
+
+  start = time.perf_counter()
+  result = tournament.run(ROSTER, args.games, args.snakes_per_game, args.seed, args.width,
+                          args.height, processes=args.processes,
+                          report=report if args.games >= 1000 else None)
+  print(f"Final ratings after {args.games} games ({time.perf_counter() - start:.0f}s):")
+  print_standings(result)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,49 @@
+"""Times whole tetris games without a window, to measure changes to the engine.
+
+    python3 benchmark.py --games 10 --max-pieces 2000
+
+Reports pieces and lines per second, then plays one more game while
+tracing memory, which is slower, so it is kept out of the timings. Python
+does not count every allocation, so the memory report is the peak memory
+used during the game and the number of memory blocks it left allocated.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from core import simulator
+import heuristic_robot_strategy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--max-pieces", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    strategy = heuristic_robot_strategy.HeuristicRobotStrategy()
+
+    pieces = lines = 0
+    start = time.perf_counter()
+    for game in range(args.games):
+        result = simulator.play(strategy, seed=args.seed + game, max_pieces=args.max_pieces)
+        pieces += result.pieces
+        lines += result.lines
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} games, {pieces} pieces, {lines} lines in {elapsed:.2f}s")
+    print(f"{pieces / elapsed:,.0f} pieces/s, {lines / elapsed:,.0f} lines/s")
+
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = simulator.play(strategy, seed=args.seed, max_pieces=args.max_pieces)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+    print(f"One game of {result.pieces} pieces: {peak / 1024:.0f} KiB peak memory, "
+          f"{blocks} blocks left allocated")
+
+
+if __name__ == "__main__":
+    main()
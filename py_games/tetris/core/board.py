@@ -0,0 +1,133 @@
+"""Tetris rules without any display: a board made of row bitmasks.
+
+Each row of the board is an int whose bit x is set when column x is filled.
+A piece is stored the same way, as one bitmask per row, so checking whether
+it fits is one `&` per row of the piece, and a row is full when it equals
+full_row. Every piece's four rotations are worked out once, in ROTATIONS, so
+moving or turning a piece never builds anything new.
+
+Colors only matter for drawing, so they live separately, in Board.cells.
+"""
+
+import dataclasses
+
+GRID_WIDTH = 10
+GRID_HEIGHT = 20
+
+# --- Shapes ---
+SHAPES = [
+    [[1, 1, 1, 1]],  # I-piece
+    [[1, 0, 0], [1, 1, 1]],  # J-piece
+    [[0, 0, 1], [1, 1, 1]],  # L-piece
+    [[0, 1, 1], [1, 1, 0]],  # S-piece
+    [[1, 1, 0], [0, 1, 1]],  # Z-piece
+    [[1, 1], [1, 1]],       # O-piece
+    [[0, 1, 0], [1, 1, 1]]   # T-piece
+]
+# Board.cells holds the kind of piece (its index in SHAPES) plus one, or EMPTY.
+EMPTY = 0
+
+
+def rotate_shape(shape):
+    """Rotates a shape 90 degrees clockwise."""
+    rows = len(shape)
+    cols = len(shape[0])
+    return [[shape[j][i] for j in range(rows - 1, -1, -1)] for i in range(cols)]
+
+
+@dataclasses.dataclass(frozen=True)
+class Rotation:
+    """One rotation of a piece, with its top-left corner at (0, 0)."""
+    shape: tuple  # rows of 0s and 1s
+    masks: tuple  # one bitmask per row of the shape
+    cells: tuple  # (x, y) of every filled square
+    width: int
+    height: int
+
+    @classmethod
+    def from_shape(cls, shape):
+        cells = tuple((x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell)
+        masks = tuple(sum(cell << x for x, cell in enumerate(row)) for row in shape)
+        return cls(shape=tuple(map(tuple, shape)), masks=masks, cells=cells,
+                   width=len(shape[0]), height=len(shape))
+
+
+def _rotations(shape):
+    rotations = []
+    for _ in range(4):
+        rotations.append(Rotation.from_shape(shape))
+        shape = rotate_shape(shape)
+    return tuple(rotations)
+
+
+# ROTATIONS[kind][rotation], where kind is the piece's index in SHAPES.
+ROTATIONS = tuple(_rotations(shape) for shape in SHAPES)
+
+
+class Board:
+    """The locked squares of a Tetris game. Row 0 is the top."""
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rows = [0] * height
+        self.cells = bytearray(width * height)  # piece kind + 1, for drawing
+
+    def copy(self):
+        board = Board.__new__(Board)
+        board.width = self.width
+        board.height = self.height
+        board.full_row = self.full_row
+        board.rows = self.rows[:]
+        board.cells = self.cells[:]
+        return board
+
+    def fits(self, kind, rotation, x, y):
+        """Checks that a piece is inside the walls and does not overlap anything.
+
+        Squares above the top of the board are allowed, so new pieces can
+        come in from above.
+        """
+        shape = ROTATIONS[kind][rotation]
+        if x < 0 or x + shape.width > self.width or y + shape.height > self.height:
+            return False
+        rows = self.rows
+        for i, mask in enumerate(shape.masks):
+            if y + i >= 0 and rows[y + i] & (mask << x):
+                return False
+        return True
+
+    def lock(self, kind, rotation, x, y):
+        """Adds a piece to the board. Squares above the top are lost."""
+        shape = ROTATIONS[kind][rotation]
+        for i, mask in enumerate(shape.masks):
+            if y + i >= 0:
+                self.rows[y + i] |= mask << x
+        for cell_x, cell_y in shape.cells:
+            if y + cell_y >= 0:
+                self.cells[(y + cell_y) * self.width + x + cell_x] = kind + 1
+
+    def clear_rows(self):
+        """Clears completed rows and returns the number of rows cleared."""
+        full_row = self.full_row
+        if full_row not in self.rows:
+            return 0
+        width = self.width
+        kept = [y for y, row in enumerate(self.rows) if row != full_row]
+        rows_cleared = self.height - len(kept)
+        self.rows = [0] * rows_cleared + [self.rows[y] for y in kept]
+        cells = bytearray(width * rows_cleared)
+        for y in kept:
+            cells += self.cells[y * width:(y + 1) * width]
+        self.cells = cells
+        return rows_cleared
+
+    def is_game_over(self):
+        """The game is over once anything is locked in the top row."""
+        return self.rows[0] != 0
+
+    def kind_at(self, x, y):
+        """The kind of piece that filled a square, or None if it is empty."""
+        cell = self.cells[y * self.width + x]
+        return None if cell == EMPTY else cell - 1
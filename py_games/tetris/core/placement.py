@@ -0,0 +1,151 @@
+"""Finding every place a piece can be dropped, and scoring the boards that result.
+
+A piece dropped straight down from above the board stops as soon as one of
+its columns lands on the highest filled square in that column, so the
+landing row comes from the column tops instead of moving the piece down one
+row at a time. Rotations that look the same (the O piece's four, or the two
+of I, S and Z) are only tried once.
+"""
+
+import dataclasses
+from typing import Optional
+
+from core.board import ROTATIONS, Board
+
+
+@dataclasses.dataclass(frozen=True)
+class Placement:
+    """Where to drop a piece: its rotation, and the column of its left edge."""
+    rotation: int
+    x: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Features:
+    """What a board looks like after a piece is dropped."""
+    lines: int  # rows the piece cleared
+    aggregate_height: int  # sum of the heights of every column
+    holes: int  # empty squares with something above them
+    bumpiness: int  # sum of height differences between neighbouring columns
+
+
+@dataclasses.dataclass(frozen=True)
+class Weights:
+    """How much each feature is worth. Higher scores are better."""
+    lines: float = 0.760666
+    aggregate_height: float = -0.510066
+    holes: float = -0.35663
+    bumpiness: float = -0.184483
+
+    def score(self, features: Features) -> float:
+        return (self.lines * features.lines
+                + self.aggregate_height * features.aggregate_height
+                + self.holes * features.holes
+                + self.bumpiness * features.bumpiness)
+
+
+def _distinct_rotations(rotations):
+    seen = set()
+    distinct = []
+    for index, rotation in enumerate(rotations):
+        if rotation.masks not in seen:
+            seen.add(rotation.masks)
+            distinct.append(index)
+    return tuple(distinct)
+
+
+# DISTINCT_ROTATIONS[kind] lists the rotations of a piece that differ.
+DISTINCT_ROTATIONS = tuple(_distinct_rotations(rotations) for rotations in ROTATIONS)
+# BOTTOMS[kind][rotation][column] is the lowest filled row of that column of the piece.
+BOTTOMS = tuple(
+    tuple(tuple(max(y for x, y in rotation.cells if x == column)
+                for column in range(rotation.width))
+          for rotation in rotations)
+    for rotations in ROTATIONS)
+
+
+def column_tops(board: Board) -> list:
+    """The row of the highest filled square in each column (board.height if empty)."""
+    tops = [board.height] * board.width
+    covered = 0
+    for y, row in enumerate(board.rows):
+        new = row & ~covered
+        while new:
+            bit = new & -new
+            tops[bit.bit_length() - 1] = y
+            new ^= bit
+        covered |= row
+        if covered == board.full_row:
+            break
+    return tops
+
+
+def drop_y(tops: list, kind: int, rotation: int, x: int) -> int:
+    """The row a piece lands on when dropped straight down at column x."""
+    bottoms = BOTTOMS[kind][rotation]
+    return min(tops[x + column] - 1 - bottom for column, bottom in enumerate(bottoms))
+
+
+def placements(board: Board, kind: int):
+    """Every different way to drop a piece, as (Placement, landing row) pairs."""
+    tops = column_tops(board)
+    for rotation in DISTINCT_ROTATIONS[kind]:
+        for x in range(board.width - ROTATIONS[kind][rotation].width + 1):
+            yield Placement(rotation, x), drop_y(tops, kind, rotation, x)
+
+
+def drop(rows: list, full_row: int, kind: int, rotation: int, x: int, y: int):
+    """The rows of a board after a piece lands at (x, y) and full rows clear.
+
+    Returns (rows, lines cleared), or None if part of the piece is left
+    above the board or in the top row, which ends the game.
+    """
+    if y < 1:
+        return None
+    rows = rows[:]
+    for i, mask in enumerate(ROTATIONS[kind][rotation].masks):
+        rows[y + i] |= mask << x
+    if full_row in rows:
+        kept = [row for row in rows if row != full_row]
+        lines = len(rows) - len(kept)
+        rows = [0] * lines + kept
+    else:
+        lines = 0
+    return rows, lines
+
+
+def features(rows: list, width: int, lines: int = 0) -> Features:
+    """Measures a board, given as row bitmasks from the top."""
+    height = len(rows)
+    heights = [0] * width
+    covered = 0
+    holes = 0
+    aggregate_height = 0
+    for y, row in enumerate(rows):
+        new = row & ~covered
+        while new:
+            bit = new & -new
+            heights[bit.bit_length() - 1] = height - y
+            new ^= bit
+        covered |= row
+        # Every covered column counts once per row from its top down.
+        aggregate_height += covered.bit_count()
+        holes += (covered ^ row).bit_count()
+    bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    return Features(lines=lines, aggregate_height=aggregate_height, holes=holes,
+                    bumpiness=bumpiness)
+
+
+def best_placement(board: Board, kind: int, weights: Weights = Weights()) -> Optional[Placement]:
+    """The placement whose board scores best. None if every placement ends the game."""
+    best = None
+    best_score = None
+    for placement, y in placements(board, kind):
+        result = drop(board.rows, board.full_row, kind, placement.rotation, placement.x, y)
+        if result is None:
+            continue
+        rows, lines = result
+        score = weights.score(features(rows, board.width, lines))
+        if best_score is None or score > best_score:
+            best, best_score = placement, score
+    return best
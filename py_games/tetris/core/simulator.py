@@ -0,0 +1,72 @@
+"""Whole games of tetris without a window, as fast as the computer can go.
+
+Pieces come from a SevenBag, which deals one of each of the seven pieces in
+a shuffled order before starting a new bag, so the same seed always gives
+the same game. Each piece is dropped straight to where the strategy wants
+it; there is no falling and no clock.
+"""
+
+import dataclasses
+import random
+
+from core.board import SHAPES, Board
+from core.placement import column_tops, drop_y
+
+POINTS_PER_LINE = 100
+MAX_PIECES = 10000
+
+
+class SevenBag:
+    """Deals pieces (indexes into SHAPES) in shuffled bags of one of each."""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.bag = []
+
+    def next(self) -> int:
+        if not self.bag:
+            self.bag = list(range(len(SHAPES)))
+            self.rng.shuffle(self.bag)
+        return self.bag.pop()
+
+
+@dataclasses.dataclass
+class GameResult:
+    """How one game went."""
+    pieces: int = 0
+    lines: int = 0
+    score: int = 0
+    game_over: bool = False  # False if the game was stopped at max_pieces
+
+
+def play(strategy, seed=None, max_pieces=MAX_PIECES) -> GameResult:
+    """Plays one game with a TetrisStrategy and returns how it went.
+
+    The game ends when the strategy gives up (returns None, which in the
+    window would leave the piece to the keyboard), asks for a placement
+    that does not fit, or fills the top row.
+    """
+    board = Board()
+    bag = SevenBag(seed)
+    piece = bag.next()
+    next_piece = bag.next()
+    result = GameResult()
+    while result.pieces < max_pieces:
+        placement = strategy.get_placement(board, piece, next_piece)
+        if placement is None:
+            result.game_over = True
+            break
+        y = drop_y(column_tops(board), piece, placement.rotation, placement.x)
+        if not board.fits(piece, placement.rotation, placement.x, y):
+            result.game_over = True
+            break
+        board.lock(piece, placement.rotation, placement.x, y)
+        lines = board.clear_rows()
+        result.pieces += 1
+        result.lines += lines
+        result.score += lines * POINTS_PER_LINE
+        if board.is_game_over():
+            result.game_over = True
+            break
+        piece, next_piece = next_piece, bag.next()
+    return result
@@ -0,0 +1,311 @@
+import pygame
+from core.board import GRID_HEIGHT, GRID_WIDTH, ROTATIONS, Board
+from core.simulator import POINTS_PER_LINE, SevenBag
+
+# --- Constants ---
+SCREEN_WIDTH = 400
+SCREEN_HEIGHT = 600
+BLOCK_SIZE = 30
+GRID_LEFT = (SCREEN_WIDTH - GRID_WIDTH * BLOCK_SIZE) // 2
+GRID_TOP = SCREEN_HEIGHT - GRID_HEIGHT * BLOCK_SIZE
+FPS = 30  # Frames per second
+FALL_SPEED = 0.8  # Initial falling speed (seconds per block)
+FAST_FALL_SPEED = 0.08 #seconds per block when down key is pressed
+
+# --- Colors ---
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GRAY = (128, 128, 128)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+CYAN = (0, 255, 255)
+MAGENTA = (255, 0, 255)
+YELLOW = (255, 255, 0)
+ORANGE = (255, 165, 0)
+
+SHAPE_COLORS = [CYAN, BLUE, ORANGE, GREEN, RED, YELLOW, MAGENTA]
+
+
+class Piece:
+    """Represents a Tetris piece (Tetromino)."""
+
+    def __init__(self, x, y, kind, rotation=0):
+        self.x = x
+        self.y = y
+        self.kind = kind  # index into SHAPES
+        self.rotation = rotation  # Current rotation state
+
+    @property
+    def color(self):
+        return SHAPE_COLORS[self.kind]
+
+    @property
+    def shape(self):
+        return ROTATIONS[self.kind][self.rotation].shape
+
+    def rotate(self):
+        """Rotates the piece clockwise."""
+        self.rotation = (self.rotation + 1) % 4  # Cycle through rotations
+
+    def get_positions(self):
+        """Returns a list of (x, y) positions occupied by the piece."""
+        return [(self.x + x, self.y + y) for x, y in ROTATIONS[self.kind][self.rotation].cells]
+
+class Grid(Board):
+    """Represents the Tetris game grid.
+
+    The locked squares are drawn onto their own surface, which only changes
+    when a piece locks or rows clear, so each frame just copies it.
+    """
+
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.surface = pygame.Surface((width * BLOCK_SIZE, height * BLOCK_SIZE))
+        self.rect = self.surface.get_rect(topleft=(GRID_LEFT, GRID_TOP))
+        self.render()
+
+    def is_valid_position(self, piece, dx=0, dy=0, rotation=None):
+        """Checks if the piece, moved by (dx, dy) and turned to rotation, is valid
+        (within bounds and not colliding)."""
+        if rotation is None:
+            rotation = piece.rotation
+        return self.fits(piece.kind, rotation, piece.x + dx, piece.y + dy)
+
+    def lock_piece(self, piece):
+        """Locks the piece into the grid."""
+        self.lock(piece.kind, piece.rotation, piece.x, piece.y)
+        for x, y in piece.get_positions():
+            if y >= 0:
+                self._draw_square(x, y, piece.color)
+
+    def clear_rows(self):
+        """Clears completed rows and returns the number of rows cleared."""
+        rows_cleared = super().clear_rows()
+        if rows_cleared:
+            self.render()  # everything above the cleared rows moved down
+        return rows_cleared
+
+    def _draw_square(self, x, y, color):
+        square = (x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+        self.surface.fill(color, square)
+        # Draw grid lines
+        pygame.draw.rect(self.surface, GRAY, square, 1)
+
+    def render(self):
+        """Redraws every square onto the grid's surface."""
+        for y in range(self.height):
+            for x in range(self.width):
+                kind = self.kind_at(x, y)
+                self._draw_square(x, y, BLACK if kind is None else SHAPE_COLORS[kind])
+
+    def draw(self, surface, rect=None):
+        """Draws the grid on the given surface, or just the part of it under rect."""
+        if rect is None:
+            surface.blit(self.surface, self.rect)
+        else:
+            surface.blit(self.surface, rect, rect.move(-GRID_LEFT, -GRID_TOP))
+
+
+class TetrisGame:
+    """Manages the overall Tetris game logic."""
+
+    def __init__(self, strategy=None, seed=None):
+        """strategy is a TetrisStrategy. Without one, the keyboard plays.
+        A seed makes the pieces come in the same order every game."""
+        self.strategy = strategy
+        self.bag = SevenBag(seed)
+        pygame.init()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Tetris")
+        self.clock = pygame.time.Clock()
+        self.grid = Grid(GRID_WIDTH, GRID_HEIGHT)
+        self.current_piece = self.new_piece()
+        self.next_piece = self.new_piece()
+        self.fall_time = 0  # Accumulated time for falling
+        self.score = 0
+        self.game_over = False
+        self.font = pygame.font.Font(None, 36)  # Default font, size 36
+        self.target = self.get_placement()
+        self.redraw_all = True  # draw everything on the next frame
+        self.piece_rects = []  # where the falling piece was last drawn
+        self.render_score()
+
+
+    def new_piece(self):
+        """Creates the next piece from the bag."""
+        return Piece(GRID_WIDTH // 2 - 2, -2, self.bag.next())
+
+    def handle_input(self):
+        """Handles user input (key presses)."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.game_over = True
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    self.move_piece(-1, 0)  # Move left
+                if event.key == pygame.K_RIGHT:
+                    self.move_piece(1, 0)   # Move right
+                if event.key == pygame.K_DOWN:
+                  self.move_piece(0,1,fast_fall=True)   # Move down faster
+                if event.key == pygame.K_UP:
+                    self.rotate_piece()    # Rotate
+
+    def get_placement(self):
+        """Asks the strategy where the current piece should go."""
+        if self.strategy is None:
+            return None
+        return self.strategy.get_placement(self.grid, self.current_piece.kind,
+                                           self.next_piece.kind)
+
+    def steer_piece(self):
+        """Moves the current piece one step towards the strategy's placement:
+        first turning it, then sliding it over, then dropping it."""
+        if self.target is None:
+            return
+        if self.current_piece.rotation != self.target.rotation:
+            self.rotate_piece()
+        elif self.current_piece.x < self.target.x:
+            self.move_piece(1, 0)
+        elif self.current_piece.x > self.target.x:
+            self.move_piece(-1, 0)
+        else:
+            self.move_piece(0, 1, fast_fall=True)
+
+    def move_piece(self, dx, dy, fast_fall=False):
+        """Moves the current piece by (dx, dy) if the move is valid."""
+        if self.grid.is_valid_position(self.current_piece, dx, dy):
+            self.current_piece.x += dx
+            self.current_piece.y += dy
+            if fast_fall:
+                self.fall_time += FALL_SPEED-FAST_FALL_SPEED #makes piece fall more natural, accounts for extra time taken
+            return True # Moved Successfully
+        return False
+
+    def rotate_piece(self):
+      """Rotates the current piece, handling potential wall kicks."""
+      rotation = (self.current_piece.rotation + 1) % 4
+
+      # Wall kick attempts (check offsets if the rotation caused a collision)
+      offsets = [(0, 0), (-1, 0), (1, 0), (0, -1), (-1, -1), (1, -1), (0, 1), (-1, 1),(1,1)]
+
+      for offset_x, offset_y in offsets:
+          if self.grid.is_valid_position(self.current_piece, offset_x, offset_y, rotation):
+              self.current_piece.x += offset_x   # Apply the successful offset
+              self.current_piece.y += offset_y
+              self.current_piece.rotation = rotation
+              return  # Wall kick successful
+      # No valid rotation or wall kick found.  Piece stays as it was.
+
+
+    def update(self, dt):
+      """Updates the game state (piece falling, clearing rows, etc.)."""
+      if self.game_over:
+          return
+      
+      self.fall_time += dt
+      if self.fall_time >= FALL_SPEED:
+        self.fall_time = 0
+        if not self.move_piece(0, 1):  # Try to move down. If it fails...
+          self.grid.lock_piece(self.current_piece)
+          rows_cleared = self.grid.clear_rows()
+          self.score += rows_cleared * POINTS_PER_LINE
+          self.render_score()
+          self.current_piece = self.next_piece
+          self.next_piece = self.new_piece()
+          self.target = self.get_placement()
+          self.redraw_all = True
+          if not self.grid.is_valid_position(self.current_piece):
+            self.game_over = True
+
+      if self.grid.is_game_over():
+        self.game_over = True
+        self.redraw_all = True
+        
+
+    def draw(self):
+        """Draws the game elements (grid, pieces, score, etc.).
+
+        Between locks only the falling piece moves, so only the squares it
+        left and the squares it is in now are redrawn and sent to the display.
+        """
+        piece_rects = [
+            pygame.Rect(GRID_LEFT + x * BLOCK_SIZE, GRID_TOP + y * BLOCK_SIZE,
+                        BLOCK_SIZE, BLOCK_SIZE).clip(self.grid.rect)
+            for x, y in self.current_piece.get_positions()
+        ]
+        dirty_rects = self.piece_rects + piece_rects
+        # The score is drawn over the grid, so redraw it if the piece touches it.
+        redraw_score = self.redraw_all or self.score_rect.collidelist(dirty_rects) != -1
+        if self.redraw_all:
+            self.screen.fill(BLACK)
+            self.grid.draw(self.screen)
+        else:
+            for rect in self.piece_rects:
+                self.grid.draw(self.screen, rect)
+            if redraw_score:
+                self.screen.fill(BLACK, self.score_rect)
+                self.grid.draw(self.screen, self.score_rect.clip(self.grid.rect))
+                dirty_rects.append(self.score_rect)
+
+        # Draw current piece
+        for rect in piece_rects:
+            self.screen.fill(self.current_piece.color, rect)
+
+        # Draw score
+        if redraw_score:
+            self.screen.blit(self.score_text, self.score_rect)  # Position the score text
+
+        if self.redraw_all:
+            self.draw_next_piece()
+            if self.game_over:
+              game_over_text = self.font.render("Game Over", True, RED)
+              text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+              self.screen.blit(game_over_text, text_rect) # Center the text
+            pygame.display.flip()
+            self.redraw_all = False
+        else:
+            pygame.display.update(dirty_rects)
+        self.piece_rects = piece_rects
+
+    def render_score(self):
+        self.score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        self.score_rect = self.score_text.get_rect(topleft=(10, 10))
+
+    def draw_next_piece(self):
+        """Draws the next piece beside the grid."""
+        next_piece_x_offset = GRID_LEFT + GRID_WIDTH * BLOCK_SIZE + 50  # Example offset
+        next_piece_y_offset = GRID_TOP + 50
+        for i, row in enumerate(self.next_piece.shape):
+            for j, cell in enumerate(row):
+                if cell:
+                  pygame.draw.rect(
+                      self.screen,
+                      self.next_piece.color,
+                      (
+                          next_piece_x_offset + j * BLOCK_SIZE,
+                          next_piece_y_offset + i * BLOCK_SIZE,
+                          BLOCK_SIZE,
+                          BLOCK_SIZE,
+                      ),
+                      0,
+                  )
+
+
+    def run(self):
+        """Main game loop."""
+        running = True
+        while running:
+            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            self.handle_input()
+            self.steer_piece()
+            self.update(dt)
+            self.draw()
+
+            if self.game_over:
+                # Optional: Add a delay before closing, or a "Play Again" option
+                pygame.time.delay(2000)  # Wait 2 seconds
+                running = False
+
+
+        pygame.quit()
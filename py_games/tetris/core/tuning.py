@@ -0,0 +1,131 @@
+"""Tuning the heuristic robot's weights with the cross-entropy method.
+
+Each generation draws a population of weight vectors from a normal
+distribution, plays every one of them on the same seeded games (so luck with
+the pieces does not pick the winner), and moves the distribution to the
+best few. The best weights so far play each generation's games too, so
+they are only replaced by weights that beat them on the same games. The
+games are spread over a process pool, one worker per core.
+
+After every generation the state is saved to a JSON checkpoint, and
+tune() picks up from the checkpoint if it finds one.
+"""
+
+import dataclasses
+import json
+import math
+import multiprocessing
+import os
+import random
+import statistics
+from typing import Optional
+
+from core import simulator
+from core.placement import Weights
+from heuristic_robot_strategy import HeuristicRobotStrategy
+
+CHECKPOINT_PATH = "tuning_checkpoint.json"
+FEATURES = [field.name for field in dataclasses.fields(Weights)]
+
+
+@dataclasses.dataclass
+class Settings:
+    population: int = 32
+    elite: int = 8  # how many of the best candidates the distribution moves to
+    games: int = 4  # games per candidate, the same seeds for every candidate
+    max_pieces: int = 500
+    # Added to the spread each generation so it does not collapse too early.
+    extra_noise: float = 0.05
+    seed: int = 0
+
+
+@dataclasses.dataclass
+class TuningState:
+    settings: Settings
+    generation: int = 0
+    mean: list = dataclasses.field(default_factory=lambda: [0.0] * len(FEATURES))
+    std: list = dataclasses.field(default_factory=lambda: [0.5] * len(FEATURES))
+    best_weights: Optional[list] = None
+    best_score: Optional[float] = None  # mean lines cleared by best_weights, last generation
+    history: list = dataclasses.field(default_factory=list)  # best score per generation
+
+    def save(self, path):
+        # Write to a temporary file first, so an interruption cannot leave half a checkpoint.
+        with open(path + ".tmp", "w") as f:
+            json.dump(dataclasses.asdict(self), f, indent=1)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        data["settings"] = Settings(**data["settings"])
+        return cls(**data)
+
+
+def _normalize(vector):
+    """The score only depends on the direction of the weights, so keep them unit length."""
+    length = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / length for x in vector]
+
+
+def _play(job):
+    """Lines cleared by one weight vector in one seeded game. Runs in a worker."""
+    vector, seed, max_pieces = job
+    return simulator.play(HeuristicRobotStrategy(Weights(*vector)), seed, max_pieces).lines
+
+
+def run_generation(state: TuningState, pool) -> TuningState:
+    """Plays one generation and moves the distribution towards its best candidates."""
+    settings = state.settings
+    rng = random.Random(f"{settings.seed}-{state.generation}")
+    candidates = [_normalize([rng.gauss(mean, std) for mean, std in zip(state.mean, state.std)])
+                  for _ in range(settings.population)]
+    # Scores from earlier generations came from other games, so the best so
+    # far is played again alongside the new candidates. It goes first, so it
+    # keeps its place on a tie.
+    if state.best_weights is not None:
+        candidates.insert(0, state.best_weights)
+    first_seed = (settings.seed * 1_000_000 + state.generation) * settings.games
+    seeds = range(first_seed, first_seed + settings.games)
+    # One job per game rather than per candidate, so there is work for every core.
+    lines = pool.map(_play, [(candidate, seed, settings.max_pieces)
+                             for candidate in candidates for seed in seeds])
+    scores = [statistics.mean(lines[i:i + settings.games])
+              for i in range(0, len(lines), settings.games)]
+
+    ranked = sorted(zip(scores, candidates), key=lambda pair: pair[0], reverse=True)
+    elite = [candidate for _, candidate in ranked[:settings.elite]]
+    best_score, best = ranked[0]
+    state.mean = [statistics.mean(column) for column in zip(*elite)]
+    state.std = [statistics.pstdev(column) + settings.extra_noise for column in zip(*elite)]
+    state.best_weights, state.best_score = best, best_score
+    state.history.append(best_score)
+    state.generation += 1
+    return state
+
+
+def tune(generations: int, settings: Settings = Settings(),
+         path: Optional[str] = CHECKPOINT_PATH, processes: Optional[int] = None,
+         report=print) -> TuningState:
+    """Runs the search until the checkpoint has reached the given number of generations.
+
+    When resuming, the settings saved in the checkpoint are used.
+    """
+    if path and os.path.exists(path):
+        state = TuningState.load(path)
+        report(f"Resuming from generation {state.generation} in {path}")
+    else:
+        state = TuningState(settings)
+    with multiprocessing.Pool(processes or os.cpu_count()) as pool:
+        while state.generation < generations:
+            run_generation(state, pool)
+            if path:
+                state.save(path)
+            report(f"Generation {state.generation}: best {state.history[-1]:.1f} lines, "
+                   f"mean weights {format_weights(state.mean)}")
+    return state
+
+
+def format_weights(vector) -> str:
+    return ", ".join(f"{name}={value:.3f}" for name, value in zip(FEATURES, vector))
@@ -0,0 +1,18 @@
+from typing import Optional
+from core.board import Board
+from core.placement import Placement, Weights, best_placement
+from tetris_strategy import TetrisStrategy
+
+
+class HeuristicRobotStrategy(TetrisStrategy):
+  """Tries every rotation in every column and keeps the best looking board.
+
+  A board is scored on the lines cleared, the total height of the columns,
+  the holes under filled squares, and how bumpy the top is.
+  """
+
+  def __init__(self, weights: Weights = Weights()):
+    self.weights = weights
+
+  def get_placement(self, board: Board, piece: int, next_piece: int) -> Optional[Placement]:
+    return best_placement(board, piece, self.weights)
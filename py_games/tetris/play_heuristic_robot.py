@@ -0,0 +1,6 @@
+from core.tetris import TetrisGame
+import heuristic_robot_strategy
+
+strategy = heuristic_robot_strategy.HeuristicRobotStrategy()
+game = TetrisGame(strategy)
+game.run()
@@ -0,0 +1,4 @@
+from core.tetris import TetrisGame
+
+game = TetrisGame()
+game.run()
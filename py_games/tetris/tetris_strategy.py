@@ -0,0 +1,18 @@
+from typing import Optional
+from core.board import Board
+from core.placement import Placement
+
+
+class TetrisStrategy:
+  """A tetris player."""
+
+  def get_placement(self, board: Board, piece: int, next_piece: int) -> Optional[Placement]:
+    """Where to drop the falling piece.
+
+    piece and next_piece are indexes into SHAPES. The board must not be
+    changed. Return None to leave the piece to the keyboard. Without a
+    window (core/simulator.py) there is no keyboard, so None gives up and
+    ends the game there, as when every placement loses; this default
+    strategy ends a simulated game on its first piece.
+    """
+    return None
@@ -0,0 +1,38 @@
+"""Searches for better weights for the heuristic robot.
+
+    python3 tune_weights.py --generations 20
+
+Uses every core. Stop it at any time; running it again carries on from
+tuning_checkpoint.json. Delete that file to start over.
+"""
+
+import argparse
+import time
+
+from core import tuning
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--generations", type=int, default=20,
+                        help="stop once the checkpoint reaches this many generations")
+    parser.add_argument("--population", type=int, default=tuning.Settings.population)
+    parser.add_argument("--games", type=int, default=tuning.Settings.games,
+                        help="games per candidate")
+    parser.add_argument("--max-pieces", type=int, default=tuning.Settings.max_pieces)
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default=tuning.CHECKPOINT_PATH)
+    args = parser.parse_args()
+
+    settings = tuning.Settings(population=args.population, elite=max(1, args.population // 4),
+                               games=args.games, max_pieces=args.max_pieces, seed=args.seed)
+    start = time.perf_counter()
+    state = tuning.tune(args.generations, settings, args.checkpoint, args.processes)
+    print(f"Done in {time.perf_counter() - start:.0f}s. Best weights "
+          f"({state.best_score:.1f} lines in {state.settings.max_pieces} pieces):")
+    print(f"    Weights({tuning.format_weights(state.best_weights)})")
+
+
+if __name__ == "__main__":
+    main()